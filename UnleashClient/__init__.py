@@ -1,32 +1,49 @@
 # pylint: disable=invalid-name
+import itertools
+import os
 import random
 import string
 import uuid
 import warnings
+import weakref
 from datetime import datetime, timezone
-from typing import Callable, Optional
-
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.job import Job
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.schedulers.base import BaseScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-from UnleashClient.api import register_client
+from UnleashClient.api import create_session, register_client
 from UnleashClient.constants import (
+    BATCH_CHUNK_SIZE,
     DISABLED_VARIATION,
     ETAG,
     METRIC_LAST_SENT_TIME,
     REQUEST_RETRIES,
     REQUEST_TIMEOUT,
+    UNKNOWN_FEATURES_MAX_SIZE,
+    UNKNOWN_FEATURES_TTL,
 )
+from UnleashClient.context import UnleashContext
 from UnleashClient.events import UnleashEvent, UnleashEventType
 from UnleashClient.features import Feature
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.features.unknown import UnknownFeatures
 from UnleashClient.loader import load_features
 from UnleashClient.periodic_tasks import (
     aggregate_and_send_metrics,
     fetch_and_load_features,
+    load_shared_snapshot,
 )
+from UnleashClient.scheduler import IntervalJob, IntervalScheduler
+from UnleashClient.snapshot import SharedSnapshot
 from UnleashClient.strategies import (
     ApplicationHostname,
     Default,
@@ -42,8 +59,16 @@ from .cache import BaseCache, FileCache
 from .deprecation_warnings import strategy_v2xx_deprecation_check
 from .utils import LOGGER, InstanceAllowType, InstanceCounter
 
+# APScheduler is only imported when used, see builtin_scheduler.
+if TYPE_CHECKING:
+    from apscheduler.job import Job
+    from apscheduler.schedulers.base import BaseScheduler
+
 INSTANCES = InstanceCounter()
 
+# Clients to reinitialize in forked child processes.
+_CLIENTS: "weakref.WeakSet[UnleashClient]" = weakref.WeakSet()
+
 
 # pylint: disable=dangerous-default-value
 class UnleashClient:
@@ -72,9 +97,13 @@ class UnleashClient:
     :param scheduler_executor: Name of APSCheduler executor to use if using a custom scheduler.
     :param multiple_instance_mode: Determines how multiple instances being instantiated is handled by the SDK, when set to InstanceAllowType.BLOCK, the client constructor will fail when more than one instance is detected, when set to InstanceAllowType.WARN, multiple instances will be allowed but log a warning, when set to InstanceAllowType.SILENTLY_ALLOW, no warning or failure will be raised when instantiating multiple instances of the client. Defaults to InstanceAllowType.WARN
     :param event_callback: Function to call if impression events are enabled.  WARNING: Depending on your event library, this may have performance implications!
+    :param unknown_features_max_size: Maximum number of unknown features tracked for metrics, optional & defaults to 1000.  The least recently used one is dropped when full.
+    :param unknown_features_ttl: Seconds an unknown feature is tracked for metrics after it was last checked, optional & defaults to 3600.  When None, unknown features are only dropped when full.
+    :param shared_snapshot: Path of a snapshot file shared by the processes on this host, optional.  A client initialized with `fetch_toggles=True` publishes the features it fetches to it, clients initialized with `fetch_toggles=False` load features from it whenever a new one is published, instead of from the cache.
+    :param builtin_scheduler: Runs the refresh and metrics jobs on a lightweight built-in scheduler (a single thread, without importing APScheduler) instead of an APScheduler BackgroundScheduler, optional & defaults to false.  Can't be combined with scheduler.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         app_name: str,
@@ -95,10 +124,14 @@ class UnleashClient:
         project_name: Optional[str] = None,
         verbose_log_level: int = 30,
         cache: Optional[BaseCache] = None,
-        scheduler: Optional[BaseScheduler] = None,
+        scheduler: Optional["BaseScheduler"] = None,
         scheduler_executor: Optional[str] = None,
         multiple_instance_mode: InstanceAllowType = InstanceAllowType.WARN,
         event_callback: Optional[Callable[[UnleashEvent], None]] = None,
+        unknown_features_max_size: int = UNKNOWN_FEATURES_MAX_SIZE,
+        unknown_features_ttl: Optional[int] = UNKNOWN_FEATURES_TTL,
+        shared_snapshot: Optional[str] = None,
+        builtin_scheduler: bool = False,
     ) -> None:
         custom_headers = custom_headers or {}
         custom_options = custom_options or {}
@@ -109,6 +142,7 @@ class UnleashClient:
         self.unleash_app_name = app_name
         self.unleash_environment = environment
         self.unleash_instance_id = instance_id
+        self._configured_instance_id = instance_id
         self.unleash_refresh_interval = refresh_interval
         self.unleash_request_timeout = request_timeout
         self.unleash_request_retries = request_retries
@@ -134,9 +168,17 @@ class UnleashClient:
         self._do_instance_check(multiple_instance_mode)
 
         # Class objects
-        self.features: dict = {}
-        self.fl_job: Job = None
-        self.metric_job: Job = None
+        self.features = FeatureStore()
+        self._unknown_features = UnknownFeatures(
+            unknown_features_max_size, unknown_features_ttl
+        )
+        self.fl_job: Union["Job", IntervalJob] = None
+        # Pooled connections to the Unleash server, shared by all API calls.
+        self.session = create_session(self.unleash_request_retries)
+        self.metric_job: Union["Job", IntervalJob] = None
+        self.shared_snapshot = (
+            SharedSnapshot(shared_snapshot) if shared_snapshot is not None else None
+        )
 
         self.cache = cache or FileCache(
             self.unleash_app_name, directory=cache_directory
@@ -145,27 +187,7 @@ class UnleashClient:
         self.unleash_bootstrapped = self.cache.bootstrapped
 
         # Scheduler bootstrapping
-        # - Figure out the Unleash executor name.
-        if scheduler and scheduler_executor:
-            self.unleash_executor_name = scheduler_executor
-        elif scheduler and not scheduler_executor:
-            raise ValueError(
-                "If using a custom scheduler, you must specify a executor."
-            )
-        else:
-            if not scheduler and scheduler_executor:
-                LOGGER.warning(
-                    "scheduler_executor should only be used with a custom scheduler."
-                )
-
-            self.unleash_executor_name = f"unleash_executor_{''.join(random.choices(string.ascii_uppercase + string.digits, k=6))}"
-
-        # Set up the scheduler.
-        if scheduler:
-            self.unleash_scheduler = scheduler
-        else:
-            executors = {self.unleash_executor_name: ThreadPoolExecutor()}
-            self.unleash_scheduler = BackgroundScheduler(executors=executors)
+        self._setup_scheduler(scheduler, scheduler_executor, builtin_scheduler)
 
         # Mappings
         default_strategy_mapping = {
@@ -188,6 +210,8 @@ class UnleashClient:
 
         # Client status
         self.is_initialized = False
+        self._fetch_toggles = True
+        _CLIENTS.add(self)
 
         # Bootstrapping
         if self.unleash_bootstrapped:
@@ -227,18 +251,6 @@ class UnleashClient:
         if not self.is_initialized:
             # pylint: disable=no-else-raise
             try:
-                # Setup
-                metrics_args = {
-                    "url": self.unleash_url,
-                    "app_name": self.unleash_app_name,
-                    "instance_id": self.unleash_instance_id,
-                    "custom_headers": self.unleash_custom_headers,
-                    "custom_options": self.unleash_custom_options,
-                    "features": self.features,
-                    "cache": self.cache,
-                    "request_timeout": self.unleash_request_timeout,
-                }
-
                 # Register app
                 if not self.unleash_disable_registration:
                     register_client(
@@ -250,54 +262,15 @@ class UnleashClient:
                         self.unleash_custom_options,
                         self.strategy_mapping,
                         self.unleash_request_timeout,
+                        self.session,
                     )
 
-                if fetch_toggles:
-                    job_args = {
-                        "url": self.unleash_url,
-                        "app_name": self.unleash_app_name,
-                        "instance_id": self.unleash_instance_id,
-                        "custom_headers": self.unleash_custom_headers,
-                        "custom_options": self.unleash_custom_options,
-                        "cache": self.cache,
-                        "features": self.features,
-                        "strategy_mapping": self.strategy_mapping,
-                        "request_timeout": self.unleash_request_timeout,
-                        "request_retries": self.unleash_request_retries,
-                        "project": self.unleash_project_name,
-                    }
-                    job_func: Callable = fetch_and_load_features
-                else:
-                    job_args = {
-                        "cache": self.cache,
-                        "feature_toggles": self.features,
-                        "strategy_mapping": self.strategy_mapping,
-                    }
-                    job_func = load_features
-
-                job_func(**job_args)  # type: ignore
+                self._fetch_toggles = fetch_toggles
+                job_func, job_args = self._refresh_job()
+                job_func(**job_args)
                 # Start periodic jobs
                 self.unleash_scheduler.start()
-                self.fl_job = self.unleash_scheduler.add_job(
-                    job_func,
-                    trigger=IntervalTrigger(
-                        seconds=int(self.unleash_refresh_interval),
-                        jitter=self.unleash_refresh_jitter,
-                    ),
-                    executor=self.unleash_executor_name,
-                    kwargs=job_args,
-                )
-
-                if not self.unleash_disable_metrics:
-                    self.metric_job = self.unleash_scheduler.add_job(
-                        aggregate_and_send_metrics,
-                        trigger=IntervalTrigger(
-                            seconds=int(self.unleash_metrics_interval),
-                            jitter=self.unleash_metrics_jitter,
-                        ),
-                        executor=self.unleash_executor_name,
-                        kwargs=metrics_args,
-                    )
+                self._schedule_jobs(job_func, job_args)
             except Exception as excep:
                 # Log exceptions during initialization.  is_initialized will remain false.
                 LOGGER.warning(
@@ -312,9 +285,157 @@ class UnleashClient:
                 "Attempted to initialize an Unleash Client instance that has already been initialized."
             )
 
+    def _refresh_job(self) -> Tuple[Callable, dict]:
+        if self._fetch_toggles:
+            job_args = {
+                "url": self.unleash_url,
+                "app_name": self.unleash_app_name,
+                "instance_id": self.unleash_instance_id,
+                "custom_headers": self.unleash_custom_headers,
+                "custom_options": self.unleash_custom_options,
+                "cache": self.cache,
+                "features": self.features,
+                "strategy_mapping": self.strategy_mapping,
+                "request_timeout": self.unleash_request_timeout,
+                "request_retries": self.unleash_request_retries,
+                "project": self.unleash_project_name,
+                "session": self.session,
+                "shared_snapshot": self.shared_snapshot,
+            }
+            return fetch_and_load_features, job_args
+
+        if self.shared_snapshot is not None:
+            job_args = {
+                "shared_snapshot": self.shared_snapshot,
+                "cache": self.cache,
+                "feature_toggles": self.features,
+                "strategy_mapping": self.strategy_mapping,
+            }
+            return load_shared_snapshot, job_args
+
+        job_args = {
+            "cache": self.cache,
+            "feature_toggles": self.features,
+            "strategy_mapping": self.strategy_mapping,
+        }
+        return load_features, job_args
+
+    def _setup_scheduler(
+        self,
+        scheduler: Optional["BaseScheduler"],
+        scheduler_executor: Optional[str],
+        builtin_scheduler: bool,
+    ) -> None:
+        # Figure out the Unleash executor name.
+        if scheduler and scheduler_executor:
+            self.unleash_executor_name = scheduler_executor
+        elif scheduler and not scheduler_executor:
+            raise ValueError(
+                "If using a custom scheduler, you must specify a executor."
+            )
+        else:
+            if not scheduler and scheduler_executor:
+                LOGGER.warning(
+                    "scheduler_executor should only be used with a custom scheduler."
+                )
+
+            self.unleash_executor_name = f"unleash_executor_{''.join(random.choices(string.ascii_uppercase + string.digits, k=6))}"
+
+        # Set up the scheduler.
+        if scheduler and builtin_scheduler:
+            raise ValueError("A custom scheduler can't be used with builtin_scheduler.")
+        self._custom_scheduler = scheduler is not None
+        self._builtin_scheduler = builtin_scheduler
+        self.unleash_scheduler = scheduler or self._create_scheduler()
+
+    def _create_scheduler(self) -> Union["BaseScheduler", IntervalScheduler]:
+        if self._builtin_scheduler:
+            return IntervalScheduler()
+
+        # pylint: disable=import-outside-toplevel
+        from apscheduler.executors.pool import ThreadPoolExecutor
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        executors = {self.unleash_executor_name: ThreadPoolExecutor()}
+        return BackgroundScheduler(executors=executors)
+
+    def _add_job(
+        self, func: Callable, seconds: int, jitter: Optional[int], kwargs: dict
+    ) -> Union["Job", IntervalJob]:
+        if isinstance(self.unleash_scheduler, IntervalScheduler):
+            return self.unleash_scheduler.add_job(func, seconds, jitter, kwargs)
+
+        # pylint: disable=import-outside-toplevel
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        return self.unleash_scheduler.add_job(
+            func,
+            trigger=IntervalTrigger(seconds=seconds, jitter=jitter),
+            executor=self.unleash_executor_name,
+            kwargs=kwargs,
+        )
+
+    def _schedule_jobs(self, job_func: Callable, job_args: dict) -> None:
+        self.fl_job = self._add_job(
+            job_func,
+            int(self.unleash_refresh_interval),
+            self.unleash_refresh_jitter,
+            job_args,
+        )
+
+        if not self.unleash_disable_metrics:
+            metrics_args = {
+                "url": self.unleash_url,
+                "app_name": self.unleash_app_name,
+                "instance_id": self.unleash_instance_id,
+                "custom_headers": self.unleash_custom_headers,
+                "custom_options": self.unleash_custom_options,
+                "features": self.features,
+                "cache": self.cache,
+                "request_timeout": self.unleash_request_timeout,
+                "unknown_features": self._unknown_features,
+                "session": self.session,
+            }
+            self.metric_job = self._add_job(
+                aggregate_and_send_metrics,
+                int(self.unleash_metrics_interval),
+                self.unleash_metrics_jitter,
+                metrics_args,
+            )
+
+    def _reinitialize_after_fork(self) -> None:
+        """
+        Makes the client usable in a child process forked after it was created.
+
+        The child keeps the loaded features (shared copy-on-write with the parent), but none of the parent's threads:
+        metrics counts are dropped so they aren't reported twice, the child gets its own instance id and connections,
+        and the refresh and metrics jobs are restarted on a new scheduler.  The child doesn't register again.
+        """
+        for feature in self.features.loaded_values():
+            feature.stats.clear()
+        self._unknown_features = UnknownFeatures(
+            self._unknown_features.max_size, self._unknown_features.ttl
+        )
+        self.unleash_instance_id = f"{self._configured_instance_id}-{os.getpid()}"
+        # The parent's pooled connections must not be shared.
+        self.session = create_session(self.unleash_request_retries)
+
+        if not self.is_initialized:
+            return
+        if self._custom_scheduler:
+            LOGGER.warning(
+                "Unleash client jobs can't be restarted in a forked process with a custom scheduler, "
+                "create the client after forking instead."
+            )
+            return
+
+        self.unleash_scheduler = self._create_scheduler()
+        self.unleash_scheduler.start()
+        self._schedule_jobs(*self._refresh_job())
+
     def destroy(self) -> None:
         """
-        Gracefully shuts down the Unleash client by stopping jobs, stopping the scheduler, and deleting the cache.
+        Gracefully shuts down the Unleash client by stopping jobs, stopping the scheduler, closing connections and deleting the cache.
 
         You shouldn't need this too much!
         """
@@ -322,14 +443,18 @@ class UnleashClient:
         if self.metric_job:
             self.metric_job.remove()
         self.unleash_scheduler.shutdown()
+        _CLIENTS.discard(self)
+        self.session.close()
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.close()
         self.cache.destroy()
 
     @staticmethod
     def _get_fallback_value(
-        fallback_function: Callable, feature_name: str, context: dict
+        fallback_function: Callable, feature_name: str, context: Mapping
     ) -> bool:
         if fallback_function:
-            fallback_value = fallback_function(feature_name, context)
+            fallback_value = fallback_function(feature_name, dict(context))
         else:
             fallback_value = False
 
@@ -339,7 +464,7 @@ class UnleashClient:
     def is_enabled(
         self,
         feature_name: str,
-        context: Optional[dict] = None,
+        context: Optional[Union[dict, UnleashContext]] = None,
         fallback_function: Callable = None,
     ) -> bool:
         """
@@ -350,35 +475,45 @@ class UnleashClient:
         * If client hasn't been initialized yet or an error occurs, flat will default to false.
 
         :param feature_name: Name of the feature
-        :param context: Dictionary with context (e.g. IPs, email) for feature toggle.
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or an :class:`UnleashContext`.
         :param fallback_function: Allows users to provide a custom function to set default value.
         :return: Feature flag result
         """
-        context = context or {}
-
-        base_context = self.unleash_static_context.copy()
-        # Update context with static values and allow context to override environment
-        base_context.update(context)
-        context = base_context
+        # Merge in static values and allow context to override environment.  Strategies write to the merged dict,
+        # so neither the caller's context nor the static context is changed.
+        if isinstance(context, UnleashContext):
+            context = context.bind_static_context(self.unleash_static_context)
+        else:
+            context = {**self.unleash_static_context, **(context or {})}
 
         if self.unleash_bootstrapped or self.is_initialized:
+            # The feature and its dependencies are all read from the same snapshot.
+            features = self.features.snapshot.features
+            feature = features.get(feature_name)
+            if feature is None:
+                LOGGER.log(
+                    self.unleash_verbose_log_level,
+                    "Returning default value for unknown feature: %s",
+                    feature_name,
+                )
+                # Use the placeholder's is_enabled method to count the call
+                self._get_unknown_feature(feature_name).is_enabled(cast(dict, context))
+
+                return self._get_fallback_value(
+                    fallback_function, feature_name, context
+                )
+
             try:
-                feature = self.features[feature_name]
                 feature_check = feature.is_enabled(
-                    context
-                ) and self._dependencies_are_satisfied(feature_name, context)
-
-                if feature.only_for_metrics:
-                    return self._get_fallback_value(
-                        fallback_function, feature_name, context
-                    )
+                    cast(dict, context)
+                ) and self._dependencies_are_satisfied(feature, context, features)
 
                 try:
                     if self.unleash_event_callback and feature.impression_data:
                         event = UnleashEvent(
                             event_type=UnleashEventType.FEATURE_FLAG,
                             event_id=uuid.uuid4(),
-                            context=context,
+                            context=dict(context),
                             enabled=feature_check,
                             feature_name=feature_name,
                         )
@@ -404,12 +539,6 @@ class UnleashClient:
                     "Error checking feature flag: %s",
                     excep,
                 )
-                # The feature doesn't exist, so create it to track metrics
-                new_feature = Feature.metrics_only_feature(feature_name)
-                self.features[feature_name] = new_feature
-
-                # Use the feature's is_enabled method to count the call
-                new_feature.is_enabled(context)
 
                 return self._get_fallback_value(
                     fallback_function, feature_name, context
@@ -429,7 +558,64 @@ class UnleashClient:
             return self._get_fallback_value(fallback_function, feature_name, context)
 
     # pylint: disable=broad-except
-    def get_variant(self, feature_name: str, context: Optional[dict] = None) -> dict:
+    def is_enabled_batch(
+        self,
+        feature_name: str,
+        contexts: Iterable[dict],
+        fallback_function: Callable = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> Iterator[bool]:
+        """
+        Checks if a feature toggle is enabled for many contexts, e.g. in offline jobs.
+
+        Notes:
+
+        * Same results and metrics as calling :meth:`is_enabled` for each context.
+        * Contexts are consumed and evaluated ``chunk_size`` at a time, and results are yielded in the same order.
+
+        :param feature_name: Name of the feature
+        :param contexts: Iterable of context dictionaries.
+        :param fallback_function: Allows users to provide a custom function to set default value.
+        :param chunk_size: Number of contexts evaluated together.
+        :return: Feature flag results
+        """
+        feature = None
+        features = self.features.snapshot.features
+        if self.unleash_bootstrapped or self.is_initialized:
+            feature = features.get(feature_name)
+
+        if feature is None or (self.unleash_event_callback and feature.impression_data):
+            for context in contexts:
+                yield self.is_enabled(feature_name, context, fallback_function)
+            return
+
+        contexts = iter(contexts)
+        while True:
+            chunk = [
+                {**self.unleash_static_context, **(context or {})}
+                for context in itertools.islice(contexts, chunk_size)
+            ]
+            if not chunk:
+                return
+
+            results = feature.evaluate_batch(chunk)
+            if feature.dependencies:
+                results = [
+                    result
+                    and self._dependencies_are_satisfied_safe(
+                        feature, context, features
+                    )
+                    for result, context in zip(results, chunk)
+                ]
+
+            yield from results
+
+    # pylint: disable=broad-except
+    def get_variant(
+        self,
+        feature_name: str,
+        context: Optional[Union[dict, UnleashContext]] = None,
+    ) -> dict:
         """
         Checks if a feature toggle is enabled.  If so, return variant.
 
@@ -438,27 +624,45 @@ class UnleashClient:
         * If client hasn't been initialized yet or an error occurs, flat will default to false.
 
         :param feature_name: Name of the feature
-        :param context: Dictionary with context (e.g. IPs, email) for feature toggle.
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or an :class:`UnleashContext`.
         :return: Variant and feature flag status.
         """
-        context = context or {}
-        context.update(self.unleash_static_context)
+        # Merge in static values, which take precedence over a dict context.  Strategies write to the merged dict,
+        # so neither the static context nor the caller's context is changed.
+        if isinstance(context, UnleashContext):
+            context = context.bind_static_context(
+                self.unleash_static_context, static_first=True
+            )
+        else:
+            context = {**(context or {}), **self.unleash_static_context}
 
         if self.unleash_bootstrapped or self.is_initialized:
-            try:
-                feature = self.features[feature_name]
+            # The feature and its dependencies are all read from the same snapshot.
+            features = self.features.snapshot.features
+            feature = features.get(feature_name)
+            if feature is None:
+                LOGGER.log(
+                    self.unleash_verbose_log_level,
+                    "Returning default flag/variation for unknown feature: %s",
+                    feature_name,
+                )
+                # Use the placeholder's get_variant method to count the call
+                return self._get_unknown_feature(feature_name).get_variant(
+                    cast(dict, context)
+                )
 
-                if not self._dependencies_are_satisfied(feature_name, context):
+            try:
+                if not self._dependencies_are_satisfied(feature, context, features):
                     return DISABLED_VARIATION
 
-                variant_check = feature.get_variant(context)
+                variant_check = feature.get_variant(cast(dict, context))
 
                 if self.unleash_event_callback and feature.impression_data:
                     try:
                         event = UnleashEvent(
                             event_type=UnleashEventType.VARIANT,
                             event_id=uuid.uuid4(),
-                            context=context,
+                            context=dict(context),
                             enabled=variant_check["enabled"],
                             feature_name=feature_name,
                             variant=variant_check["name"],
@@ -486,13 +690,7 @@ class UnleashClient:
                     excep,
                 )
 
-                # The feature doesn't exist, so create it to track metrics
-                new_feature = Feature.metrics_only_feature(feature_name)
-                self.features[feature_name] = new_feature
-
-                # Use the feature's get_variant method to count the call
-                variant_check = new_feature.get_variant(context)
-                return variant_check
+                return DISABLED_VARIATION
         else:
             LOGGER.log(
                 self.unleash_verbose_log_level,
@@ -506,14 +704,140 @@ class UnleashClient:
             )
             return DISABLED_VARIATION
 
-    def _is_dependency_satified(self, dependency: dict, context: dict) -> bool:
+    def evaluate_all(
+        self, context: Optional[Union[dict, UnleashContext]] = None
+    ) -> Dict[str, dict]:
+        """
+        Evaluates every feature toggle for a context in one call.
+
+        Notes:
+
+        * Each feature is evaluated once and counted in metrics like a :meth:`get_variant` call.
+        * The static ``appName``/``environment`` values override the context, as in :meth:`get_variant`.
+        * If client hasn't been initialized yet, an empty mapping is returned.
+
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or an :class:`UnleashContext`.
+        :return: Mapping of feature name to variant and feature flag status.
+        """
+        return self._evaluate_features(None, context)
+
+    def evaluate_many(
+        self,
+        feature_names: Iterable[str],
+        context: Optional[Union[dict, UnleashContext]] = None,
+    ) -> Dict[str, dict]:
+        """
+        Evaluates the given feature toggles for a context in one call.
+
+        Notes:
+
+        * Same as :meth:`evaluate_all`, but unknown features are returned as disabled and tracked for metrics.
+
+        :param feature_names: Names of the features
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or an :class:`UnleashContext`.
+        :return: Mapping of feature name to variant and feature flag status.
+        """
+        return self._evaluate_features(feature_names, context)
+
+    def _evaluate_features(
+        self,
+        feature_names: Optional[Iterable[str]],
+        context: Optional[Union[dict, UnleashContext]],
+    ) -> Dict[str, dict]:
+        if not (self.unleash_bootstrapped or self.is_initialized):
+            LOGGER.log(
+                self.unleash_verbose_log_level,
+                "Attempted to evaluate feature flags, but client wasn't initialized!",
+            )
+            return {name: DISABLED_VARIATION for name in feature_names or ()}
+
+        # A single context shares identifier lookups and stickiness hashes across features.
+        if not isinstance(context, UnleashContext):
+            context = UnleashContext.from_dict(context or {})
+
+        # Every feature and dependency is read from the same snapshot.
+        features = self.features.snapshot.features
+        if feature_names is None:
+            evaluated = list(features.values())
+        else:
+            evaluated = []
+            for feature_name in feature_names:
+                feature = features.get(feature_name)
+                if feature is None:
+                    feature = self._get_unknown_feature(feature_name)
+                evaluated.append(feature)
+
+        # Each feature gets its own view, like a get_variant call, so writes by strategies don't carry over.
+        return {
+            feature.name: self._evaluate_feature(
+                feature,
+                cast(
+                    dict,
+                    context.bind_static_context(
+                        self.unleash_static_context, static_first=True
+                    ),
+                ),
+                features,
+            )
+            for feature in evaluated
+        }
+
+    def _evaluate_feature(
+        self, feature: Feature, context: dict, features: Mapping[str, Feature]
+    ) -> dict:
+        try:
+            if not feature.only_for_metrics and not self._dependencies_are_satisfied(
+                feature, context, features
+            ):
+                return DISABLED_VARIATION
+
+            variant_check = feature.get_variant(context)
+        except Exception as excep:
+            LOGGER.log(
+                self.unleash_verbose_log_level,
+                "Error checking feature flag variant %s: %s",
+                feature.name,
+                excep,
+            )
+            return DISABLED_VARIATION
+
+        if self.unleash_event_callback and feature.impression_data:
+            try:
+                event = UnleashEvent(
+                    event_type=UnleashEventType.VARIANT,
+                    event_id=uuid.uuid4(),
+                    context=dict(context),
+                    enabled=variant_check["enabled"],
+                    feature_name=feature.name,
+                    variant=variant_check["name"],
+                )
+
+                self.unleash_event_callback(event)
+            except Exception as excep:
+                LOGGER.log(
+                    self.unleash_verbose_log_level,
+                    "Error in event callback: %s",
+                    excep,
+                )
+
+        return variant_check
+
+    def _get_unknown_feature(self, feature_name: str) -> Feature:
+        """
+        Placeholder feature used to track metrics for a feature the client doesn't know about.
+        """
+        return self._unknown_features.get(feature_name)
+
+    def _is_dependency_satified(
+        self, dependency: dict, context: Mapping, features: Mapping[str, Feature]
+    ) -> bool:
         """
         Checks a single feature dependency.
         """
 
         dependency_name = dependency["feature"]
 
-        dependency_feature = self.features[dependency_name]
+        dependency_feature = features[dependency_name]
 
         if not dependency_feature:
             LOGGER.warning("Feature dependency not found. %s", dependency_name)
@@ -527,36 +851,54 @@ class UnleashClient:
             return False
 
         should_be_enabled = dependency.get("enabled", True)
-        is_enabled = dependency_feature.is_enabled(context, skip_stats=True)
+        is_enabled = dependency_feature.is_enabled(cast(dict, context), skip_stats=True)
 
         if is_enabled != should_be_enabled:
             return False
 
         variants = dependency.get("variants")
         if variants:
-            variant = dependency_feature.get_variant(context, skip_stats=True)
+            variant = dependency_feature.get_variant(
+                cast(dict, context), skip_stats=True
+            )
             if variant["name"] not in variants:
                 return False
 
         return True
 
-    def _dependencies_are_satisfied(self, feature_name: str, context: dict) -> bool:
+    def _dependencies_are_satisfied(
+        self, feature: Feature, context: Mapping, features: Mapping[str, Feature]
+    ) -> bool:
         """
         If feature dependencies are satisfied (or non-existent).
+
+        :param features: Features of the snapshot the feature was read from.
         """
 
-        feature = self.features[feature_name]
         dependencies = feature.dependencies
 
         if not dependencies:
             return True
 
         for dependency in dependencies:
-            if not self._is_dependency_satified(dependency, context):
+            if not self._is_dependency_satified(dependency, context, features):
                 return False
 
         return True
 
+    def _dependencies_are_satisfied_safe(
+        self, feature: Feature, context: Mapping, features: Mapping[str, Feature]
+    ) -> bool:
+        try:
+            return self._dependencies_are_satisfied(feature, context, features)
+        except Exception as excep:
+            LOGGER.log(
+                self.unleash_verbose_log_level,
+                "Error checking feature flag dependencies: %s",
+                excep,
+            )
+            return False
+
     def _do_instance_check(self, multiple_instance_mode):
         identifier = self.__get_identifier()
         if identifier in INSTANCES:
@@ -582,3 +924,18 @@ class UnleashClient:
     def __exit__(self, *args, **kwargs):
         self.destroy()
         return False
+
+
+# pylint: disable=broad-except,protected-access
+def _reinitialize_clients_after_fork() -> None:
+    for client in list(_CLIENTS):
+        try:
+            client._reinitialize_after_fork()
+        except Exception as excep:
+            LOGGER.warning(
+                "Exception reinitializing UnleashClient after fork: %s", excep
+            )
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinitialize_clients_after_fork)
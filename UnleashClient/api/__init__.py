@@ -1,4 +1,5 @@
 # ruff: noqa: F401
-from .features import get_feature_toggles
+from .features import get_feature_toggles, get_feature_toggles_raw
 from .metrics import send_metrics
 from .register import register_client
+from .session import create_session
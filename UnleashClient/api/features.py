@@ -1,15 +1,14 @@
 from typing import Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
 
+from UnleashClient.api.session import create_session
 from UnleashClient.constants import FEATURES_URL
-from UnleashClient.utils import LOGGER, log_resp_info
+from UnleashClient.utils import LOGGER, json_loads, log_resp_info
 
 
 # pylint: disable=broad-except
-def get_feature_toggles(
+def get_feature_toggles_raw(
     url: str,
     app_name: str,
     instance_id: str,
@@ -19,9 +18,10 @@ def get_feature_toggles(
     request_retries: int,
     project: Optional[str] = None,
     cached_etag: str = "",
-) -> Tuple[dict, str]:
+    session: Optional[requests.Session] = None,
+) -> Tuple[Optional[bytes], str]:
     """
-    Retrieves feature flags from unleash central server.
+    Retrieves feature flags from unleash central server, without parsing them.
 
     Notes:
     * If unsuccessful (i.e. not HTTP status code 200), exception will be caught and logged.
@@ -36,7 +36,8 @@ def get_feature_toggles(
     :param request_retries:
     :param project:
     :param cached_etag:
-    :return: (Feature flags, etag) if successful, ({},'') if not
+    :param session: Session to send the request with.  When unset, a new session is used for this request only.
+    :return: (Feature flags JSON, etag) if successful, (None, etag) if not modified, (b'','') if not
     """
     try:
         LOGGER.info("Getting feature flag.")
@@ -52,19 +53,18 @@ def get_feature_toggles(
         if project:
             base_params = {"project": project}
 
-        adapter = HTTPAdapter(
-            max_retries=Retry(total=request_retries, status_forcelist=[500, 502, 504])
-        )
-        with requests.Session() as session:
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
-            resp = session.get(
+        request_session = session or create_session(request_retries)
+        try:
+            resp = request_session.get(
                 base_url,
                 headers={**custom_headers, **headers},
                 params=base_params,
                 timeout=request_timeout,
                 **custom_options,
             )
+        finally:
+            if session is None:
+                request_session.close()
 
         if resp.status_code not in [200, 304]:
             log_resp_info(resp)
@@ -82,10 +82,56 @@ def get_feature_toggles(
         if resp.status_code == 304:
             return None, etag
 
-        return resp.json(), etag
+        return resp.content, etag
     except Exception as exc:
         LOGGER.exception(
             "Unleash Client feature fetch failed due to exception: %s", exc
         )
 
+    return b"", ""
+
+
+def get_feature_toggles(
+    url: str,
+    app_name: str,
+    instance_id: str,
+    custom_headers: dict,
+    custom_options: dict,
+    request_timeout: int,
+    request_retries: int,
+    project: Optional[str] = None,
+    cached_etag: str = "",
+    session: Optional[requests.Session] = None,
+) -> Tuple[dict, str]:
+    """
+    Retrieves feature flags from unleash central server.
+
+    Same as :func:`get_feature_toggles_raw`, parsing the feature flags.
+
+    :return: (Feature flags, etag) if successful, (None, etag) if not modified, ({},'') if not
+    """
+    payload, etag = get_feature_toggles_raw(
+        url,
+        app_name,
+        instance_id,
+        custom_headers,
+        custom_options,
+        request_timeout,
+        request_retries,
+        project,
+        cached_etag,
+        session,
+    )
+    if payload is None:
+        return None, etag
+    if not payload:
+        return {}, ""
+
+    try:
+        return json_loads(payload), etag
+    except ValueError as exc:
+        LOGGER.exception(
+            "Unleash Client feature fetch failed due to exception: %s", exc
+        )
+
     return {}, ""
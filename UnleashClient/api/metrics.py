@@ -1,4 +1,5 @@
 import json
+from typing import Optional
 
 import requests
 
@@ -13,6 +14,7 @@ def send_metrics(
     custom_headers: dict,
     custom_options: dict,
     request_timeout: int,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     Attempts to send metrics to Unleash server
@@ -25,13 +27,14 @@ def send_metrics(
     :param custom_headers:
     :param custom_options:
     :param request_timeout:
+    :param session: Session to send the request with.  When unset, the request is sent without a session.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     try:
         LOGGER.info("Sending messages to with unleash @ %s", url)
         LOGGER.info("unleash metrics information: %s", request_body)
 
-        resp = requests.post(
+        resp = (session or requests).post(
             url + METRICS_URL,
             data=json.dumps(request_body),
             headers={**custom_headers, **APPLICATION_HEADERS},
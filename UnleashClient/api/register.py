@@ -1,5 +1,6 @@
 import json
 from datetime import datetime, timezone
+from typing import Optional
 
 import requests
 from requests.exceptions import InvalidHeader, InvalidSchema, InvalidURL, MissingSchema
@@ -23,6 +24,7 @@ def register_client(
     custom_options: dict,
     supported_strategies: dict,
     request_timeout: int,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     Attempts to register client with unleash server.
@@ -39,6 +41,7 @@ def register_client(
     :param custom_options:
     :param supported_strategies:
     :param request_timeout:
+    :param session: Session to send the request with.  When unset, the request is sent without a session.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     registation_request = {
@@ -54,7 +57,7 @@ def register_client(
         LOGGER.info("Registering unleash client with unleash @ %s", url)
         LOGGER.info("Registration request information: %s", registation_request)
 
-        resp = requests.post(
+        resp = (session or requests).post(
             url + REGISTER_URL,
             data=json.dumps(registation_request),
             headers={**custom_headers, **APPLICATION_HEADERS},
@@ -0,0 +1,23 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+
+def create_session(request_retries: int) -> requests.Session:
+    """
+    Creates the HTTP session shared by feature fetches, metrics and registration.
+
+    Connections to the Unleash server are pooled and kept alive between calls, instead of a new connection (and TLS
+    handshake) being made for every call.
+
+    :param request_retries: Number of retries for failed requests.
+    :return: Session, close it when done.
+    """
+    adapter = HTTPAdapter(
+        max_retries=Retry(total=request_retries, status_forcelist=[500, 502, 504])
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
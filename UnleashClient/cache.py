@@ -1,5 +1,9 @@
 import abc
+import atexit
 import json
+import os
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Optional
 
@@ -7,6 +11,7 @@ import requests
 from fcache.cache import FileCache as _FileCache
 
 from UnleashClient.constants import FEATURES_URL, REQUEST_TIMEOUT
+from UnleashClient.snapshot import ProvisioningSnapshot
 
 
 class BaseCache(abc.ABC):
@@ -20,6 +25,8 @@ class BaseCache(abc.ABC):
     """
 
     bootstrapped = False
+    # Whether values can be bytes.  Fetched provisioning is cached as the raw JSON if so, or as a dictionary otherwise.
+    stores_bytes = False
 
     @abc.abstractmethod
     def set(self, key: str, value: Any):
@@ -42,46 +49,13 @@ class BaseCache(abc.ABC):
         pass
 
 
-class FileCache(BaseCache):
+class _BootstrapCache(BaseCache):
     """
-    The default cache for UnleashClient.  Uses `fcache <https://pypi.org/project/fcache/>`_ behind the scenes.
-
-    You can boostrap the FileCache with initial configuration to improve resiliency on startup.  To do so:
-
-    - Create a new FileCache instance.
-    - Bootstrap the FileCache.
-    - Pass your FileCache instance to UnleashClient at initialization along with `boostrap=true`.
-
-    You can bootstrap from a dictionary, a json file, or from a URL.  In all cases, configuration should match the Unleash `/api/client/features <https://docs.getunleash.io/api/client/features>`_ endpoint.
-
-    Example:
-
-    .. code-block:: python
-
-        from pathlib import Path
-        from UnleashClient.cache import FileCache
-        from UnleashClient import UnleashClient
-
-        my_cache = FileCache("HAMSTER_API")
-        my_cache.bootstrap_from_file(Path("/path/to/boostrap.json"))
-        unleash_client = UnleashClient(
-            "https://my.unleash.server.com",
-            "HAMSTER_API",
-            cache=my_cache
-        )
-
-    :param name: Name of cache.
-    :param directory: Location to create cache.  If empty, will use filecache default.
+    Bootstrap methods shared by the built-in caches.
     """
 
-    def __init__(
-        self,
-        name: str,
-        directory: Optional[str] = None,
-        request_timeout: int = REQUEST_TIMEOUT,
-    ):
-        self._cache = _FileCache(name, app_cache_dir=directory)
-        self.request_timeout = request_timeout
+    request_timeout = REQUEST_TIMEOUT
+    stores_bytes = True
 
     def bootstrap_from_dict(self, initial_config: dict) -> None:
         """
@@ -106,6 +80,19 @@ class FileCache(BaseCache):
             self.set(FEATURES_URL, json.loads(bootstrap_file.read()))
             self.bootstrapped = True
 
+    def bootstrap_from_snapshot(self, snapshot_file: Path) -> None:
+        """
+        Loads initial Unleash configuration from a snapshot file written by :func:`UnleashClient.snapshot.write_snapshot`.
+
+        The file is memory-mapped instead of parsed, and features are only decoded when they're first used.
+
+        Note: Pre-seeded configuration will only be used if UnleashClient is initialized with `bootstrap=true`.
+
+        :param snapshot_file: Path to the snapshot file.
+        """
+        self.set(FEATURES_URL, ProvisioningSnapshot(snapshot_file))
+        self.bootstrapped = True
+
     def bootstrap_from_url(
         self,
         initial_config_url: str,
@@ -125,6 +112,48 @@ class FileCache(BaseCache):
         self.set(FEATURES_URL, response.json())
         self.bootstrapped = True
 
+
+class FileCache(_BootstrapCache):
+    """
+    The default cache for UnleashClient.  Uses `fcache <https://pypi.org/project/fcache/>`_ behind the scenes.
+
+    You can boostrap the FileCache with initial configuration to improve resiliency on startup.  To do so:
+
+    - Create a new FileCache instance.
+    - Bootstrap the FileCache.
+    - Pass your FileCache instance to UnleashClient at initialization along with `boostrap=true`.
+
+    You can bootstrap from a dictionary, a json file, or from a URL.  In all cases, configuration should match the Unleash `/api/client/features <https://docs.getunleash.io/api/client/features>`_ endpoint.
+
+    Example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+        from UnleashClient.cache import FileCache
+        from UnleashClient import UnleashClient
+
+        my_cache = FileCache("HAMSTER_API")
+        my_cache.bootstrap_from_file(Path("/path/to/boostrap.json"))
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            cache=my_cache
+        )
+
+    :param name: Name of cache.
+    :param directory: Location to create cache.  If empty, will use filecache default.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Optional[str] = None,
+        request_timeout: int = REQUEST_TIMEOUT,
+    ):
+        self._cache = _FileCache(name, app_cache_dir=directory)
+        self.request_timeout = request_timeout
+
     def set(self, key: str, value: Any):
         self._cache[key] = value
         self._cache.sync()
@@ -141,3 +170,124 @@ class FileCache(BaseCache):
 
     def destroy(self):
         return self._cache.delete()
+
+
+class MemoryCache(_BootstrapCache):
+    """
+    A cache that keeps everything in memory, so refreshing features and sending metrics do no disk I/O.
+
+    Optionally, values are written behind to disk (using `fcache <https://pypi.org/project/fcache/>`_, like
+    :class:`FileCache`) in the background and when the process exits.  Values written by a previous process are loaded
+    on startup.  It can be bootstrapped in the same ways as :class:`FileCache`.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient.cache import MemoryCache
+        from UnleashClient import UnleashClient
+
+        my_cache = MemoryCache("HAMSTER_API", write_interval=60)
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            cache=my_cache
+        )
+
+    :param name: Name of cache on disk.  When unset, nothing is written to disk.
+    :param directory: Location to create cache on disk.  If empty, will use filecache default.
+    :param write_interval: Seconds between writes of changed values to disk.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        directory: Optional[str] = None,
+        request_timeout: int = REQUEST_TIMEOUT,
+        write_interval: float = 60,
+    ):
+        self.request_timeout = request_timeout
+        self.write_interval = write_interval
+        self._data: dict = {}
+        self._changed_keys: set = set()
+        self._lock = threading.RLock()
+        self._file_cache: Optional[_FileCache] = None
+        self._stop_writing = threading.Event()
+
+        if name is not None:
+            self._file_cache = _FileCache(name, app_cache_dir=directory)
+            self._data.update(self._file_cache)
+
+            self._start_writer()
+            atexit.register(self.flush)
+            _MEMORY_CACHES.add(self)
+
+    def _start_writer(self) -> None:
+        writer = threading.Thread(
+            target=self._write_behind, name="UnleashCacheWriter", daemon=True
+        )
+        writer.start()
+
+    def _reinitialize_after_fork(self) -> None:
+        # The writer thread doesn't exist in a forked child, and the lock may have been held by it.
+        self._lock = threading.RLock()
+        if not self._stop_writing.is_set():
+            self._start_writer()
+
+    def _write_behind(self) -> None:
+        while not self._stop_writing.wait(self.write_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes changed values to disk.
+        """
+        with self._lock:
+            if self._file_cache is None or not self._changed_keys:
+                return
+
+            self._file_cache.update(
+                {key: self._data[key] for key in self._changed_keys}
+            )
+            self._file_cache.sync()
+            self._changed_keys = set()
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._changed_keys.add(key)
+
+    def mset(self, data: dict):
+        with self._lock:
+            self._data.update(data)
+            self._changed_keys.update(data)
+
+    def get(self, key: str, default: Optional[Any] = None):
+        return self._data.get(key, default)
+
+    def exists(self, key: str):
+        return key in self._data
+
+    def destroy(self):
+        self._stop_writing.set()
+        with self._lock:
+            self._data = {}
+            self._changed_keys = set()
+            if self._file_cache is not None:
+                atexit.unregister(self.flush)
+                _MEMORY_CACHES.discard(self)
+                self._file_cache.delete()
+                self._file_cache = None
+
+
+# Caches writing behind to disk, to restart their writer in forked child processes.
+_MEMORY_CACHES: "weakref.WeakSet[MemoryCache]" = weakref.WeakSet()
+
+
+def _reinitialize_memory_caches_after_fork() -> None:
+    for cache in list(_MEMORY_CACHES):
+        cache._reinitialize_after_fork()  # pylint: disable=protected-access
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinitialize_memory_caches_after_fork)
@@ -7,6 +7,9 @@ REQUEST_TIMEOUT = 30
 REQUEST_RETRIES = 3
 METRIC_LAST_SENT_TIME = "mlst"
 CLIENT_SPEC_VERSION = "5.1.0"
+BATCH_CHUNK_SIZE = 10000
+UNKNOWN_FEATURES_MAX_SIZE = 1000
+UNKNOWN_FEATURES_TTL = 3600
 
 # =Unleash=
 APPLICATION_HEADERS = {
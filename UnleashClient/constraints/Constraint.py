@@ -1,7 +1,9 @@
 # pylint: disable=invalid-name, too-few-public-methods, use-a-generator
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Collection, Iterable, Optional, Pattern, Union
 
 try:
     from semver import VersionInfo
@@ -11,7 +13,8 @@ except ImportError:
 
 from dateutil.parser import parse
 
-from UnleashClient.utils import LOGGER, get_identifier
+from UnleashClient.context import context_identifier
+from UnleashClient.utils import LOGGER
 
 
 class ConstraintOperators(Enum):
@@ -41,6 +44,117 @@ class ConstraintOperators(Enum):
     SEMVER_LT = "SEMVER_LT"
 
 
+LIST_OPERATORS = (ConstraintOperators.IN, ConstraintOperators.NOT_IN)
+
+STRING_OPERATORS = (
+    ConstraintOperators.STR_CONTAINS,
+    ConstraintOperators.STR_ENDS_WITH,
+    ConstraintOperators.STR_STARTS_WITH,
+)
+
+DATE_OPERATORS = (ConstraintOperators.DATE_AFTER, ConstraintOperators.DATE_BEFORE)
+
+SEMVER_OPERATORS = (
+    ConstraintOperators.SEMVER_EQ,
+    ConstraintOperators.SEMVER_GT,
+    ConstraintOperators.SEMVER_LT,
+)
+
+OPERATOR_HANDLERS = {
+    ConstraintOperators.IN: "check_list_operators",
+    ConstraintOperators.NOT_IN: "check_list_operators",
+    ConstraintOperators.STR_CONTAINS: "check_string_operators",
+    ConstraintOperators.STR_ENDS_WITH: "check_string_operators",
+    ConstraintOperators.STR_STARTS_WITH: "check_string_operators",
+    ConstraintOperators.NUM_EQ: "check_numeric_operators",
+    ConstraintOperators.NUM_GT: "check_numeric_operators",
+    ConstraintOperators.NUM_GTE: "check_numeric_operators",
+    ConstraintOperators.NUM_LT: "check_numeric_operators",
+    ConstraintOperators.NUM_LTE: "check_numeric_operators",
+    ConstraintOperators.DATE_AFTER: "check_date_operators",
+    ConstraintOperators.DATE_BEFORE: "check_date_operators",
+    ConstraintOperators.SEMVER_EQ: "check_semver_operators",
+    ConstraintOperators.SEMVER_GT: "check_semver_operators",
+    ConstraintOperators.SEMVER_LT: "check_semver_operators",
+}
+
+
+# Number of distinct parsed values (e.g. context dates) kept across all constraints.
+PARSED_VALUE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PARSED_VALUE_CACHE_SIZE)
+def parse_date(value: str) -> Optional[datetime]:
+    """
+    Parses a date, using the ISO-8601 parser when possible and dateutil as a fallback.
+
+    :param value: Date string.
+    :return: Parsed datetime, or None if the value isn't a date.
+    """
+    try:
+        return datetime.fromisoformat(
+            value[:-1] + "+00:00" if value.endswith("Z") else value
+        )
+    except ValueError:
+        pass
+
+    try:
+        return parse(value)
+    except (ValueError, OverflowError):
+        LOGGER.error("Unable to parse date: %s", value)
+
+    return None
+
+
+@lru_cache(maxsize=PARSED_VALUE_CACHE_SIZE)
+def parse_semver(value: str) -> Optional[VersionInfo]:
+    """
+    Parses a semantic version.
+
+    Parsed versions are shared between all constraints, so app versions seen in context are only parsed once.
+
+    :param value: Version string.
+    :return: Parsed version, or None if the value isn't a valid semantic version.
+    """
+    try:
+        return VersionInfo.parse(value)
+    except ValueError:
+        LOGGER.error("Unable to parse semver: %s", value)
+
+    return None
+
+
+def _trie_pattern(node: dict) -> str:
+    if "" in node:
+        # A shorter value already matches here, longer ones can't change the result.
+        return ""
+
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items()]
+
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+def _values_pattern(values: Iterable[str]) -> str:
+    """
+    Builds a regex matching any of the values at the current position, with shared prefixes factored out.
+    """
+    trie: dict = {}
+    for value in values:
+        node = trie
+        for char in value:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    if not trie:
+        # No values, so nothing can match.
+        return "(?!)"
+
+    try:
+        return _trie_pattern(trie)
+    except RecursionError:
+        return "|".join(re.escape(x) for x in values)
+
+
 class Constraint:
     def __init__(self, constraint_dict: dict) -> None:
         """
@@ -70,41 +184,85 @@ class Constraint:
             else False
         )
 
+        # Resolve the operator handler once so apply() doesn't re-dispatch per call.
+        self._check_operator = getattr(self, OPERATOR_HANDLERS[self.operator])
+
+        self._string_pattern: Optional[Pattern] = (
+            self._load_string_pattern() if self.operator in STRING_OPERATORS else None
+        )
+
+        self._parsed_date: Optional[datetime] = (
+            parse_date(self.value)
+            if self.operator in DATE_OPERATORS and isinstance(self.value, str)
+            else None
+        )
+
+        self._parsed_version: Optional[VersionInfo] = (
+            parse_semver(self.value)
+            if self.operator in SEMVER_OPERATORS and isinstance(self.value, str)
+            else None
+        )
+
+        # Membership set for IN/NOT_IN.  List operators are always case-sensitive.
+        self.values_set: Collection = (
+            self._load_values_set() if self.operator in LIST_OPERATORS else frozenset()
+        )
+
+    def _load_string_pattern(self) -> Optional[Pattern]:
+        """
+        Compiles the constraint values into a single regex, so string operators cost scales with the context value rather than the number of values.
+
+        STR_ENDS_WITH patterns are built from the reversed values and matched against the reversed context value.
+        """
+        if not all(isinstance(x, str) for x in self.values):
+            LOGGER.warning(
+                "String constraint on %s has non-string values, it will never match.",
+                self.context_name,
+            )
+            return None
+
+        normalized_values = {
+            x.upper() if self.case_insensitive else x for x in self.values
+        }
+
+        if self.operator == ConstraintOperators.STR_ENDS_WITH:
+            normalized_values = {x[::-1] for x in normalized_values}
+
+        return re.compile(_values_pattern(normalized_values))
+
+    def _load_values_set(self) -> Collection:
+        try:
+            return frozenset(self.values)
+        except TypeError:
+            # Unhashable values can't go in a set; fall back to scanning them.
+            return tuple(self.values)
+
     # Methods to handle each operator type.
     def check_list_operators(self, context_value: str) -> bool:
-        return_value = False
+        try:
+            is_member = context_value in self.values_set
+        except TypeError:
+            is_member = context_value in self.values
 
         if self.operator == ConstraintOperators.IN:
-            return_value = context_value in self.values
-        elif self.operator == ConstraintOperators.NOT_IN:
-            return_value = context_value not in self.values
+            return is_member
 
-        return return_value
+        return not is_member
 
     def check_string_operators(self, context_value: str) -> bool:
-        if self.case_insensitive:
-            normalized_values = [x.upper() for x in self.values]
-            normalized_context_value = context_value.upper()
-        else:
-            normalized_values = self.values
-            normalized_context_value = context_value
+        if self._string_pattern is None or not isinstance(context_value, str):
+            return False
 
-        return_value = False
+        if self.case_insensitive:
+            context_value = context_value.upper()
 
         if self.operator == ConstraintOperators.STR_CONTAINS:
-            return_value = any(
-                [x in normalized_context_value for x in normalized_values]
-            )
-        elif self.operator == ConstraintOperators.STR_ENDS_WITH:
-            return_value = any(
-                [normalized_context_value.endswith(x) for x in normalized_values]
-            )
-        elif self.operator == ConstraintOperators.STR_STARTS_WITH:
-            return_value = any(
-                [normalized_context_value.startswith(x) for x in normalized_values]
-            )
+            return self._string_pattern.search(context_value) is not None
 
-        return return_value
+        if self.operator == ConstraintOperators.STR_ENDS_WITH:
+            context_value = context_value[::-1]
+
+        return self._string_pattern.match(context_value) is not None
 
     def check_numeric_operators(self, context_value: Union[float, int]) -> bool:
         return_value = False
@@ -125,63 +283,35 @@ class Constraint:
         return return_value
 
     def check_date_operators(self, context_value: Union[datetime, str]) -> bool:
-        return_value = False
-        parsing_exception = False
-
-        DateUtilParserError: Any
-
-        try:
-            from dateutil.parser import ParserError
+        if self._parsed_date is None:
+            return False
 
-            DateUtilParserError = ParserError
-        except ImportError:
-            DateUtilParserError = ValueError
+        if isinstance(context_value, str):
+            context_date = parse_date(context_value)
+            if context_date is None:
+                return False
+        else:
+            context_date = context_value
 
-        try:
-            parsed_date = parse(self.value)
-            if isinstance(context_value, str):
-                context_date = parse(context_value)
-            else:
-                context_date = context_value
-        except DateUtilParserError:
-            LOGGER.error(f"Unable to parse date: {self.value}")
-            parsing_exception = True
-
-        if not parsing_exception:
-            if self.operator == ConstraintOperators.DATE_AFTER:
-                return_value = context_date > parsed_date
-            elif self.operator == ConstraintOperators.DATE_BEFORE:
-                return_value = context_date < parsed_date
+        if self.operator == ConstraintOperators.DATE_AFTER:
+            return context_date > self._parsed_date
 
-        return return_value
+        return context_date < self._parsed_date
 
     def check_semver_operators(self, context_value: str) -> bool:
-        return_value = False
-        parsing_exception = False
-        target_version: Optional[VersionInfo] = None
-        context_version: Optional[VersionInfo] = None
+        if self._parsed_version is None:
+            return False
 
-        try:
-            target_version = VersionInfo.parse(self.value)
-        except ValueError:
-            LOGGER.error(f"Unable to parse server semver: {self.value}")
-            parsing_exception = True
+        context_version = parse_semver(context_value)
+        if context_version is None:
+            return False
 
-        try:
-            context_version = VersionInfo.parse(context_value)
-        except ValueError:
-            LOGGER.error(f"Unable to parse context semver: {context_value}")
-            parsing_exception = True
-
-        if not parsing_exception:
-            if self.operator == ConstraintOperators.SEMVER_EQ:
-                return_value = context_version == target_version
-            elif self.operator == ConstraintOperators.SEMVER_GT:
-                return_value = context_version > target_version
-            elif self.operator == ConstraintOperators.SEMVER_LT:
-                return_value = context_version < target_version
+        if self.operator == ConstraintOperators.SEMVER_EQ:
+            return context_version == self._parsed_version
+        if self.operator == ConstraintOperators.SEMVER_GT:
+            return context_version > self._parsed_version
 
-        return return_value
+        return context_version < self._parsed_version
 
     def apply(self, context: dict = None) -> bool:
         """
@@ -193,55 +323,16 @@ class Constraint:
         constraint_check = False
 
         try:
-            context_value = get_identifier(self.context_name, context)
+            context_value = context_identifier(self.context_name, context)
 
             # Set currentTime if not specified
             if self.context_name == "currentTime" and not context_value:
                 context_value = datetime.now()
 
             if context_value is not None:
-                if self.operator in [
-                    ConstraintOperators.IN,
-                    ConstraintOperators.NOT_IN,
-                ]:
-                    constraint_check = self.check_list_operators(
-                        context_value=context_value
-                    )
-                elif self.operator in [
-                    ConstraintOperators.STR_CONTAINS,
-                    ConstraintOperators.STR_ENDS_WITH,
-                    ConstraintOperators.STR_STARTS_WITH,
-                ]:
-                    constraint_check = self.check_string_operators(
-                        context_value=context_value
-                    )
-                elif self.operator in [
-                    ConstraintOperators.NUM_EQ,
-                    ConstraintOperators.NUM_GT,
-                    ConstraintOperators.NUM_GTE,
-                    ConstraintOperators.NUM_LT,
-                    ConstraintOperators.NUM_LTE,
-                ]:
-                    constraint_check = self.check_numeric_operators(
-                        context_value=context_value
-                    )
-                elif self.operator in [
-                    ConstraintOperators.DATE_AFTER,
-                    ConstraintOperators.DATE_BEFORE,
-                ]:
-                    constraint_check = self.check_date_operators(
-                        context_value=context_value
-                    )
-                elif self.operator in [
-                    ConstraintOperators.SEMVER_EQ,
-                    ConstraintOperators.SEMVER_GT,
-                    ConstraintOperators.SEMVER_LT,
-                ]:
-                    constraint_check = self.check_semver_operators(
-                        context_value=context_value
-                    )
+                constraint_check = self._check_operator(context_value=context_value)
             # This is a special case in the client spec - so it's getting it's own handler here
-            elif self.operator is ConstraintOperators.NOT_IN:  # noqa: PLR5501
+            elif self.operator is ConstraintOperators.NOT_IN:
                 constraint_check = True
 
         except Exception as excep:  # pylint: disable=broad-except
@@ -0,0 +1,219 @@
+from datetime import datetime
+from typing import Any, Iterator, Mapping, Optional, cast
+
+from UnleashClient.utils import get_identifier, normalized_hash
+
+
+class UnleashContext(Mapping):
+    """
+    Reusable context for feature flag checks.
+
+    Build one per request and pass it to as many ``is_enabled``/``get_variant`` calls as needed.
+    It behaves like a read-only context dictionary, so strategies and constraints can use it
+    unchanged.  It remembers resolved identifiers and stickiness hashes for its lifetime, so they
+    aren't looked up and re-hashed for every feature.
+
+    Notes:
+
+    * The client's static ``appName``/``environment`` are applied with the same precedence as for a context
+      dictionary: values set on the context win in ``is_enabled``, the static values win in ``get_variant``.
+    * The context itself is never changed by a check, so it can be shared between threads and clients.
+
+    :param user_id: Identifier of the current user.
+    :param session_id: Identifier of the current session.
+    :param remote_address: IP address of the caller.
+    :param current_time: Time to evaluate date constraints against.  Defaults to the time of evaluation.
+    :param environment: Environment name, overrides the client's environment.
+    :param app_name: Application name, overrides the client's app name.
+    :param properties: Custom context fields.
+    """
+
+    __slots__ = ("_values", "_identifiers", "_hashes")
+
+    def __init__(
+        self,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        remote_address: Optional[str] = None,
+        current_time: Optional[datetime] = None,
+        environment: Optional[str] = None,
+        app_name: Optional[str] = None,
+        properties: Optional[dict] = None,
+    ) -> None:
+        fields = {
+            "userId": user_id,
+            "sessionId": session_id,
+            "remoteAddress": remote_address,
+            "currentTime": current_time,
+            "environment": environment,
+            "appName": app_name,
+            "properties": properties,
+        }
+        self._values = {
+            key: value for key, value in fields.items() if value is not None
+        }
+        self._identifiers: dict = {}
+        self._hashes: dict = {}
+
+    @classmethod
+    def from_dict(cls, context: dict) -> "UnleashContext":
+        """
+        Creates a context from a context dictionary (e.g. ``{"userId": "1", "properties": {...}}``).
+
+        Keys are kept as they are, including ones set to None.
+        """
+        unleash_context = cls()
+        unleash_context._values = dict(context)
+        return unleash_context
+
+    def bind_static_context(
+        self, static_context: Mapping[str, Any], static_first: bool = False
+    ) -> "UnleashContext":
+        """
+        Returns a view of the context with static values (``appName``/``environment``) overlaid.
+
+        The view shares the context's memoized identifiers and hashes, and takes writes from strategies without
+        changing the context.  Called by the client for every check.
+
+        :param static_context: Static values.
+        :param static_first: Whether static values take precedence over values set on the context.
+        :return: Context view.
+        """
+        return _BoundContext(self, static_context, static_first)
+
+    def identifier(self, context_name: str) -> Any:
+        """
+        Memoized :func:`UnleashClient.utils.get_identifier`.
+        """
+        try:
+            return self._identifiers[context_name]
+        except KeyError:
+            value = get_identifier(context_name, self._values)
+            self._identifiers[context_name] = value
+            return value
+
+    def normalized_hash(
+        self,
+        identifier: str,
+        activation_group: str,
+        normalizer: int = 100,
+        seed: int = 0,
+    ) -> int:
+        """
+        Memoized :func:`UnleashClient.utils.normalized_hash`.
+        """
+        key = (identifier, activation_group, normalizer, seed)
+        try:
+            return self._hashes[key]
+        except KeyError:
+            value = normalized_hash(identifier, activation_group, normalizer, seed)
+            self._hashes[key] = value
+            return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"UnleashContext({dict(self)!r})"
+
+
+class _BoundContext(UnleashContext):
+    """
+    View of an :class:`UnleashContext` for a single check, see :meth:`UnleashContext.bind_static_context`.
+    """
+
+    __slots__ = ("_static_context", "_static_first", "_writes")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        context: UnleashContext,
+        static_context: Mapping[str, Any],
+        static_first: bool,
+    ) -> None:
+        self._values = context._values
+        self._identifiers = context._identifiers
+        self._hashes = context._hashes
+        self._static_context = static_context
+        self._static_first = static_first
+        self._writes: Optional[dict] = None
+
+    def identifier(self, context_name: str) -> Any:
+        # Only identifiers read from the context's own values are memoized.
+        if self._writes or context_name in self._static_context:
+            return get_identifier(context_name, cast(dict, self))
+        return super().identifier(context_name)
+
+    def __getitem__(self, key: str) -> Any:
+        if self._writes is not None and key in self._writes:
+            return self._writes[key]
+
+        if self._static_first:
+            try:
+                return self._static_context[key]
+            except KeyError:
+                return self._values[key]
+
+        try:
+            return self._values[key]
+        except KeyError:
+            return self._static_context[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        # Strategies writing to their context only change this view.
+        if self._writes is None:
+            self._writes = {}
+        self._writes[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            key in self._values
+            or key in self._static_context
+            or (self._writes is not None and key in self._writes)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        for key in self._static_context:
+            if key not in self._values:
+                yield key
+        for key in self._writes or ():
+            if key not in self._values and key not in self._static_context:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def context_identifier(context_name: str, context: Mapping) -> Any:
+    """
+    Value of a context field, memoized on the context if it's an :class:`UnleashContext`.
+    """
+    if isinstance(context, UnleashContext):
+        return context.identifier(context_name)
+
+    return get_identifier(context_name, cast(dict, context))
+
+
+def context_hash(
+    context: Mapping,
+    identifier: str,
+    activation_group: str,
+    normalizer: int = 100,
+    seed: int = 0,
+) -> int:
+    """
+    Normalized hash of an identifier, memoized on the context if it's an :class:`UnleashContext`.
+    """
+    if isinstance(context, UnleashContext):
+        return context.normalized_hash(identifier, activation_group, normalizer, seed)
+
+    return normalized_hash(identifier, activation_group, normalizer, seed)
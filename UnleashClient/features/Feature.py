@@ -1,7 +1,11 @@
 # pylint: disable=invalid-name
-from typing import Dict, Optional, cast
+from typing import Dict, List, Optional, Sequence, cast
 
+from UnleashClient import utils
 from UnleashClient.constants import DISABLED_VARIATION
+from UnleashClient.features.batch import evaluate_strategies_batch
+from UnleashClient.features.compiler import EvaluationPlan, compile_strategies
+from UnleashClient.features.stats import FeatureStats, Stats
 from UnleashClient.strategies import EvaluationResult
 from UnleashClient.utils import LOGGER
 from UnleashClient.variants import Variants
@@ -36,10 +40,7 @@ class Feature:
         self.impression_data = impression_data
 
         # Stats tracking
-        self.yes_count = 0
-        self.no_count = 0
-        ## { [ variant name ]: number }
-        self.variant_counts: Dict[str, int] = {}
+        self.stats = FeatureStats()
 
         # Whether the feature exists only for tracking metrics or not.
         self.only_for_metrics = False
@@ -50,15 +51,69 @@ class Feature:
             for dependency in dependencies or []
         ]
 
+        # Compiled strategy evaluation, see compile().
+        self.evaluation_plan: Optional[EvaluationPlan] = None
+
+        # Whether evaluations are logged, see utils.TRACE_EVALUATIONS.
+        self.trace_evaluations = utils.TRACE_EVALUATIONS
+
+    def compile(self) -> None:
+        """
+        Compiles the feature's strategies into a flat evaluation plan that is used instead of walking the strategy objects.
+
+        Must be called again if ``strategies`` is replaced.
+
+        :return:
+        """
+        self.evaluation_plan = compile_strategies(self.strategies)
+
+    @property
+    def yes_count(self) -> int:
+        return self.stats.peek()[0]
+
+    @yes_count.setter
+    def yes_count(self, value: int) -> None:
+        _, no_count, variant_counts = self.stats.peek()
+        self.stats.set(value, no_count, variant_counts)
+
+    @property
+    def no_count(self) -> int:
+        return self.stats.peek()[1]
+
+    @no_count.setter
+    def no_count(self, value: int) -> None:
+        yes_count, _, variant_counts = self.stats.peek()
+        self.stats.set(yes_count, value, variant_counts)
+
+    @property
+    def variant_counts(self) -> Dict[str, int]:
+        """
+        { [ variant name ]: number }, a copy of the counts since stats were last reset.
+        """
+        return self.stats.peek()[2]
+
+    @variant_counts.setter
+    def variant_counts(self, value: Dict[str, int]) -> None:
+        yes_count, no_count, _ = self.stats.peek()
+        self.stats.set(yes_count, no_count, value)
+
+    def collect_stats(self) -> Stats:
+        """
+        Returns stats (yes count, no count and variant counts) and resets them, for metrics reporting.
+
+        Evaluations made while collecting are kept for the next collection.
+
+        :return:
+        """
+        return self.stats.collect()
+
     def reset_stats(self) -> None:
         """
         Resets stats after metrics reporting
 
         :return:
         """
-        self.yes_count = 0
-        self.no_count = 0
-        self.variant_counts = {}
+        self.stats.collect()
 
     def increment_stats(self, result: bool) -> None:
         """
@@ -67,10 +122,7 @@ class Feature:
         :param result:
         :return:
         """
-        if result:
-            self.yes_count += 1
-        else:
-            self.no_count += 1
+        self.stats.increment(result)
 
     def _count_variant(self, variant_name: str) -> None:
         """
@@ -79,7 +131,7 @@ class Feature:
         :param variant_name: The name of the variant to count.
         :return:
         """
-        self.variant_counts[variant_name] = self.variant_counts.get(variant_name, 0) + 1
+        self.stats.count_variant(variant_name)
 
     def is_enabled(self, context: dict = None, skip_stats: bool = False) -> bool:
         """
@@ -106,7 +158,8 @@ class Feature:
         variant = evaluation_result.variant
         if variant is None or (is_feature_enabled and variant == DISABLED_VARIATION):
             try:
-                LOGGER.debug("Getting variant from feature: %s", self.name)
+                if self.trace_evaluations:
+                    LOGGER.debug("Getting variant from feature: %s", self.name)
                 variant = (
                     self.variants.get_variant(context, is_feature_enabled)
                     if is_feature_enabled
@@ -126,7 +179,9 @@ class Feature:
         strategy_result = EvaluationResult(False, None)
         if self.enabled:
             try:
-                if self.strategies:
+                if self.evaluation_plan is not None:
+                    strategy_result = self.evaluation_plan(context)
+                elif self.strategies:
                     for strategy in self.strategies:
                         r = strategy.get_result(context)
                         if r.enabled:
@@ -142,9 +197,41 @@ class Feature:
 
         if not skip_stats:
             self.increment_stats(strategy_result.enabled)
-        LOGGER.info("%s evaluation result: %s", self.name, strategy_result)
+        if self.trace_evaluations:
+            LOGGER.info("%s evaluation result: %s", self.name, strategy_result)
         return strategy_result
 
+    def evaluate_batch(
+        self, contexts: Sequence[dict], skip_stats: bool = False
+    ) -> List[bool]:
+        """
+        Checks if feature is enabled for many contexts at once.
+
+        Same result as calling :meth:`is_enabled` for each context, but strategies and constraints are applied to
+        all contexts one at a time and rollout hashes are computed in bulk (using NumPy if it's installed).
+
+        :param contexts: Context information, one per check.
+        :return: Whether the feature is enabled, for each context.
+        """
+        results = [False] * len(contexts)
+        if self.enabled:
+            try:
+                results = evaluate_strategies_batch(self.strategies, contexts)
+            except Exception as evaluation_except:
+                LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+
+        if not skip_stats:
+            enabled_count = sum(results)
+            self.stats.add(enabled_count, len(results) - enabled_count)
+        if self.trace_evaluations:
+            LOGGER.info(
+                "%s batch evaluation result: %s of %s enabled",
+                self.name,
+                sum(results),
+                len(results),
+            )
+        return results
+
     @staticmethod
     def metrics_only_feature(feature_name: str):
         feature = Feature(feature_name, False, [])
@@ -0,0 +1,187 @@
+from typing import List, Optional, Sequence
+
+import mmh3  # pylint: disable=import-error
+
+from UnleashClient.features.compiler import _constraint_cost, _is_compilable
+from UnleashClient.strategies import Default, FlexibleRollout
+from UnleashClient.utils import LOGGER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Per row outcome of a strategy: True/False, or None if evaluating it raised.
+RowResults = List[Optional[bool]]
+
+RANDOM_STICKINESS = object()
+
+
+def _within_percentage(hashes: List[int], percentage: int) -> List[bool]:
+    """
+    Vectorized ``normalized_hash(...) <= percentage`` for already computed murmur hashes.
+    """
+    if np is not None:
+        buckets = np.fromiter(hashes, dtype=np.uint64, count=len(hashes)) % 100 + 1
+        return (buckets <= percentage).tolist()
+
+    return [x % 100 + 1 <= percentage for x in hashes]
+
+
+def _rollout_identifier(context: dict, stickiness: str):
+    if stickiness == "default":
+        if "userId" in context:
+            return context["userId"]
+        if "sessionId" in context:
+            return context["sessionId"]
+        return RANDOM_STICKINESS
+
+    if stickiness == "random":
+        return RANDOM_STICKINESS
+
+    return context.get(stickiness) or context.get("properties")[stickiness]
+
+
+def _flexible_rollout_batch(
+    strategy: FlexibleRollout, contexts: Sequence[dict], rows: List[int]
+) -> RowResults:
+    """
+    Same as ``FlexibleRollout.apply`` for each row, hashing and thresholding all rows at once.
+    """
+    try:
+        percentage = int(strategy.parameters["rollout"])
+        activation_group = strategy.parameters["groupId"]
+        stickiness = strategy.parameters.get("stickiness", "default")
+    except Exception as evaluation_except:
+        LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+        return [None] * len(rows)
+
+    results: RowResults = [None] * len(rows)
+    hashed_positions = []
+    seeds = []
+    for position, row in enumerate(rows):
+        try:
+            identifier = _rollout_identifier(contexts[row], stickiness)
+        except Exception as evaluation_except:
+            LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+            continue
+
+        if percentage <= 0:
+            results[position] = False
+        elif identifier is RANDOM_STICKINESS:
+            results[position] = FlexibleRollout.random_hash() <= percentage
+        else:
+            hashed_positions.append(position)
+            seeds.append(f"{activation_group}:{identifier}")
+
+    hashes = [mmh3.hash(seed, signed=False) for seed in seeds]
+    for position, enabled in zip(
+        hashed_positions, _within_percentage(hashes, percentage)
+    ):
+        results[position] = enabled
+
+    return results
+
+
+def _apply_batch(strategy, contexts: Sequence[dict], rows: List[int]) -> RowResults:
+    strategy_type = type(strategy)
+    if strategy_type is FlexibleRollout:
+        return _flexible_rollout_batch(strategy, contexts, rows)
+    if strategy_type is Default:
+        return [True] * len(rows)
+
+    results: RowResults = []
+    for row in rows:
+        try:
+            results.append(bool(strategy.apply(contexts[row])))
+        except Exception as evaluation_except:
+            LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+            results.append(None)
+
+    return results
+
+
+def _get_result_batch(
+    strategy, contexts: Sequence[dict], rows: List[int], results: List[bool]
+) -> List[int]:
+    remaining = []
+    for row in rows:
+        try:
+            if strategy.get_result(contexts[row]).enabled:
+                results[row] = True
+            else:
+                remaining.append(row)
+        except Exception as evaluation_except:
+            LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+
+    return remaining
+
+
+def _evaluate_strategy_batch(
+    strategy, contexts: Sequence[dict], rows: List[int], results: List[bool]
+) -> List[int]:
+    """
+    Evaluates a strategy for the given rows, marking enabled rows in ``results``.
+
+    :return: Rows that are still undecided, i.e. neither enabled nor failed.
+    """
+    if not _is_compilable(strategy):
+        return _get_result_batch(strategy, contexts, rows, results)
+
+    remaining = []
+    candidates = rows
+    for constraint in sorted(strategy.parsed_constraints, key=_constraint_cost):
+        check = constraint.apply
+        matched = []
+        for row in candidates:
+            if check(contexts[row]):
+                matched.append(row)
+            else:
+                remaining.append(row)
+        candidates = matched
+
+    variants = strategy.parsed_variants
+    for row, enabled in zip(candidates, _apply_batch(strategy, contexts, candidates)):
+        if enabled is None:
+            continue
+
+        if not enabled:
+            remaining.append(row)
+            continue
+
+        if variants.variants:
+            # Variant selection runs (and may fail) as part of a regular evaluation too.
+            try:
+                variants.get_variant(contexts[row], True)
+            except Exception as evaluation_except:
+                LOGGER.warning("Error getting evaluation result: %s", evaluation_except)
+                continue
+
+        results[row] = True
+
+    return remaining
+
+
+def evaluate_strategies_batch(strategies: list, contexts: Sequence[dict]) -> List[bool]:
+    """
+    Evaluates a feature's strategies for many contexts, one strategy (and constraint) at a time.
+
+    Gives the same result as evaluating the strategies for each context: a context is enabled by the first
+    strategy that enables it, and an exception while evaluating a context disables it.
+
+    :param strategies: List of Strategy objects for a feature.
+    :param contexts: Contexts to evaluate.
+    :return: Whether the feature is enabled, for each context.
+    """
+    if not strategies:
+        # If no strategies are present, should default to true. This isn't possible via UI.
+        return [True] * len(contexts)
+
+    results = [False] * len(contexts)
+    rows = list(range(len(contexts)))
+    for strategy in strategies:
+        if not rows:
+            break
+        rows = _evaluate_strategy_batch(strategy, contexts, rows, results)
+
+    return results
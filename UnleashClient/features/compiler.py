@@ -0,0 +1,95 @@
+from typing import Callable, Optional
+
+from UnleashClient.constraints.Constraint import OPERATOR_HANDLERS
+from UnleashClient.strategies import EvaluationResult, Strategy
+
+EvaluationPlan = Callable[[dict], EvaluationResult]
+StrategyStep = Callable[[dict], Optional[EvaluationResult]]
+
+# Relative cost of each constraint check, used to run cheap constraints first.
+CONSTRAINT_COSTS = {
+    "check_list_operators": 0,
+    "check_numeric_operators": 1,
+    "check_string_operators": 1,
+    "check_date_operators": 2,
+    "check_semver_operators": 2,
+}
+
+
+def _constraint_cost(constraint) -> int:
+    operator = getattr(constraint, "operator", None)
+    if operator is None:
+        return 0
+
+    return CONSTRAINT_COSTS.get(OPERATOR_HANDLERS.get(operator), 3)
+
+
+def _is_compilable(strategy) -> bool:
+    """
+    Strategies that override how they are executed are called as-is rather than flattened.
+    """
+    strategy_type = type(strategy)
+
+    return (
+        isinstance(strategy, Strategy)
+        and strategy_type.execute is Strategy.execute
+        and strategy_type.get_result is Strategy.get_result
+        and strategy_type.parsed_constraints is Strategy.parsed_constraints
+        and strategy_type.parsed_variants is Strategy.parsed_variants
+    )
+
+
+def _compile_strategy(strategy) -> StrategyStep:
+    if not _is_compilable(strategy):
+
+        def evaluate_opaque_strategy(context: dict) -> Optional[EvaluationResult]:
+            result = strategy.get_result(context)
+            return result if result.enabled else None
+
+        return evaluate_opaque_strategy
+
+    checks = tuple(
+        constraint.apply
+        for constraint in sorted(strategy.parsed_constraints, key=_constraint_cost)
+    )
+    apply = strategy.apply
+    get_variant = strategy.parsed_variants.get_variant
+
+    def evaluate_strategy(context: dict) -> Optional[EvaluationResult]:
+        for check in checks:
+            if not check(context):
+                return None
+
+        if not apply(context):
+            return None
+
+        return EvaluationResult(True, get_variant(context, True))
+
+    return evaluate_strategy
+
+
+def compile_strategies(strategies: list) -> EvaluationPlan:
+    """
+    Flattens a feature's strategies (and their constraints, segments & variants) into a single evaluation function.
+
+    The plan returns the result of the first enabled strategy, checking each strategy's constraints cheapest first.
+    Exceptions are left to the caller, as with evaluating the strategies directly.
+
+    :param strategies: List of Strategy objects for a feature.
+    :return: Function that takes a context and returns an EvaluationResult.
+    """
+    if not strategies:
+        # If no strategies are present, should default to true. This isn't possible via UI.
+        return lambda context: EvaluationResult(True, None)
+
+    steps = tuple(_compile_strategy(strategy) for strategy in strategies)
+
+    def evaluate_feature(context: dict) -> EvaluationResult:
+        for step in steps:
+            result = step(context)
+            if result is not None:
+                return result
+
+        return EvaluationResult(False, None)
+
+    return evaluate_feature
@@ -0,0 +1,227 @@
+import threading
+import weakref
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+# (yes, no, variant counts)
+Stats = Tuple[int, int, Dict[str, int]]
+
+
+class _Shard:
+    """
+    Counters written only by the thread that owns them.
+    """
+
+    __slots__ = (
+        "yes",
+        "no",
+        "variants",
+        "thread",
+        "reported_yes",
+        "reported_no",
+        "reported_variants",
+    )
+
+    def __init__(self) -> None:
+        self.yes = 0
+        self.no = 0
+        self.variants: Dict[str, int] = {}
+        self.thread = weakref.ref(threading.current_thread())
+
+        # Counts already collected, only written by the collecting thread.
+        self.reported_yes = 0
+        self.reported_no = 0
+        self.reported_variants: Dict[str, int] = {}
+
+    def is_finished(self) -> bool:
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+
+class _ShardOwner:
+    """
+    Kept in the owning thread's local storage, so it's dropped (and its shard queued for folding) when the thread
+    ends.
+    """
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: _Shard) -> None:
+        self.shard = shard
+
+
+class FeatureStats:
+    """
+    Evaluation counters for a feature, sharded per thread.
+
+    Each thread only ever increments its own shard, so counting takes no lock and can't lose updates to other
+    threads.  Shards are never reset: :meth:`collect` instead remembers what it has already reported for each shard
+    and returns the difference, so counts made while the metrics job runs are reported by the next run.
+
+    When a thread ends its shard is queued, and folded into the shared counts by the next thread that starts counting
+    (or the next collection), so short-lived threads don't pile up shards between collections.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        # Shards of new threads not yet added to _shards, and shards of finished threads not yet folded.  Deques
+        # can be appended to without a lock.
+        self._new_shards: Deque[_Shard] = deque()
+        self._finished_shards: Deque[_Shard] = deque()
+        # Guards the shard list and collection, never waited on when counting.
+        self._lock = threading.Lock()
+
+        # Counts set directly, see set().
+        self._yes = 0
+        self._no = 0
+        self._variants: Dict[str, int] = {}
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard()
+        owner = self._local.owner = _ShardOwner(shard)
+        self._local.shard = shard
+        weakref.finalize(owner, self._finished_shards.append, shard).atexit = False
+        self._new_shards.append(shard)
+
+        # Fold finished threads' shards, unless another thread is busy with the shard list.
+        if self._finished_shards and self._lock.acquire(blocking=False):
+            try:
+                self._fold_finished_shards()
+            finally:
+                self._lock.release()
+        return shard
+
+    def increment(self, enabled: bool) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+
+        if enabled:
+            shard.yes += 1
+        else:
+            shard.no += 1
+
+    def add(self, yes: int, no: int) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+
+        shard.yes += yes
+        shard.no += no
+
+    def count_variant(self, variant_name: str) -> None:
+        try:
+            variants = self._local.shard.variants
+        except AttributeError:
+            variants = self._new_shard().variants
+
+        variants[variant_name] = variants.get(variant_name, 0) + 1
+
+    def peek(self) -> Stats:
+        """
+        Returns counts since the last collection, without collecting them.
+        """
+        with self._lock:
+            return self._gather(advance=False)
+
+    def collect(self) -> Stats:
+        """
+        Returns counts since the last collection and starts counting from zero.
+        """
+        with self._lock:
+            return self._gather(advance=True)
+
+    def set(self, yes: int, no: int, variants: Dict[str, int]) -> None:
+        """
+        Overwrites the counts since the last collection.
+        """
+        with self._lock:
+            self._gather(advance=True)
+            self._yes = yes
+            self._no = no
+            self._variants = dict(variants)
+
+    def clear(self) -> None:
+        """
+        Drops all counts, including ones not collected yet.
+
+        Used in a forked child process, which inherits the parent's counts (and lock, possibly held by a thread that
+        doesn't exist in the child).
+        """
+        self._local = threading.local()
+        self._shards = []
+        self._new_shards = deque()
+        self._finished_shards = deque()
+        self._lock = threading.Lock()
+        self._yes = 0
+        self._no = 0
+        self._variants = {}
+
+    def _fold_finished_shards(self) -> None:
+        # Called with the lock held.
+        while self._new_shards:
+            self._shards.append(self._new_shards.popleft())
+        if not self._finished_shards:
+            return
+
+        finished = set()
+        while self._finished_shards:
+            shard = self._finished_shards.popleft()
+            finished.add(id(shard))
+
+            # Counts not reported yet move to the shared counts.  A shard folded twice adds nothing the second time.
+            self._yes += shard.yes - shard.reported_yes
+            self._no += shard.no - shard.reported_no
+            for variant_name, count in shard.variants.items():
+                new_count = count - shard.reported_variants.get(variant_name, 0)
+                if new_count:
+                    self._variants[variant_name] = (
+                        self._variants.get(variant_name, 0) + new_count
+                    )
+            shard.reported_yes = shard.yes
+            shard.reported_no = shard.no
+            shard.reported_variants = shard.variants.copy()
+
+        self._shards = [x for x in self._shards if id(x) not in finished]
+
+    def _gather(self, advance: bool) -> Stats:
+        self._fold_finished_shards()
+
+        yes = self._yes
+        no = self._no
+        variants = dict(self._variants)
+        if advance:
+            self._yes = 0
+            self._no = 0
+            self._variants = {}
+
+        live_shards = []
+        for shard in self._shards:
+            # Checked before reading, so a finished thread's counts are final.
+            finished = shard.is_finished()
+
+            shard_yes = shard.yes
+            shard_no = shard.no
+            shard_variants = shard.variants.copy()
+
+            yes += shard_yes - shard.reported_yes
+            no += shard_no - shard.reported_no
+            for variant_name, count in shard_variants.items():
+                new_count = count - shard.reported_variants.get(variant_name, 0)
+                if new_count:
+                    variants[variant_name] = variants.get(variant_name, 0) + new_count
+
+            if advance:
+                shard.reported_yes = shard_yes
+                shard.reported_no = shard_no
+                shard.reported_variants = shard_variants
+                if not finished:
+                    live_shards.append(shard)
+
+        if advance:
+            self._shards = live_shards
+
+        return yes, no, variants
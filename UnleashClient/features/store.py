@@ -0,0 +1,145 @@
+from typing import (
+    Callable,
+    Dict,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    ValuesView,
+)
+
+from UnleashClient.features.Feature import Feature
+
+
+class FeatureSnapshot(NamedTuple):
+    """
+    Features (with their strategies, segments and compiled plans) loaded from one provisioning.
+
+    Snapshots aren't changed once they're published, a reload builds a new one.
+    """
+
+    features: Mapping[str, Feature]
+    segments: Dict[int, dict]
+    # Fingerprints of the whole provisioning and of each feature's provisioning, used to skip unchanged features.
+    fingerprint: Optional[int] = None
+    feature_fingerprints: Optional[Dict[str, int]] = None
+
+
+class LazyFeatures(Mapping):
+    """
+    Read-only mapping of feature name to feature, building each feature the first time it's looked up.
+
+    :param names: Names of the features, in provisioning order.
+    :param create_feature: Builds a feature by name, raises KeyError if it can't.
+    """
+
+    def __init__(
+        self, names: Iterable[str], create_feature: Callable[[str], Feature]
+    ) -> None:
+        self._names = list(names)
+        self._name_set = set(self._names)
+        self._create_feature = create_feature
+        self._features: Dict[str, Feature] = {}
+
+    def loaded(self) -> Dict[str, Feature]:
+        """
+        Returns the features built so far.
+        """
+        return dict(self._features)
+
+    def get(self, feature_name, default=None):
+        feature = self._features.get(feature_name)
+        if feature is None:
+            if feature_name not in self._name_set:
+                return default
+            try:
+                return self._build(feature_name)
+            except KeyError:
+                return default
+        return feature
+
+    def _build(self, feature_name: str) -> Feature:
+        # Threads racing to build a feature all end up with the one that was stored first.
+        return self._features.setdefault(
+            feature_name, self._create_feature(feature_name)
+        )
+
+    def __getitem__(self, feature_name: str) -> Feature:
+        feature = self._features.get(feature_name)
+        if feature is None:
+            if feature_name not in self._name_set:
+                raise KeyError(feature_name)
+            return self._build(feature_name)
+        return feature
+
+    def __contains__(self, feature_name) -> bool:
+        return feature_name in self._name_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def loaded_features(features: Mapping[str, Feature]) -> Mapping[str, Feature]:
+    """
+    Returns the features that have been built, without building any :class:`LazyFeatures`.
+    """
+    if isinstance(features, LazyFeatures):
+        return features.loaded()
+    return features
+
+
+class FeatureStore(Mapping):
+    """
+    Read-only mapping of feature name to feature, backed by the latest published :class:`FeatureSnapshot`.
+
+    Publishing swaps the snapshot reference in one assignment, so readers never block and never see a partially
+    loaded snapshot.  Hold on to :attr:`snapshot` when several features must be read from the same load.
+    """
+
+    def __init__(self, snapshot: Optional[FeatureSnapshot] = None) -> None:
+        self.snapshot = snapshot or FeatureSnapshot({}, {})
+        # ETag of the provisioning the snapshot was loaded from, if known.
+        self.revision: Optional[str] = None
+        # Number of polls that found the provisioning unchanged and skipped reloading.
+        self.skipped_reloads = 0
+
+    def publish(self, snapshot: FeatureSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def loaded_values(self) -> List[Feature]:
+        """
+        Returns the features of the snapshot that have been built, see :class:`LazyFeatures`.
+        """
+        return list(loaded_features(self.snapshot.features).values())
+
+    def get(self, feature_name, default=None):
+        return self.snapshot.features.get(feature_name, default)
+
+    def __getitem__(self, feature_name: str) -> Feature:
+        return self.snapshot.features[feature_name]
+
+    def __contains__(self, feature_name) -> bool:
+        return feature_name in self.snapshot.features
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot.features)
+
+    def __len__(self) -> int:
+        return len(self.snapshot.features)
+
+    # Views of a single snapshot, so iterating them isn't affected by a concurrent publish.
+    def keys(self) -> KeysView[str]:
+        return self.snapshot.features.keys()
+
+    def values(self) -> ValuesView[Feature]:
+        return self.snapshot.features.values()
+
+    def items(self) -> ItemsView[str, Feature]:
+        return self.snapshot.features.items()
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import List, Optional, Tuple
+
+from UnleashClient.constants import UNKNOWN_FEATURES_MAX_SIZE, UNKNOWN_FEATURES_TTL
+from UnleashClient.features.Feature import Feature
+
+
+class UnknownFeatures:
+    """
+    Bounded registry of placeholder features, used to count checks of features the client doesn't know about.
+
+    Placeholders are kept apart from the client's features.  At most ``max_size`` are kept, dropping the least
+    recently used one when full, and placeholders that haven't been used for ``ttl`` seconds are dropped too.  Flag
+    names that are generated dynamically (or supplied by users) therefore can't grow memory without limit.
+
+    :param max_size: Maximum number of placeholders kept.
+    :param ttl: Seconds a placeholder is kept after its last use.  When unset, placeholders are only dropped when full.
+    """
+
+    def __init__(
+        self,
+        max_size: int = UNKNOWN_FEATURES_MAX_SIZE,
+        ttl: Optional[float] = UNKNOWN_FEATURES_TTL,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        # Ordered from least to most recently used.
+        self._features: "OrderedDict[str, Tuple[Feature, float]]" = OrderedDict()
+        self._lock = RLock()
+
+    def get(self, feature_name: str) -> Feature:
+        """
+        Returns the placeholder for a feature, creating it if needed.
+
+        :param feature_name: Name of the feature
+        :return: Metrics only feature.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._features.get(feature_name)
+            if entry is None:
+                feature = Feature.metrics_only_feature(feature_name)
+            else:
+                feature = entry[0]
+                self._features.move_to_end(feature_name)
+
+            self._features[feature_name] = (feature, now)
+            self._expire(now)
+
+        return feature
+
+    def values(self) -> List[Feature]:
+        """
+        Returns the current placeholders, e.g. for reporting metrics.
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            return [feature for feature, _ in self._features.values()]
+
+    def _expire(self, now: float) -> None:
+        while len(self._features) > self.max_size:
+            self._features.popitem(last=False)
+
+        if self.ttl is not None:
+            while self._features:
+                _, last_used = next(iter(self._features.values()))
+                if now - last_used <= self.ttl:
+                    break
+                self._features.popitem(last=False)
+
+    def __contains__(self, feature_name: str) -> bool:
+        return feature_name in self._features
+
+    def __len__(self) -> int:
+        return len(self._features)
@@ -1,9 +1,20 @@
-from typing import Optional
+import json
+from typing import Any, Optional, Union
 
+import mmh3  # pylint: disable=import-error
+
+from UnleashClient import utils
 from UnleashClient.cache import BaseCache
 from UnleashClient.constants import FAILED_STRATEGIES, FEATURES_URL
 from UnleashClient.features.Feature import Feature
-from UnleashClient.utils import LOGGER
+from UnleashClient.features.store import (
+    FeatureSnapshot,
+    FeatureStore,
+    LazyFeatures,
+    loaded_features,
+)
+from UnleashClient.snapshot import ProvisioningSnapshot
+from UnleashClient.utils import LOGGER, json_loads
 from UnleashClient.variants.Variants import Variants
 
 
@@ -67,6 +78,7 @@ def _create_feature(
     strategy_mapping: dict,
     cache: BaseCache,
     global_segments: Optional[dict],
+    compile_features: bool = True,
 ) -> Feature:
     if "strategies" in provisioning.keys():
         parsed_strategies = _create_strategies(
@@ -80,7 +92,7 @@ def _create_feature(
     else:
         variant = None
 
-    return Feature(
+    feature = Feature(
         name=provisioning["name"],
         enabled=provisioning["enabled"],
         strategies=parsed_strategies,
@@ -89,33 +101,165 @@ def _create_feature(
         dependencies=provisioning.get("dependencies", []),
     )
 
+    if compile_features:
+        feature.compile()
 
-def load_features(
+    return feature
+
+
+def _fingerprint(provisioning) -> int:
+    return mmh3.hash128(json.dumps(provisioning, sort_keys=True, default=str))
+
+
+def _load_settings(compile_features: bool) -> int:
+    # Settings baked into the feature objects when they're built, so features built with other settings aren't reused.
+    return int(compile_features) | int(utils.TRACE_EVALUATIONS) << 1
+
+
+def _feature_fingerprint(
+    provisioning: dict, global_segments: dict, compile_features: bool
+) -> int:
+    # Segments are compiled into the strategies, so a feature also changes with the segments it uses.
+    segment_ids = [
+        segment_id
+        for strategy in provisioning.get("strategies", [])
+        for segment_id in strategy.get("segments", [])
+    ]
+    return _fingerprint(
+        [
+            provisioning,
+            [global_segments.get(x) for x in segment_ids],
+            _load_settings(compile_features),
+        ]
+    )
+
+
+def provisioning_fingerprint(
+    feature_provisioning, compile_features: bool = True
+) -> int:
+    """
+    Fingerprint of feature provisioning, used to skip reloading unchanged provisioning.
+
+    :param feature_provisioning: Provisioning as cached: JSON bytes, a dictionary or a snapshot file.
+    :param compile_features: Whether the features are compiled when loaded.
+    """
+    settings = _load_settings(compile_features)
+    # Fetched provisioning is cached as JSON, and only needs parsing if it changed.
+    if isinstance(feature_provisioning, bytes):
+        return mmh3.hash128(feature_provisioning, settings)
+    # Snapshot files carry the fingerprint of their contents.
+    if isinstance(feature_provisioning, ProvisioningSnapshot):
+        return _fingerprint([feature_provisioning.fingerprint, settings])
+    return _fingerprint([feature_provisioning, settings])
+
+
+def _build_lazy_snapshot(
+    provisioning_snapshot: ProvisioningSnapshot,
     cache: BaseCache,
-    feature_toggles: dict,
     strategy_mapping: dict,
-    global_segments: Optional[dict] = None,
-) -> None:
+    previous: Optional[FeatureSnapshot],
+    compile_features: bool,
+    fingerprint: int,
+) -> Optional[FeatureSnapshot]:
+    try:
+        metadata = provisioning_snapshot.metadata
+    except ValueError as excep:
+        LOGGER.warning("Unleash client could not parse cached features: %s", excep)
+        return None
+
+    global_segments = {
+        segment["id"]: segment for segment in metadata.get("segments", [])
+    }
+    # Only features that were already built can have metrics to carry over.
+    previous_features = (
+        loaded_features(previous.features) if previous is not None else {}
+    )
+
+    def create_feature(feature_name: str) -> Feature:
+        try:
+            provisioning = provisioning_snapshot.feature(feature_name)
+        except ValueError as excep:
+            LOGGER.warning(
+                "Unleash client could not parse feature %s from snapshot: %s",
+                feature_name,
+                excep,
+            )
+            raise KeyError(feature_name) from excep
+
+        feature = _create_feature(
+            provisioning, strategy_mapping, cache, global_segments, compile_features
+        )
+        previous_feature = previous_features.get(feature_name)
+        if previous_feature is not None:
+            feature.stats = previous_feature.stats
+        return feature
+
+    return FeatureSnapshot(
+        LazyFeatures(provisioning_snapshot, create_feature),
+        global_segments,
+        fingerprint,
+    )
+
+
+def build_snapshot(
+    cache: BaseCache,
+    strategy_mapping: dict,
+    previous: Optional[FeatureSnapshot] = None,
+    compile_features: bool = True,
+    feature_provisioning: Any = None,
+    fingerprint: Optional[int] = None,
+) -> Optional[FeatureSnapshot]:
     """
-    Caching
+    Builds new feature objects from the cached provisioning, without touching the currently loaded ones.
+
+    Features whose provisioning (including the segments they use) hasn't changed since the previous snapshot are
+    reused as is, and if the provisioning hasn't changed at all the previous snapshot is returned.
+
+    Features of a :class:`~UnleashClient.snapshot.ProvisioningSnapshot` are only decoded and built when they're first
+    looked up.
 
     :param cache: Should be the cache class variable from UnleashClient
-    :param feature_toggles: Should be the features class variable from UnleashClient
     :param strategy_mapping:
-    :return:
+    :param previous: Currently loaded snapshot.  Its unchanged features are reused and metrics of the others are carried over to the new features.
+    :param compile_features: Whether to compile each feature's strategies into an evaluation plan.
+    :param feature_provisioning: Provisioning to build from instead of the cached provisioning.
+    :param fingerprint: Fingerprint of the provisioning, see :func:`provisioning_fingerprint`.  Computed if not given.
+    :return: New snapshot, or None if there are no cached features.
     """
     # Pull raw provisioning from cache.
-    feature_provisioning = cache.get(FEATURES_URL)
+    if feature_provisioning is None:
+        feature_provisioning = cache.get(FEATURES_URL)
     if not feature_provisioning:
         LOGGER.warning(
             "Unleash client does not have cached features. "
             "Please make sure client can communicate with Unleash server!"
         )
-        return
+        return None
 
-    # Parse provisioning
-    parsed_features = {}
-    feature_names = [d["name"] for d in feature_provisioning["features"]]
+    fingerprint = (
+        provisioning_fingerprint(feature_provisioning, compile_features)
+        if fingerprint is None
+        else fingerprint
+    )
+    if previous is not None and previous.fingerprint == fingerprint:
+        return previous
+
+    if isinstance(feature_provisioning, ProvisioningSnapshot):
+        return _build_lazy_snapshot(
+            feature_provisioning,
+            cache,
+            strategy_mapping,
+            previous,
+            compile_features,
+            fingerprint,
+        )
+
+    if isinstance(feature_provisioning, bytes):
+        try:
+            feature_provisioning = json_loads(feature_provisioning)
+        except ValueError as excep:
+            LOGGER.warning("Unleash client could not parse cached features: %s", excep)
+            return None
 
     if "segments" in feature_provisioning.keys():
         segments = feature_provisioning["segments"]
@@ -123,48 +267,94 @@ def load_features(
     else:
         global_segments = {}
 
+    previous_features = (
+        loaded_features(previous.features) if previous is not None else {}
+    )
+    previous_fingerprints = (previous and previous.feature_fingerprints) or {}
+    features = {}
+    feature_fingerprints = {}
     for provisioning in feature_provisioning["features"]:
-        parsed_features[provisioning["name"]] = provisioning
+        feature_name = provisioning["name"]
+        feature_fingerprint = _feature_fingerprint(
+            provisioning, global_segments, compile_features
+        )
+        feature_fingerprints[feature_name] = feature_fingerprint
 
-    # Delete old features/cache
-    for feature in list(feature_toggles.keys()):
-        if feature not in feature_names:
-            del feature_toggles[feature]
+        previous_feature = previous_features.get(feature_name)
+        if (
+            previous_feature is not None
+            and previous_fingerprints.get(feature_name) == feature_fingerprint
+        ):
+            features[feature_name] = previous_feature
+            continue
 
-    # Update existing objects
-    for feature in feature_toggles.keys():
-        feature_for_update = feature_toggles[feature]
-        strategies = parsed_features[feature]["strategies"]
+        feature = _create_feature(
+            provisioning,
+            strategy_mapping,
+            cache,
+            global_segments,
+            compile_features,
+        )
 
-        feature_for_update.enabled = parsed_features[feature]["enabled"]
-        if strategies:
-            parsed_strategies = _create_strategies(
-                parsed_features[feature], strategy_mapping, cache, global_segments
-            )
-            feature_for_update.strategies = parsed_strategies
+        # Evaluations still running against the previous feature count towards the same metrics.
+        if previous_feature is not None:
+            feature.stats = previous_feature.stats
 
-        if "variants" in parsed_features[feature]:
-            feature_for_update.variants = Variants(
-                parsed_features[feature]["variants"], parsed_features[feature]["name"]
-            )
+        features[feature_name] = feature
 
-        feature_for_update.impression_data = parsed_features[feature].get(
-            "impressionData", False
-        )
+    return FeatureSnapshot(features, global_segments, fingerprint, feature_fingerprints)
 
-        feature_for_update.dependencies = parsed_features[feature].get(
-            "dependencies", []
-        )
 
-        # If the feature had previously been added to the features list only for
-        # tracking, indicate that it is now a real feature that should be
-        # evaluated properly.
-        feature_for_update.only_for_metrics = False
+def load_features(
+    cache: BaseCache,
+    feature_toggles: Union[dict, FeatureStore],
+    strategy_mapping: dict,
+    global_segments: Optional[dict] = None,
+    compile_features: bool = True,
+    feature_provisioning: Any = None,
+    fingerprint: Optional[int] = None,
+) -> None:
+    """
+    Caching
 
-    # Handle creation or deletions
-    new_features = list(set(feature_names) - set(feature_toggles.keys()))
+    A :class:`FeatureStore` is updated by publishing a new snapshot in one go.  A plain dictionary is updated in place
+    with the new feature objects.
 
-    for feature in new_features:
-        feature_toggles[feature] = _create_feature(
-            parsed_features[feature], strategy_mapping, cache, global_segments
+    :param cache: Should be the cache class variable from UnleashClient
+    :param feature_toggles: Should be the features class variable from UnleashClient
+    :param strategy_mapping:
+    :param compile_features: Whether to compile each feature's strategies into an evaluation plan.
+    :param feature_provisioning: Provisioning to load instead of the cached provisioning.
+    :param fingerprint: Fingerprint of the provisioning, see :func:`provisioning_fingerprint`.  Computed if not given.
+    :return:
+    """
+    if isinstance(feature_toggles, FeatureStore):
+        snapshot = build_snapshot(
+            cache,
+            strategy_mapping,
+            feature_toggles.snapshot,
+            compile_features,
+            feature_provisioning,
+            fingerprint,
         )
+        if snapshot is not None and snapshot is not feature_toggles.snapshot:
+            feature_toggles.publish(snapshot)
+        return
+
+    snapshot = build_snapshot(
+        cache,
+        strategy_mapping,
+        FeatureSnapshot(dict(feature_toggles), {}),
+        compile_features,
+        feature_provisioning,
+        fingerprint,
+    )
+    if snapshot is None:
+        return
+
+    # Delete old features/cache
+    for feature in list(feature_toggles.keys()):
+        if feature not in snapshot.features:
+            del feature_toggles[feature]
+
+    feature_toggles.update(snapshot.features)
@@ -1,3 +1,4 @@
 # ruff: noqa: F401
 from .fetch_and_load import fetch_and_load_features
+from .load_shared_snapshot import load_shared_snapshot
 from .send_metrics import aggregate_and_send_metrics
@@ -1,10 +1,27 @@
-from typing import Optional
+from typing import Optional, Union
 
-from UnleashClient.api import get_feature_toggles
+import requests
+
+from UnleashClient.api import get_feature_toggles_raw
 from UnleashClient.cache import BaseCache
 from UnleashClient.constants import ETAG, FEATURES_URL
-from UnleashClient.loader import load_features
-from UnleashClient.utils import LOGGER
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.loader import load_features, provisioning_fingerprint
+from UnleashClient.snapshot import SharedSnapshot
+from UnleashClient.utils import LOGGER, json_loads
+
+
+def _publish(shared_snapshot: SharedSnapshot, provisioning: dict) -> None:
+    try:
+        generation = shared_snapshot.publish(provisioning)
+    except (OSError, KeyError, TypeError) as excep:
+        LOGGER.warning(
+            "Unleash Client could not publish shared snapshot %s: %s",
+            shared_snapshot.path,
+            excep,
+        )
+    else:
+        LOGGER.debug("Published shared snapshot generation %s.", generation)
 
 
 def fetch_and_load_features(
@@ -14,13 +31,16 @@ def fetch_and_load_features(
     custom_headers: dict,
     custom_options: dict,
     cache: BaseCache,
-    features: dict,
+    features: Union[dict, FeatureStore],
     strategy_mapping: dict,
     request_timeout: int,
     request_retries: int,
     project: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    shared_snapshot: Optional[SharedSnapshot] = None,
 ) -> None:
-    (feature_provisioning, etag) = get_feature_toggles(
+    cached_etag = cache.get(ETAG)
+    feature_provisioning, etag = get_feature_toggles_raw(
         url,
         app_name,
         instance_id,
@@ -29,17 +49,62 @@ def fetch_and_load_features(
         request_timeout,
         request_retries,
         project,
-        cache.get(ETAG),
+        cached_etag,
+        session,
     )
 
+    # Not modified (304) and already loaded, there's nothing to parse or reload.
+    if (
+        feature_provisioning is None
+        and isinstance(features, FeatureStore)
+        and features.revision
+        and features.revision == (etag or cached_etag)
+    ):
+        features.skipped_reloads += 1
+        LOGGER.debug("Feature provisioning not modified, skipping reload.")
+        return
+
+    provisioning = None
+    fingerprint = None
     if feature_provisioning:
-        cache.set(FEATURES_URL, feature_provisioning)
+        try:
+            provisioning = json_loads(feature_provisioning)
+        except ValueError as excep:
+            LOGGER.warning(
+                "Unleash Client feature fetch returned invalid JSON: %s", excep
+            )
+            feature_provisioning = b""
+            etag = ""
+        else:
+            if cache.stores_bytes:
+                # Fingerprinted as cached, so reloading the cached bytes later is skipped.
+                fingerprint = provisioning_fingerprint(feature_provisioning)
+            if shared_snapshot is not None:
+                _publish(shared_snapshot, provisioning)
+
+    if feature_provisioning:
+        # Custom caches may only handle JSON-serializable values.
+        cache.set(
+            FEATURES_URL, feature_provisioning if cache.stores_bytes else provisioning
+        )
     else:
         LOGGER.debug(
             "No feature provisioning returned from server, using cached provisioning."
         )
 
-    if etag:
+    if etag and etag != cached_etag:
         cache.set(ETAG, etag)
 
-    load_features(cache, features, strategy_mapping)
+    # Fetched provisioning is loaded as parsed above, rather than parsed again from the cache.
+    load_features(
+        cache,
+        features,
+        strategy_mapping,
+        feature_provisioning=provisioning,
+        fingerprint=fingerprint,
+    )
+
+    if isinstance(features, FeatureStore):
+        # A failed fetch has no ETag, so the next 304 reloads from the cache once more.
+        loaded = features.snapshot.fingerprint is not None
+        features.revision = etag if loaded and etag else None
@@ -0,0 +1,49 @@
+from typing import Union
+
+from UnleashClient.cache import BaseCache
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.loader import load_features
+from UnleashClient.snapshot import SharedSnapshot
+from UnleashClient.utils import LOGGER
+
+
+def load_shared_snapshot(
+    shared_snapshot: SharedSnapshot,
+    cache: BaseCache,
+    feature_toggles: Union[dict, FeatureStore],
+    strategy_mapping: dict,
+) -> None:
+    """
+    Loads features from the snapshot published by the process that fetches them, when its generation changed.
+
+    Until a snapshot is published, features are loaded from the cache.
+
+    :param shared_snapshot: Snapshot shared by the processes on this host.
+    :param cache: Should be the cache class variable from UnleashClient
+    :param feature_toggles: Should be the features class variable from UnleashClient
+    :param strategy_mapping:
+    """
+    generation = shared_snapshot.generation
+    if generation is None:
+        if shared_snapshot.loaded_generation is None:
+            load_features(cache, feature_toggles, strategy_mapping)
+        return
+
+    if generation == shared_snapshot.loaded_generation:
+        return
+
+    provisioning_snapshot = shared_snapshot.open()
+    if provisioning_snapshot is None:
+        LOGGER.warning(
+            "Unleash client could not open shared snapshot %s.", shared_snapshot.path
+        )
+        return
+
+    LOGGER.debug("Loading shared snapshot generation %s.", generation)
+    load_features(
+        cache,
+        feature_toggles,
+        strategy_mapping,
+        feature_provisioning=provisioning_snapshot,
+    )
+    shared_snapshot.loaded_generation = generation
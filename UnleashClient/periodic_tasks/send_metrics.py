@@ -1,9 +1,13 @@
-from collections import ChainMap
 from datetime import datetime, timezone
+from typing import Optional
+
+import requests
 
 from UnleashClient.api import send_metrics
 from UnleashClient.cache import BaseCache
 from UnleashClient.constants import METRIC_LAST_SENT_TIME
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.features.unknown import UnknownFeatures
 from UnleashClient.utils import LOGGER
 
 
@@ -16,23 +20,33 @@ def aggregate_and_send_metrics(
     features: dict,
     cache: BaseCache,
     request_timeout: int,
+    unknown_features: Optional[UnknownFeatures] = None,
+    session: Optional[requests.Session] = None,
 ) -> None:
-    feature_stats_list = []
+    if isinstance(features, FeatureStore):
+        # Features of a snapshot file that were never looked up aren't built, and have no metrics.
+        feature_list = features.loaded_values()
+    else:
+        feature_list = list(features.values())
+    if unknown_features is not None:
+        feature_list.extend(unknown_features.values())
 
-    for feature_name in features.keys():
-        if not (features[feature_name].yes_count or features[feature_name].no_count):
+    toggles: dict = {}
+    for feature in feature_list:
+        yes_count, no_count, variant_counts = feature.collect_stats()
+        if not (yes_count or no_count):
             continue
 
-        feature_stats = {
-            features[feature_name].name: {
-                "yes": features[feature_name].yes_count,
-                "no": features[feature_name].no_count,
-                "variants": features[feature_name].variant_counts,
-            }
-        }
-
-        features[feature_name].reset_stats()
-        feature_stats_list.append(feature_stats)
+        # A feature checked before it was fetched also has counts on its unknown feature placeholder.
+        feature_stats = toggles.setdefault(
+            feature.name, {"yes": 0, "no": 0, "variants": {}}
+        )
+        feature_stats["yes"] += yes_count
+        feature_stats["no"] += no_count
+        for variant, count in variant_counts.items():
+            feature_stats["variants"][variant] = (
+                feature_stats["variants"].get(variant, 0) + count
+            )
 
     metrics_request = {
         "appName": app_name,
@@ -40,13 +54,18 @@ def aggregate_and_send_metrics(
         "bucket": {
             "start": cache.get(METRIC_LAST_SENT_TIME).isoformat(),
             "stop": datetime.now(timezone.utc).isoformat(),
-            "toggles": dict(ChainMap(*feature_stats_list)),
+            "toggles": toggles,
         },
     }
 
-    if feature_stats_list:
+    if toggles:
         send_metrics(
-            url, metrics_request, custom_headers, custom_options, request_timeout
+            url,
+            metrics_request,
+            custom_headers,
+            custom_options,
+            request_timeout,
+            session,
         )
         cache.set(METRIC_LAST_SENT_TIME, datetime.now(timezone.utc))
     else:
@@ -0,0 +1,153 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from UnleashClient.utils import LOGGER
+
+
+class IntervalJob:
+    """
+    Job run by an :class:`IntervalScheduler`.
+    """
+
+    def __init__(
+        self,
+        scheduler: "IntervalScheduler",
+        func: Callable,
+        interval: float,
+        jitter: Optional[float] = None,
+        kwargs: Optional[dict] = None,
+    ) -> None:
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.kwargs = kwargs or {}
+        self.removed = False
+        self._scheduler = scheduler
+
+    @property
+    def name(self) -> str:
+        return getattr(self.func, "__name__", repr(self.func))
+
+    def next_run(self, now: float) -> float:
+        # Like APScheduler's interval trigger, jitter only ever delays a run.
+        delay = random.uniform(0, self.jitter) if self.jitter else 0
+        return now + self.interval + delay
+
+    def remove(self) -> None:
+        self._scheduler.remove_job(self)
+
+
+class IntervalScheduler:
+    """
+    Minimal scheduler running jobs at fixed intervals on a single daemon thread.
+
+    Jobs are kept in a heap ordered by their next run, and the thread sleeps until the first one is due.  Jobs run one
+    at a time, so a slow job delays the others rather than running concurrently.  The first run of a job is one
+    interval after it was added, like with APScheduler.
+
+    :param name: Name of the scheduler thread.
+    """
+
+    def __init__(self, name: str = "UnleashScheduler") -> None:
+        self.name = name
+        self.running = False
+        # (next run, insertion order, job)
+        self._jobs: List[Tuple[float, int, IntervalJob]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._condition:
+            if self.running:
+                return
+            self.running = True
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def add_job(
+        self,
+        func: Callable,
+        interval: float,
+        jitter: Optional[float] = None,
+        kwargs: Optional[dict] = None,
+    ) -> IntervalJob:
+        """
+        Runs a function every interval.
+
+        :param func: Function to run.
+        :param interval: Seconds between runs.
+        :param jitter: Maximum random delay in seconds added to each run, optional.
+        :param kwargs: Keyword arguments to call the function with.
+        :return: Job, remove it to stop running it.
+        """
+        job = IntervalJob(self, func, interval, jitter, kwargs)
+        with self._condition:
+            self._push(job, time.monotonic())
+            self._condition.notify()
+        return job
+
+    def remove_job(self, job: IntervalJob) -> None:
+        with self._condition:
+            # Dropped from the heap when it's next due.
+            job.removed = True
+            self._condition.notify()
+
+    def get_jobs(self) -> List[IntervalJob]:
+        with self._condition:
+            return [job for _, _, job in sorted(self._jobs) if not job.removed]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the scheduler.  A running job is finished, jobs that aren't due yet don't run anymore.
+
+        :param wait: Whether to wait for a running job to finish.
+        """
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+
+        thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _push(self, job: IntervalJob, now: float) -> None:
+        heapq.heappush(self._jobs, (job.next_run(now), next(self._counter), job))
+
+    def _next_job(self) -> Optional[IntervalJob]:
+        with self._condition:
+            while self.running:
+                now = time.monotonic()
+                if not self._jobs:
+                    self._condition.wait()
+                elif self._jobs[0][2].removed:
+                    heapq.heappop(self._jobs)
+                elif self._jobs[0][0] > now:
+                    self._condition.wait(self._jobs[0][0] - now)
+                else:
+                    _, _, job = heapq.heappop(self._jobs)
+                    self._push(job, now)
+                    return job
+        return None
+
+    # pylint: disable=broad-except
+    def _run(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            # Removed after it was picked, but before it ran.
+            if job.removed:
+                continue
+
+            try:
+                job.func(**job.kwargs)
+            except Exception as excep:
+                LOGGER.warning("Unleash client job %s failed: %s", job.name, excep)
@@ -0,0 +1,264 @@
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+import mmh3  # pylint: disable=import-error
+
+from UnleashClient.utils import json_loads
+
+# File layout (all integers little endian):
+#
+# - Header: magic, format version, feature count, fingerprint of the contents and offset of the index.
+# - Provisioning without its features (version, segments...), as a record.
+# - One record per feature.  A record is its length (uint32) followed by the feature's JSON.
+# - Index, one entry per feature in provisioning order: record offset (uint64), name length (uint16) and UTF-8 name.
+SNAPSHOT_MAGIC = b"UNLSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII16sQ")
+_RECORD_LENGTH = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<QH")
+_GENERATION = struct.Struct("<Q")
+
+
+def _dumps(document) -> bytes:
+    return json.dumps(document, separators=(",", ":")).encode("utf8")
+
+
+def write_snapshot(provisioning: dict, path: Union[str, Path]) -> None:
+    """
+    Writes feature provisioning (as returned by the Unleash `/api/client/features <https://docs.getunleash.io/api/client/features>`_ endpoint) to a snapshot file.
+
+    The file is written next to the destination and moved in place, so processes that have the previous snapshot
+    open keep reading it unchanged.
+
+    :param provisioning: Feature provisioning.
+    :param path: Location of the snapshot file.
+    """
+    metadata = {key: value for key, value in provisioning.items() if key != "features"}
+    records = [_dumps(metadata)] + [
+        _dumps(feature) for feature in provisioning["features"]
+    ]
+
+    body = bytearray()
+    offsets = []
+    for record in records:
+        offsets.append(_HEADER.size + len(body))
+        body += _RECORD_LENGTH.pack(len(record))
+        body += record
+    fingerprint = mmh3.hash128(bytes(body)).to_bytes(16, "little")
+
+    index = bytearray()
+    for offset, feature in zip(offsets[1:], provisioning["features"]):
+        name = feature["name"].encode("utf8")
+        index += _INDEX_ENTRY.pack(offset, len(name))
+        index += name
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        len(provisioning["features"]),
+        fingerprint,
+        _HEADER.size + len(body),
+    )
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(header)
+        snapshot_file.write(body)
+        snapshot_file.write(index)
+    os.replace(temporary_path, path)
+
+
+class ProvisioningSnapshot:
+    """
+    Feature provisioning read from a snapshot file written by :func:`write_snapshot`.
+
+    The file is memory-mapped rather than read, and each feature is only decoded when asked for, so loading touches
+    just the features that are used.  Processes mapping the same file share its pages.
+
+    Pickles as its path, so caches that persist values only store the path and map the file again when loaded.
+
+    :param path: Location of the snapshot file.
+    :raises ValueError: If the file isn't a snapshot, or was written in an unsupported format version.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = str(path)
+
+        with open(self.path, "rb") as snapshot_file:
+            try:
+                self._mmap = mmap.mmap(
+                    snapshot_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError as excep:  # Empty file
+                raise ValueError(f"{self.path} is not a feature snapshot.") from excep
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a feature snapshot.")
+        magic, version, count, fingerprint, index_offset = _HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{self.path} is not a feature snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"{self.path} has unsupported snapshot version {version}, expected {SNAPSHOT_VERSION}."
+            )
+
+        self.fingerprint = int.from_bytes(fingerprint, "little")
+        self._metadata: Optional[dict] = None
+        self._offsets: Dict[str, int] = {}
+        position = index_offset
+        for _ in range(count):
+            offset, name_length = _INDEX_ENTRY.unpack_from(self._mmap, position)
+            position += _INDEX_ENTRY.size
+            name = self._mmap[position : position + name_length].decode("utf8")
+            position += name_length
+            self._offsets[name] = offset
+
+    def __reduce__(self):
+        return _open_snapshot, (self.path,)
+
+    def _record(self, offset: int):
+        (length,) = _RECORD_LENGTH.unpack_from(self._mmap, offset)
+        start = offset + _RECORD_LENGTH.size
+        return json_loads(self._mmap[start : start + length])
+
+    @property
+    def metadata(self) -> dict:
+        """
+        Provisioning without its features (version, segments...).
+        """
+        if self._metadata is None:
+            self._metadata = self._record(_HEADER.size)
+        return self._metadata
+
+    def feature(self, feature_name: str) -> dict:
+        """
+        Decodes a feature's provisioning.
+
+        :param feature_name: Name of the feature.
+        :return: Feature provisioning.
+        :raises KeyError: If the snapshot has no such feature.
+        """
+        return self._record(self._offsets[feature_name])
+
+    def to_dict(self) -> dict:
+        """
+        Decodes the whole provisioning.
+        """
+        return {
+            **self.metadata,
+            "features": [self.feature(name) for name in self._offsets],
+        }
+
+    def __contains__(self, feature_name) -> bool:
+        return feature_name in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def _open_snapshot(path: str) -> Optional[ProvisioningSnapshot]:
+    # A snapshot that's gone (or was replaced by something else) is treated like a missing cache entry.
+    try:
+        return ProvisioningSnapshot(path)
+    except (OSError, ValueError):
+        return None
+
+
+class SharedSnapshot:
+    """
+    Snapshot file shared by the processes on a host, with a generation counter that's bumped on every publish.
+
+    One process fetches features and publishes them, the others compare :attr:`generation` with the one they loaded
+    and only open the snapshot when it changed.  The counter is kept in a small memory-mapped file next
+    to the snapshot, so checking it is a memory read.
+
+    :param path: Location of the snapshot file.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = str(path)
+        self.generation_path = f"{self.path}.generation"
+        # Generation this process last loaded, see load_shared_snapshot().
+        self.loaded_generation: Optional[int] = None
+        self._generation_map: Optional[mmap.mmap] = None
+        self._writable = False
+
+    def _map_generation(self, writable: bool) -> Optional[mmap.mmap]:
+        if self._generation_map is not None and writable and not self._writable:
+            self._generation_map.close()
+            self._generation_map = None
+
+        if self._generation_map is None:
+            flags = os.O_RDWR | os.O_CREAT if writable else os.O_RDONLY
+            try:
+                descriptor = os.open(self.generation_path, flags, 0o644)
+            except FileNotFoundError:
+                return None
+
+            try:
+                if os.fstat(descriptor).st_size < _GENERATION.size:
+                    if not writable:
+                        return None
+                    os.ftruncate(descriptor, _GENERATION.size)
+                self._generation_map = mmap.mmap(
+                    descriptor,
+                    _GENERATION.size,
+                    access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+                )
+                self._writable = writable
+            finally:
+                os.close(descriptor)
+
+        return self._generation_map
+
+    @property
+    def generation(self) -> Optional[int]:
+        """
+        Generation of the published snapshot, None if nothing was published yet.
+        """
+        generation_map = self._map_generation(writable=False)
+        if generation_map is None:
+            return None
+        (generation,) = _GENERATION.unpack_from(generation_map)
+        return generation or None
+
+    def publish(self, provisioning: dict) -> int:
+        """
+        Writes the provisioning as the new snapshot.
+
+        :param provisioning: Feature provisioning.
+        :return: Generation of the new snapshot.
+        """
+        generation_map = self._map_generation(writable=True)
+        assert generation_map is not None
+        write_snapshot(provisioning, self.path)
+
+        # Bumped after the snapshot is in place, so a new generation always has its snapshot.
+        (generation,) = _GENERATION.unpack_from(generation_map)
+        generation += 1
+        _GENERATION.pack_into(generation_map, 0, generation)
+        return generation
+
+    def open(self) -> Optional[ProvisioningSnapshot]:
+        """
+        Opens the published snapshot, None if there's none.
+        """
+        return _open_snapshot(self.path)
+
+    def close(self) -> None:
+        if self._generation_map is not None:
+            self._generation_map.close()
+            self._generation_map = None
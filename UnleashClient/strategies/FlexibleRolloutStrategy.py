@@ -1,8 +1,8 @@
 # pylint: disable=invalid-name
 import random
 
+from UnleashClient.context import context_hash
 from UnleashClient.strategies.Strategy import Strategy
-from UnleashClient.utils import normalized_hash
 
 
 class FlexibleRollout(Strategy):
@@ -26,12 +26,12 @@ class FlexibleRollout(Strategy):
 
         if stickiness == "default":
             if "userId" in context.keys():
-                calculated_percentage = normalized_hash(
-                    context["userId"], activation_group
+                calculated_percentage = context_hash(
+                    context, context["userId"], activation_group
                 )
             elif "sessionId" in context.keys():
-                calculated_percentage = normalized_hash(
-                    context["sessionId"], activation_group
+                calculated_percentage = context_hash(
+                    context, context["sessionId"], activation_group
                 )
             else:
                 calculated_percentage = self.random_hash()
@@ -41,6 +41,8 @@ class FlexibleRollout(Strategy):
             custom_stickiness = (
                 context.get(stickiness) or context.get("properties")[stickiness]
             )
-            calculated_percentage = normalized_hash(custom_stickiness, activation_group)
+            calculated_percentage = context_hash(
+                context, custom_stickiness, activation_group
+            )
 
         return percentage > 0 and calculated_percentage <= percentage
@@ -1,6 +1,6 @@
 # pylint: disable=invalid-name
+from UnleashClient.context import context_hash
 from UnleashClient.strategies.Strategy import Strategy
-from UnleashClient.utils import normalized_hash
 
 
 class GradualRolloutSessionId(Strategy):
@@ -15,5 +15,6 @@ class GradualRolloutSessionId(Strategy):
 
         return (
             percentage > 0
-            and normalized_hash(context["sessionId"], activation_group) <= percentage
+            and context_hash(context, context["sessionId"], activation_group)
+            <= percentage
         )
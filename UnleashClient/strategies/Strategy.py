@@ -4,9 +4,22 @@ from dataclasses import dataclass
 from typing import Iterator, Optional
 
 from UnleashClient.constraints import Constraint
+from UnleashClient.utils import LOGGER
 from UnleashClient.variants import Variants
 
 
+class _MissingSegment:
+    """
+    Stand-in for a segment id that isn't part of the provisioning.  Never satisfied.
+    """
+
+    def apply(self, context: dict = None) -> bool:  # pylint: disable=unused-argument
+        return False
+
+
+MISSING_SEGMENT = _MissingSegment()
+
+
 @dataclass
 class EvaluationResult:
     enabled: bool
@@ -41,6 +54,12 @@ class Strategy:
         self.segment_ids = segment_ids or []
         self.global_segments = global_segments or {}
         self.parsed_provisioning = self.load_provisioning()
+        self._parsed_constraints = self._load_constraints()
+        self._parsed_variants = Variants(
+            variants_list=self.variants,
+            group_id=self.parameters.get("groupId"),
+            is_feature_variants=False,
+        )
 
     def __call__(self, context: dict = None):
         warnings.warn(
@@ -78,21 +97,33 @@ class Strategy:
 
     @property
     def parsed_constraints(self) -> Iterator[Constraint]:
-        for constraint_dict in self.constraints:
-            yield Constraint(constraint_dict=constraint_dict)
+        return iter(self._parsed_constraints)
+
+    def _load_constraints(self) -> tuple:
+        """
+        Builds the strategy's constraints (including those from referenced segments) once, so they can be reused on every evaluation.
+        """
+        parsed_constraints: list = [
+            Constraint(constraint_dict=constraint_dict)
+            for constraint_dict in self.constraints
+        ]
 
         for segment_id in self.segment_ids:
-            segment = self.global_segments[segment_id]
-            for constraint in segment["constraints"]:
-                yield Constraint(constraint_dict=constraint)
+            if segment_id not in self.global_segments:
+                LOGGER.warning(
+                    "Segment %s not found, strategy will not be enabled.", segment_id
+                )
+                parsed_constraints.append(MISSING_SEGMENT)
+                continue
+
+            for constraint in self.global_segments[segment_id]["constraints"]:
+                parsed_constraints.append(Constraint(constraint_dict=constraint))
+
+        return tuple(parsed_constraints)
 
     @property
     def parsed_variants(self) -> Variants:
-        return Variants(
-            variants_list=self.variants,
-            group_id=self.parameters.get("groupId"),
-            is_feature_variants=False,
-        )
+        return self._parsed_variants
 
     def load_provisioning(self) -> list:  # pylint: disable=no-self-use
         """
@@ -1,3 +1,4 @@
+import json
 import logging
 from enum import Enum
 from threading import RLock
@@ -6,8 +7,23 @@ from typing import Any
 import mmh3  # pylint: disable=import-error
 from requests import Response
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 LOGGER = logging.getLogger("UnleashClient")
 
+# Log every feature evaluation (result at INFO, variant selection at DEBUG).  Off by default to keep logging out of the
+# evaluation hot path; read when features are loaded, so set it before initializing the client (or a change applies
+# from the next reload).
+TRACE_EVALUATIONS = False
+
 
 class InstanceAllowType(Enum):
     BLOCK = 1
@@ -50,12 +66,9 @@ def normalized_hash(
 
 
 def get_identifier(context_key_name: str, context: dict) -> Any:
-    if context_key_name in context.keys():
+    if context_key_name in context:
         value = context[context_key_name]
-    elif (
-        "properties" in context.keys()
-        and context_key_name in context["properties"].keys()
-    ):
+    elif "properties" in context and context_key_name in context["properties"]:
         value = context["properties"][context_key_name]
     else:
         value = None
@@ -67,3 +80,18 @@ def log_resp_info(resp: Response) -> None:
     LOGGER.debug("HTTP status code: %s", resp.status_code)
     LOGGER.debug("HTTP headers: %s", resp.headers)
     LOGGER.debug("HTTP content: %s", resp.text)
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parses JSON, using orjson or ujson if either is installed (``pip install UnleashClient[json]``).
+
+    :param data: JSON document.
+    :return: Parsed document.
+    :raises ValueError: If the document isn't valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
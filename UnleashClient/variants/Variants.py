@@ -1,10 +1,12 @@
 # pylint: disable=invalid-name, too-few-public-methods
+import bisect
 import copy
+import itertools
 import random
-from typing import Dict, Optional  # noqa: F401
+from typing import Collection, Dict, Optional  # noqa: F401
 
-from UnleashClient import utils
 from UnleashClient.constants import DISABLED_VARIATION
+from UnleashClient.context import context_hash, context_identifier
 
 VARIANT_HASH_SEED = 86028157
 
@@ -22,23 +24,52 @@ class Variants:
         self.group_id = group_id
         self.is_feature_variants = is_feature_variants
 
+        # Selection data is resolved once so get_variant() is a hash and a bisect.
+        variants = self.variants or []
+        self.cumulative_weights = list(
+            itertools.accumulate(x.get("weight", 0) for x in variants)
+        )
+        self.total_weight = self.cumulative_weights[-1] if variants else 0
+        self.stickiness_selector = (
+            variants[0].get("stickiness", "default") if variants else "default"
+        )
+        self._overrides = self._load_overrides()
+        self._formatted_variants = [self._format_variation(x) for x in variants]
+
+    def _load_overrides(self) -> list:
+        """
+        Flattens variant overrides into (context name, values, variant) entries, in provisioning order.
+        """
+        overrides = []
+
+        for variant in self.variants or []:
+            for override in variant.get("overrides", []):
+                values: Collection
+                try:
+                    values = frozenset(override["values"])
+                except TypeError:
+                    values = tuple(override["values"])
+
+                overrides.append((override["contextName"], values, variant))
+
+        return overrides
+
     def _apply_overrides(self, context: dict) -> dict:
         """
         Figures out if an override should be applied based on a context.
 
         Notes:
-            - This matches only the first variant found.
+            - If several overrides match, the last one in provisioning order wins.
         """
-        variants_with_overrides = [x for x in self.variants if "overrides" in x.keys()]
-        override_variant = {}  # type: Dict
+        for context_name, values, variant in reversed(self._overrides):
+            identifier = context_identifier(context_name, context)
+            try:
+                if identifier in values:
+                    return variant
+            except TypeError:
+                continue
 
-        for variant in variants_with_overrides:
-            for override in variant["overrides"]:
-                identifier = utils.get_identifier(override["contextName"], context)
-                if identifier in override["values"]:
-                    override_variant = variant
-
-        return override_variant
+        return {}
 
     @staticmethod
     def _get_seed(context: dict, stickiness_selector: str = "default") -> str:
@@ -66,16 +97,24 @@ class Variants:
 
     @staticmethod
     def _format_variation(variation: dict, flag_status: Optional[bool] = None) -> dict:
-        formatted_variation = copy.deepcopy(variation)
-        del formatted_variation["weight"]
-        if "overrides" in formatted_variation:
-            del formatted_variation["overrides"]
-        if "stickiness" in formatted_variation:
-            del formatted_variation["stickiness"]
+        formatted_variation = {
+            key: copy.deepcopy(value)
+            for key, value in variation.items()
+            if key not in ("weight", "overrides", "stickiness")
+        }
         if "enabled" not in formatted_variation and flag_status is not None:
             formatted_variation["enabled"] = flag_status
         return formatted_variation
 
+    @staticmethod
+    def _copy_variation(formatted_variation: dict, flag_status: Optional[bool]) -> dict:
+        variation = dict(formatted_variation)
+        if "payload" in variation:
+            variation["payload"] = copy.copy(variation["payload"])
+        if "enabled" not in variation and flag_status is not None:
+            variation["enabled"] = flag_status
+        return variation
+
     def get_variant(self, context: dict, flag_status: Optional[bool] = None) -> dict:
         """
         Determines what variation a user is in.
@@ -85,32 +124,24 @@ class Variants:
         :return:
         """
         if self.variants:
-            override_variant = self._apply_overrides(context)
-            if override_variant:
-                return self._format_variation(override_variant, flag_status)
+            if self._overrides:
+                override_variant = self._apply_overrides(context)
+                if override_variant:
+                    return self._format_variation(override_variant, flag_status)
 
-            total_weight = sum(x["weight"] for x in self.variants)
-            if total_weight <= 0:
+            if self.total_weight <= 0:
                 return DISABLED_VARIATION
 
-            stickiness_selector = (
-                self.variants[0]["stickiness"]
-                if "stickiness" in self.variants[0].keys()
-                else "default"
-            )
-
-            target = utils.normalized_hash(
-                self._get_seed(context, stickiness_selector),
+            target = context_hash(
+                context,
+                self._get_seed(context, self.stickiness_selector),
                 self.group_id,
-                total_weight,
+                self.total_weight,
                 seed=VARIANT_HASH_SEED,
             )
-            counter = 0
-            for variation in self.variants:
-                counter += variation["weight"]
+            index = bisect.bisect_left(self.cumulative_weights, target)
 
-                if counter >= target:
-                    return self._format_variation(variation, flag_status)
+            return self._copy_variation(self._formatted_variants[index], flag_status)
 
         # Catch all return.
         return DISABLED_VARIATION
@@ -0,0 +1,90 @@
+# Benchmark: cost of evaluating a strategy's constraints (including segment constraints).
+#
+# Compares the precompiled constraints built when the strategy is loaded against
+# rebuilding Constraint objects for every evaluation (the previous behaviour).
+#
+# Run with: make benchmark
+import timeit
+import tracemalloc
+
+from UnleashClient.constraints import Constraint
+from UnleashClient.strategies import FlexibleRollout
+
+ITERATIONS = 20000
+
+CONSTRAINTS = [
+    {"contextName": "environment", "operator": "IN", "values": ["staging", "prod"]},
+    {"contextName": "userId", "operator": "NOT_IN", "values": ["4", "5", "6"]},
+    {"contextName": "appName", "operator": "in", "values": ["test"]},
+    {"contextName": "customField", "operator": "NUM_GT", "value": "3"},
+]
+
+GLOBAL_SEGMENTS = {
+    1: {
+        "id": 1,
+        "constraints": [
+            {"contextName": "customField", "operator": "NUM_LT", "value": "10"},
+            {
+                "contextName": "region",
+                "operator": "STR_STARTS_WITH",
+                "values": ["eu-"],
+            },
+        ],
+    }
+}
+
+CONTEXT = {
+    "userId": "122",
+    "appName": "test",
+    "environment": "prod",
+    "properties": {"customField": "5", "region": "eu-west-1"},
+}
+
+STRATEGY = FlexibleRollout(
+    constraints=CONSTRAINTS,
+    parameters={"rollout": 100, "stickiness": "userId", "groupId": "bench"},
+    segment_ids=[1],
+    global_segments=GLOBAL_SEGMENTS,
+)
+
+
+def rebuilt_constraints() -> bool:
+    constraints = [Constraint(constraint_dict=x) for x in STRATEGY.constraints]
+    for segment_id in STRATEGY.segment_ids:
+        constraints.extend(
+            Constraint(constraint_dict=x)
+            for x in STRATEGY.global_segments[segment_id]["constraints"]
+        )
+
+    return all(constraint.apply(CONTEXT) for constraint in constraints)
+
+
+def precompiled_constraints() -> bool:
+    return all(constraint.apply(CONTEXT) for constraint in STRATEGY.parsed_constraints)
+
+
+def peak_bytes_per_call(func) -> int:
+    func()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    assert rebuilt_constraints() == precompiled_constraints()
+
+    print("Constraint evaluation (6 constraints, 1 segment)")
+    for label, func in (
+        ("rebuilt per call", rebuilt_constraints),
+        ("precompiled", precompiled_constraints),
+    ):
+        per_call = timeit.timeit(func, number=ITERATIONS) / ITERATIONS
+        print(
+            f"  {label:<20} {per_call * 1e6:8.2f} us/call  {peak_bytes_per_call(func):8d} peak bytes/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
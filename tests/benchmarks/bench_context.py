@@ -0,0 +1,57 @@
+# Benchmark: checking many gradual rollout flags for the same request.
+#
+# Compares passing a plain context dictionary (every flag looks up the
+# constrained property and re-hashes the user id) with reusing one
+# UnleashContext, which memoizes identifiers and stickiness hashes.
+#
+# Run with: make benchmark
+import timeit
+
+from UnleashClient.context import UnleashContext
+from UnleashClient.features import Feature
+from UnleashClient.strategies import FlexibleRollout
+
+ITERATIONS = 2000
+FEATURE_COUNT = 50
+
+
+def main() -> None:
+    # Flags sharing a groupId hash the same (groupId, userId) pair.
+    features = [
+        Feature(
+            f"feature-{x}",
+            True,
+            [
+                FlexibleRollout(
+                    constraints=[
+                        {"contextName": "plan", "operator": "IN", "values": ["pro"]}
+                    ],
+                    parameters={"rollout": 50, "groupId": "checkout"},
+                )
+            ],
+        )
+        for x in range(FEATURE_COUNT)
+    ]
+    for feature in features:
+        feature.compile()
+
+    def check_all(context):
+        return [feature.is_enabled(context, skip_stats=True) for feature in features]
+
+    context = {"userId": "122", "properties": {"plan": "pro"}}
+    unleash_context = UnleashContext(user_id="122", properties={"plan": "pro"})
+    assert check_all(context) == check_all(unleash_context)
+
+    as_dict = timeit.timeit(lambda: check_all(context), number=ITERATIONS) / ITERATIONS
+    reused = (
+        timeit.timeit(lambda: check_all(unleash_context), number=ITERATIONS)
+        / ITERATIONS
+    )
+    print(f"Checking {FEATURE_COUNT} rollout flags per request")
+    print(
+        f"  dict context {as_dict * 1e6:7.2f} us/request  UnleashContext {reused * 1e6:7.2f} us/request"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Benchmark: DATE_AFTER / DATE_BEFORE constraints.
+#
+# Compares the pre-parsed constraint date (and cached ISO-8601 context parsing)
+# with parsing both dates through dateutil on every call (the previous behaviour).
+#
+# Run with: make benchmark
+import timeit
+from datetime import datetime, timezone
+
+from dateutil.parser import parse
+
+from UnleashClient.constraints import Constraint
+
+ITERATIONS = 20000
+CONSTRAINT = {
+    "contextName": "currentTime",
+    "operator": "DATE_AFTER",
+    "value": "2022-01-22T00:00:00.000Z",
+}
+
+
+def parse_every_call(context_value) -> bool:
+    parsed_date = parse(CONSTRAINT["value"])
+    if isinstance(context_value, str):
+        context_value = parse(context_value)
+
+    return context_value > parsed_date
+
+
+def main() -> None:
+    constraint = Constraint(CONSTRAINT)
+
+    print("Date constraint evaluation")
+    for label, context_value in (
+        ("datetime context", datetime.now(timezone.utc)),
+        ("ISO-8601 context", "2023-05-01T12:30:00.000Z"),
+    ):
+        context = {"currentTime": context_value}
+        assert constraint.apply(context) == parse_every_call(context_value)
+
+        every_call = (
+            timeit.timeit(
+                lambda c=context_value: parse_every_call(c), number=ITERATIONS
+            )
+            / ITERATIONS
+        )
+        pre_parsed = (
+            timeit.timeit(lambda c=context: constraint.apply(c), number=ITERATIONS)
+            / ITERATIONS
+        )
+        print(
+            f"  {label:<18} dateutil per call {every_call * 1e6:7.2f} us/call  pre-parsed {pre_parsed * 1e6:5.2f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
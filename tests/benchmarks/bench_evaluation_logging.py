@@ -0,0 +1,44 @@
+# Benchmark: cost of logging in the evaluation hot path.
+#
+# Compares is_enabled() with evaluation tracing on (the previous behaviour,
+# logging every result at INFO) and off (the default), with the logger both
+# discarding records and handling them.
+#
+# Run with: make benchmark
+import logging
+import timeit
+
+from UnleashClient import utils
+from UnleashClient.features import Feature
+from UnleashClient.strategies import Default
+
+ITERATIONS = 100_000
+CONTEXT = {"userId": "122"}
+
+
+def main() -> None:
+    utils.LOGGER.addHandler(logging.NullHandler())
+    utils.LOGGER.propagate = False
+
+    print("Feature evaluation logging")
+    for level in (logging.WARNING, logging.INFO):
+        utils.LOGGER.setLevel(level)
+        timings = {}
+        for trace in (True, False):
+            utils.TRACE_EVALUATIONS = trace
+            feature = Feature("test", True, [Default()])
+            feature.compile()
+            timings[trace] = (
+                timeit.timeit(
+                    lambda f=feature: f.is_enabled(CONTEXT), number=ITERATIONS
+                )
+                / ITERATIONS
+            )
+
+        print(
+            f"  logger level {logging.getLevelName(level):<8} tracing {timings[True] * 1e6:5.2f} us/call  no tracing {timings[False] * 1e6:5.2f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
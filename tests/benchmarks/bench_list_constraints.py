@@ -0,0 +1,40 @@
+# Benchmark: IN / NOT_IN constraints with large value lists (e.g. user id segments).
+#
+# Compares membership against the precomputed set with a linear scan of the raw
+# value list (the previous behaviour).
+#
+# Run with: make benchmark
+import timeit
+
+from UnleashClient.constraints import Constraint
+
+ITERATIONS = 2000
+
+
+def main() -> None:
+    print("IN / NOT_IN constraint evaluation")
+    for size in (10_000, 100_000):
+        values = [f"user-{x}" for x in range(size)]
+        # Worst case for a scan: the context value is at the end of the list.
+        context = {"userId": values[-1]}
+
+        for operator in ("IN", "NOT_IN"):
+            constraint = Constraint(
+                {"contextName": "userId", "operator": operator, "values": values}
+            )
+
+            def scan(constraint=constraint):
+                return context["userId"] in constraint.values
+
+            scanned = timeit.timeit(scan, number=ITERATIONS) / ITERATIONS
+            applied = (
+                timeit.timeit(lambda c=constraint: c.apply(context), number=ITERATIONS)
+                / ITERATIONS
+            )
+            print(
+                f"  {operator:<7} {size:>7} values  list scan {scanned * 1e6:10.2f} us/call  set lookup {applied * 1e6:6.2f} us/call"
+            )
+
+
+if __name__ == "__main__":
+    main()
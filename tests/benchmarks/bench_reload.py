@@ -0,0 +1,133 @@
+# Benchmark: reloading features on every refresh.
+#
+# Compares rebuilding every feature (what loading into a plain dict does) with
+# loading into a FeatureStore, which skips unchanged provisioning entirely and
+# only rebuilds the features that changed.
+#
+# Run with: make benchmark
+import copy
+import json
+import timeit
+
+from UnleashClient.cache import BaseCache
+from UnleashClient.constants import FEATURES_URL
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.loader import load_features
+from UnleashClient.strategies import (
+    ApplicationHostname,
+    Default,
+    FlexibleRollout,
+    GradualRolloutRandom,
+    GradualRolloutSessionId,
+    GradualRolloutUserId,
+    RemoteAddress,
+    UserWithId,
+)
+
+FEATURE_COUNT = 2000
+ITERATIONS = 5
+
+STRATEGY_MAPPING = {
+    "applicationHostname": ApplicationHostname,
+    "default": Default,
+    "gradualRolloutRandom": GradualRolloutRandom,
+    "gradualRolloutSessionId": GradualRolloutSessionId,
+    "gradualRolloutUserId": GradualRolloutUserId,
+    "remoteAddress": RemoteAddress,
+    "userWithId": UserWithId,
+    "flexibleRollout": FlexibleRollout,
+}
+
+
+class DictCache(BaseCache):
+    def __init__(self) -> None:
+        self._data: dict = {}
+
+    def set(self, key, value):
+        self._data[key] = value
+
+    def mset(self, data):
+        self._data.update(data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def exists(self, key):
+        return key in self._data
+
+    def destroy(self):
+        self._data = {}
+
+
+def main() -> None:
+    provisioning = {
+        "version": 1,
+        "features": [
+            {
+                "name": f"feature-{x}",
+                "enabled": True,
+                "strategies": [
+                    {
+                        "name": "flexibleRollout",
+                        "parameters": {"rollout": 50, "groupId": f"feature-{x}"},
+                        "constraints": [
+                            {
+                                "contextName": "country",
+                                "operator": "IN",
+                                "values": ["NO", "SE"],
+                            }
+                        ],
+                    }
+                ],
+                "variants": [
+                    {"name": "a", "weight": 500, "stickiness": "default"},
+                    {"name": "b", "weight": 500, "stickiness": "default"},
+                ],
+            }
+            for x in range(FEATURE_COUNT)
+        ],
+    }
+    changed = copy.deepcopy(provisioning)
+    cache = DictCache()
+    features = FeatureStore()
+
+    def reload_dict():
+        load_features(cache, {}, STRATEGY_MAPPING)
+
+    def reload_one_changed():
+        changed["features"][0]["enabled"] = not changed["features"][0]["enabled"]
+        cache.set(FEATURES_URL, changed)
+        load_features(cache, features, STRATEGY_MAPPING)
+
+    cache.set(FEATURES_URL, provisioning)
+    load_features(cache, features, STRATEGY_MAPPING)
+
+    rebuild = timeit.timeit(reload_dict, number=ITERATIONS) / ITERATIONS
+    unchanged = (
+        timeit.timeit(
+            lambda: load_features(cache, features, STRATEGY_MAPPING),
+            number=ITERATIONS,
+        )
+        / ITERATIONS
+    )
+    one_changed = timeit.timeit(reload_one_changed, number=ITERATIONS) / ITERATIONS
+
+    # Fetched provisioning is cached as JSON, so checking it for changes is a single hash.
+    cache.set(FEATURES_URL, json.dumps(provisioning).encode())
+    load_features(cache, features, STRATEGY_MAPPING)
+    unchanged_json = (
+        timeit.timeit(
+            lambda: load_features(cache, features, STRATEGY_MAPPING),
+            number=ITERATIONS,
+        )
+        / ITERATIONS
+    )
+    print(f"Reloading {FEATURE_COUNT} features")
+    print(
+        f"  rebuild all {rebuild * 1e3:7.1f} ms  unchanged {unchanged * 1e3:7.1f} ms  one changed {one_changed * 1e3:7.1f} ms"
+    )
+    print(f"  unchanged, cached as fetched JSON {unchanged_json * 1e3:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
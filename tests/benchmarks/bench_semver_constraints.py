@@ -0,0 +1,39 @@
+# Benchmark: SEMVER_EQ / SEMVER_GT / SEMVER_LT constraints gating on app version.
+#
+# Compares the pre-parsed target version (and shared cache of parsed context
+# versions) with parsing both versions on every call (the previous behaviour).
+#
+# Run with: make benchmark
+import timeit
+
+from UnleashClient.constraints import Constraint
+from UnleashClient.constraints.Constraint import VersionInfo
+
+ITERATIONS = 20000
+CONTEXT = {"appVersion": "4.12.1"}
+
+
+def main() -> None:
+    print("Semver constraint evaluation")
+    for operator in ("SEMVER_EQ", "SEMVER_GT", "SEMVER_LT"):
+        constraint = Constraint(
+            {"contextName": "appVersion", "operator": operator, "value": "4.10.0"}
+        )
+
+        def parse_every_call():
+            target_version = VersionInfo.parse(constraint.value)
+            context_version = VersionInfo.parse(CONTEXT["appVersion"])
+            return context_version == target_version
+
+        every_call = timeit.timeit(parse_every_call, number=ITERATIONS) / ITERATIONS
+        pre_parsed = (
+            timeit.timeit(lambda c=constraint: c.apply(CONTEXT), number=ITERATIONS)
+            / ITERATIONS
+        )
+        print(
+            f"  {operator:<10} parse per call {every_call * 1e6:6.2f} us/call  pre-parsed {pre_parsed * 1e6:5.2f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
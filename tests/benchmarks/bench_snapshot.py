@@ -0,0 +1,93 @@
+# Benchmark: cold start from a bootstrap file.
+#
+# Compares bootstrapping from a JSON file (parsing and building every feature) with bootstrapping from a snapshot
+# file, which is memory-mapped and only builds the features that are looked up.
+#
+# Run with: make benchmark
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+from UnleashClient.cache import MemoryCache
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.loader import load_features
+from UnleashClient.snapshot import write_snapshot
+from UnleashClient.strategies import Default, FlexibleRollout
+
+FEATURE_COUNT = 2000
+USED_FEATURE_COUNT = 20
+ITERATIONS = 5
+
+STRATEGY_MAPPING = {"default": Default, "flexibleRollout": FlexibleRollout}
+
+
+def main() -> None:
+    provisioning = {
+        "version": 1,
+        "features": [
+            {
+                "name": f"feature-{x}",
+                "enabled": True,
+                "strategies": [
+                    {
+                        "name": "flexibleRollout",
+                        "parameters": {"rollout": 50, "groupId": f"feature-{x}"},
+                        "constraints": [
+                            {
+                                "contextName": "country",
+                                "operator": "IN",
+                                "values": ["NO", "SE"],
+                            }
+                        ],
+                    }
+                ],
+                "variants": [
+                    {"name": "a", "weight": 500, "stickiness": "default"},
+                    {"name": "b", "weight": 500, "stickiness": "default"},
+                ],
+            }
+            for x in range(FEATURE_COUNT)
+        ],
+    }
+    context = {"userId": "1", "country": "NO"}
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory, "features.json")
+        json_path.write_text(json.dumps(provisioning))
+        snapshot_path = Path(directory, "features.snapshot")
+        write_snapshot(provisioning, snapshot_path)
+
+        def cold_start(bootstrap):
+            cache = MemoryCache()
+            bootstrap(cache)
+            features = FeatureStore()
+            load_features(cache, features, STRATEGY_MAPPING)
+            for x in range(USED_FEATURE_COUNT):
+                features[f"feature-{x}"].is_enabled(context)
+
+        from_json = (
+            timeit.timeit(
+                lambda: cold_start(lambda cache: cache.bootstrap_from_file(json_path)),
+                number=ITERATIONS,
+            )
+            / ITERATIONS
+        )
+        from_snapshot = (
+            timeit.timeit(
+                lambda: cold_start(
+                    lambda cache: cache.bootstrap_from_snapshot(snapshot_path)
+                ),
+                number=ITERATIONS,
+            )
+            / ITERATIONS
+        )
+
+    print(f"Cold start with {FEATURE_COUNT} features, {USED_FEATURE_COUNT} used")
+    print(
+        f"  JSON file {from_json * 1e3:7.1f} ms  snapshot file {from_snapshot * 1e3:7.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
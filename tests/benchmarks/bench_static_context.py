@@ -0,0 +1,78 @@
+# Benchmark: applying the client's static context (appName/environment) on every check.
+#
+# Compares copying the static context and updating it with the caller's context
+# (the previous behaviour), overlaying it with a ChainMap, and merging both
+# dictionaries in one step (the current behaviour).  Each includes evaluating a
+# feature whose constraint and rollout read the resulting context.
+#
+# Run with: make benchmark
+import timeit
+from collections import ChainMap
+
+from UnleashClient.features import Feature
+from UnleashClient.strategies import FlexibleRollout
+
+ITERATIONS = 100_000
+STATIC_CONTEXT = {"appName": "my-app", "environment": "production"}
+CONTEXT = {
+    "userId": "122",
+    "sessionId": "f5a2",
+    "remoteAddress": "69.208.0.1",
+    "properties": {"plan": "pro"},
+}
+
+
+def copy_update(context):
+    merged = STATIC_CONTEXT.copy()
+    merged.update(context)
+    return merged
+
+
+def chain_map(context):
+    return ChainMap({}, context, STATIC_CONTEXT)
+
+
+def merge(context):
+    return {**STATIC_CONTEXT, **context}
+
+
+def main() -> None:
+    feature = Feature(
+        "test",
+        True,
+        [
+            FlexibleRollout(
+                constraints=[
+                    {
+                        "contextName": "environment",
+                        "operator": "IN",
+                        "values": ["production"],
+                    }
+                ],
+                parameters={"rollout": 50, "stickiness": "default", "groupId": "g"},
+            )
+        ],
+    )
+    feature.compile()
+
+    print("Applying the static context per check")
+    for name, prepare in (
+        ("copy + update", copy_update),
+        ("ChainMap", chain_map),
+        ("merge", merge),
+    ):
+        assert feature.is_enabled(prepare(CONTEXT), skip_stats=True) == (
+            feature.is_enabled(copy_update(CONTEXT), skip_stats=True)
+        )
+        prepare_only = timeit.timeit(lambda p=prepare: p(CONTEXT), number=ITERATIONS)
+        with_check = timeit.timeit(
+            lambda p=prepare: feature.is_enabled(p(CONTEXT), skip_stats=True),
+            number=ITERATIONS,
+        )
+        print(
+            f"  {name:<14} {prepare_only / ITERATIONS * 1e6:5.2f} us/context  {with_check / ITERATIONS * 1e6:5.2f} us/check"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Benchmark: STR_CONTAINS / STR_STARTS_WITH / STR_ENDS_WITH constraints with many values.
+#
+# Compares the precompiled matcher with normalizing and checking every value on
+# each call (the previous behaviour).
+#
+# Run with: make benchmark
+import timeit
+
+from UnleashClient.constraints import Constraint
+
+ITERATIONS = 500
+CONTEXT_VALUE = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/120.0"
+
+
+def check_every_value(operator: str, values: list, context_value: str) -> bool:
+    normalized_values = [x.upper() for x in values]
+    normalized_context_value = context_value.upper()
+
+    if operator == "STR_CONTAINS":
+        return any([x in normalized_context_value for x in normalized_values])
+    if operator == "STR_STARTS_WITH":
+        return any([normalized_context_value.startswith(x) for x in normalized_values])
+    return any([normalized_context_value.endswith(x) for x in normalized_values])
+
+
+def main() -> None:
+    print("String constraint evaluation (case insensitive, no match)")
+    for size in (10, 1_000, 10_000):
+        values = [f"agent-{x}" for x in range(size)]
+
+        for operator in ("STR_CONTAINS", "STR_STARTS_WITH", "STR_ENDS_WITH"):
+            constraint = Constraint(
+                {
+                    "contextName": "userAgent",
+                    "operator": operator,
+                    "values": values,
+                    "caseInsensitive": True,
+                }
+            )
+            context = {"userAgent": CONTEXT_VALUE}
+            assert constraint.apply(context) == check_every_value(
+                operator, values, CONTEXT_VALUE
+            )
+
+            every_value = (
+                timeit.timeit(
+                    lambda o=operator, v=values: check_every_value(o, v, CONTEXT_VALUE),
+                    number=ITERATIONS,
+                )
+                / ITERATIONS
+            )
+            compiled = (
+                timeit.timeit(lambda c=constraint: c.apply(context), number=ITERATIONS)
+                / ITERATIONS
+            )
+            print(
+                f"  {operator:<16} {size:>6} values  every value {every_value * 1e6:10.2f} us/call  compiled {compiled * 1e6:6.2f} us/call"
+            )
+
+
+if __name__ == "__main__":
+    main()
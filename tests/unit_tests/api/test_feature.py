@@ -1,3 +1,7 @@
+import gzip
+import json
+
+import pytest
 import responses
 from pytest import mark, param
 
@@ -17,7 +21,8 @@ from tests.utilities.testing_constants import (
     REQUEST_TIMEOUT,
     URL,
 )
-from UnleashClient.api import get_feature_toggles
+from UnleashClient import utils
+from UnleashClient.api import create_session, get_feature_toggles
 from UnleashClient.constants import FEATURES_URL
 
 FULL_FEATURE_URL = URL + FEATURES_URL
@@ -156,3 +161,58 @@ def test_get_feature_toggle_retries():
     assert len(responses.calls) == 2
     assert len(result["features"]) == 1
     assert etag == ETAG_VALUE
+
+
+@responses.activate
+def test_get_feature_toggle_session():
+    responses.add(responses.GET, FULL_FEATURE_URL, json={}, status=500)
+
+    with create_session(REQUEST_RETRIES) as session:
+        session.headers["X-Session"] = "shared"
+        for _ in range(2):
+            (result, etag) = get_feature_toggles(
+                URL,
+                APP_NAME,
+                INSTANCE_ID,
+                CUSTOM_HEADERS,
+                CUSTOM_OPTIONS,
+                REQUEST_TIMEOUT,
+                REQUEST_RETRIES,
+                session=session,
+            )
+
+    # The session's retries apply, and every request is sent by the shared session.
+    assert len(responses.calls) == 2 * (REQUEST_RETRIES + 1)
+    assert all(x.request.headers["X-Session"] == "shared" for x in responses.calls)
+    assert not result
+
+
+@pytest.mark.parametrize("json_backend", ["orjson", "json"])
+@responses.activate
+def test_get_feature_toggle_gzip(json_backend, monkeypatch):
+    if json_backend == "json":
+        monkeypatch.setattr(utils, "orjson", None)
+        monkeypatch.setattr(utils, "ujson", None)
+    else:
+        pytest.importorskip(json_backend)
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        body=gzip.compress(json.dumps(MOCK_FEATURE_RESPONSE).encode()),
+        status=200,
+        headers={"Content-Encoding": "gzip", "etag": ETAG_VALUE},
+    )
+
+    (result, etag) = get_feature_toggles(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    assert "gzip" in responses.calls[0].request.headers["Accept-Encoding"]
+    assert result == MOCK_FEATURE_RESPONSE
+    assert etag == ETAG_VALUE
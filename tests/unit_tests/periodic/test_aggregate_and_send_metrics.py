@@ -16,6 +16,7 @@ from tests.utilities.testing_constants import (
 from UnleashClient.cache import FileCache
 from UnleashClient.constants import METRIC_LAST_SENT_TIME, METRICS_URL
 from UnleashClient.features import Feature
+from UnleashClient.features.unknown import UnknownFeatures
 from UnleashClient.periodic_tasks import aggregate_and_send_metrics
 from UnleashClient.strategies import Default, RemoteAddress
 from UnleashClient.variants import Variants
@@ -80,6 +81,45 @@ def test_aggregate_and_send_metrics():
     assert cache.get(METRIC_LAST_SENT_TIME) > start_time
 
 
+@responses.activate
+def test_aggregate_and_send_metrics_unknown_features():
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=200)
+
+    start_time = datetime.now(timezone.utc) - timedelta(seconds=60)
+    cache = FileCache("TestCache")
+    cache.set(METRIC_LAST_SENT_TIME, start_time)
+
+    my_feature1 = Feature("My Feature1", True, [Default()])
+    my_feature1.yes_count = 1
+    my_feature1.variant_counts = {"disabled": 1}
+
+    # Checked before it was fetched, so it was counted as unknown too.
+    unknown_features = UnknownFeatures()
+    unknown_features.get("My Feature1").get_variant({})
+    unknown_features.get("Unknown Feature").is_enabled({})
+
+    aggregate_and_send_metrics(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        {"My Feature1": my_feature1},
+        cache,
+        REQUEST_TIMEOUT,
+        unknown_features,
+    )
+
+    assert len(responses.calls) == 1
+    request = json.loads(responses.calls[0].request.body)
+
+    assert request["bucket"]["toggles"] == {
+        "My Feature1": {"yes": 1, "no": 1, "variants": {"disabled": 2}},
+        "Unknown Feature": {"yes": 0, "no": 1, "variants": {}},
+    }
+    assert unknown_features.get("Unknown Feature").no_count == 0
+
+
 @responses.activate
 def test_no_metrics():
     responses.add(responses.POST, FULL_METRICS_URL, json={}, status=200)
@@ -1,3 +1,6 @@
+import json
+from datetime import datetime, timezone
+
 import responses
 
 from tests.utilities.mocks.mock_features import (
@@ -17,9 +20,14 @@ from tests.utilities.testing_constants import (
     REQUEST_TIMEOUT,
     URL,
 )
+from UnleashClient import loader
+from UnleashClient.cache import BaseCache
 from UnleashClient.constants import ETAG, FEATURES_URL
 from UnleashClient.features import Feature
-from UnleashClient.periodic_tasks import fetch_and_load_features
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.loader import load_features
+from UnleashClient.periodic_tasks import fetch_and_load, fetch_and_load_features
+from UnleashClient.snapshot import SharedSnapshot
 
 FULL_FEATURE_URL = URL + FEATURES_URL
 
@@ -52,6 +60,174 @@ def test_fetch_and_load(cache_empty):  # noqa: F811
 
     assert isinstance(in_memory_features["testFlag"], Feature)
     assert temp_cache.get(ETAG) == ETAG_VALUE
+    # Cached as fetched, without re-serializing.
+    assert isinstance(temp_cache.get(FEATURES_URL), bytes)
+
+
+@responses.activate
+def test_fetch_and_load_parses_once(cache_empty, mocker):  # noqa: F811
+    features = FeatureStore()
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        json=MOCK_FEATURE_RESPONSE,
+        status=200,
+        headers={"etag": ETAG_VALUE},
+    )
+    fetch_loads = mocker.spy(fetch_and_load, "json_loads")
+    loader_loads = mocker.spy(loader, "json_loads")
+
+    fetch_and_load_features(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        cache_empty,
+        features,
+        DEFAULT_STRATEGY_MAPPING,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    assert isinstance(features["testFlag"], Feature)
+    assert fetch_loads.call_count == 1
+    assert loader_loads.call_count == 0
+
+    # Reloading the cached bytes is skipped, they're what was loaded.
+    snapshot = features.snapshot
+    load_features(cache_empty, features, DEFAULT_STRATEGY_MAPPING)
+    assert features.snapshot is snapshot
+    assert loader_loads.call_count == 0
+
+
+class JsonCache(BaseCache):
+    """
+    Custom cache that can only store JSON values.
+    """
+
+    def __init__(self):
+        self._data = {}
+
+    def set(self, key, value):
+        self._data[key] = json.dumps(value, default=lambda x: x.isoformat())
+
+    def mset(self, data):
+        for key, value in data.items():
+            self.set(key, value)
+
+    def get(self, key, default=None):
+        return json.loads(self._data[key]) if key in self._data else default
+
+    def exists(self, key):
+        return key in self._data
+
+    def destroy(self):
+        self._data = {}
+
+
+@responses.activate
+def test_fetch_and_load_json_cache():
+    cache = JsonCache()
+    cache.mset({ETAG: "", "last_sent": datetime.now(timezone.utc)})
+    features = FeatureStore()
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        json=MOCK_FEATURE_RESPONSE,
+        status=200,
+        headers={"etag": ETAG_VALUE},
+    )
+
+    fetch_and_load_features(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        cache,
+        features,
+        DEFAULT_STRATEGY_MAPPING,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    assert isinstance(features["testFlag"], Feature)
+    assert cache.get(FEATURES_URL) == MOCK_FEATURE_RESPONSE
+
+    # Features load from the cached provisioning too.
+    reloaded = FeatureStore()
+    load_features(cache, reloaded, DEFAULT_STRATEGY_MAPPING)
+    assert reloaded.keys() == features.keys()
+
+
+@responses.activate
+def test_fetch_and_load_not_modified(cache_empty):  # noqa: F811
+    features = FeatureStore()
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        json=MOCK_FEATURE_RESPONSE,
+        status=200,
+        headers={"etag": ETAG_VALUE},
+    )
+    responses.add(
+        responses.GET, FULL_FEATURE_URL, status=304, headers={"etag": ETAG_VALUE}
+    )
+    args = (
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        cache_empty,
+        features,
+        DEFAULT_STRATEGY_MAPPING,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    fetch_and_load_features(*args)
+    snapshot = features.snapshot
+    assert features.revision == ETAG_VALUE
+
+    # Would be loaded if the 304 response didn't skip reloading.
+    cache_empty.set(FEATURES_URL, MOCK_FEATURE_RESPONSE_PROJECT)
+    fetch_and_load_features(*args)
+
+    assert responses.calls[1].request.headers["If-None-Match"] == ETAG_VALUE
+    assert features.snapshot is snapshot
+    assert features.skipped_reloads == 1
+
+
+@responses.activate
+def test_fetch_and_load_invalid_json(cache_full):  # noqa: F811
+    features = FeatureStore()
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        body="{",
+        status=200,
+        headers={"etag": ETAG_VALUE},
+    )
+
+    fetch_and_load_features(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        cache_full,
+        features,
+        DEFAULT_STRATEGY_MAPPING,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    # The previously cached features are used instead.
+    assert "GradualRolloutUserID" in features
+    assert not cache_full.get(ETAG)
+    assert features.revision is None
 
 
 @responses.activate
@@ -121,3 +297,32 @@ def test_fetch_and_load_failure(cache_empty):  # noqa: F811
     )
 
     assert isinstance(in_memory_features["testFlag"], Feature)
+
+
+@responses.activate
+def test_fetch_and_load_shared_snapshot(cache_empty, tmpdir):  # noqa: F811
+    responses.add(
+        responses.GET,
+        FULL_FEATURE_URL,
+        json=MOCK_FEATURE_RESPONSE,
+        status=200,
+        headers={"etag": ETAG_VALUE},
+    )
+    shared_snapshot = SharedSnapshot(tmpdir.join("features.snapshot"))
+
+    fetch_and_load_features(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        cache_empty,
+        FeatureStore(),
+        DEFAULT_STRATEGY_MAPPING,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+        shared_snapshot=shared_snapshot,
+    )
+
+    assert shared_snapshot.generation == 1
+    assert shared_snapshot.open().to_dict() == MOCK_FEATURE_RESPONSE
@@ -0,0 +1,45 @@
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURES_WITH_SEGMENTS_RESPONSE,
+)
+from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING
+from UnleashClient.constants import FEATURES_URL
+from UnleashClient.features.store import FeatureStore
+from UnleashClient.periodic_tasks import load_shared_snapshot
+from UnleashClient.snapshot import SharedSnapshot
+
+
+def test_load_shared_snapshot(cache_empty, tmpdir):
+    path = tmpdir.join("features.snapshot")
+    publisher = SharedSnapshot(path)
+    shared_snapshot = SharedSnapshot(path)
+    features = FeatureStore()
+
+    # Until a snapshot is published, features are loaded from the cache.
+    cache_empty.set(FEATURES_URL, MOCK_FEATURE_RESPONSE)
+    load_shared_snapshot(
+        shared_snapshot, cache_empty, features, DEFAULT_STRATEGY_MAPPING
+    )
+    assert "testFlag" in features
+
+    publisher.publish(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE)
+    load_shared_snapshot(
+        shared_snapshot, cache_empty, features, DEFAULT_STRATEGY_MAPPING
+    )
+    assert "testFlag" not in features
+    assert "Test" in features
+    assert shared_snapshot.loaded_generation == 1
+
+    # Nothing is opened or loaded until the next publish.
+    snapshot = features.snapshot
+    load_shared_snapshot(
+        shared_snapshot, cache_empty, features, DEFAULT_STRATEGY_MAPPING
+    )
+    assert features.snapshot is snapshot
+
+    publisher.publish(MOCK_FEATURE_RESPONSE)
+    load_shared_snapshot(
+        shared_snapshot, cache_empty, features, DEFAULT_STRATEGY_MAPPING
+    )
+    assert "testFlag" in features
+    assert shared_snapshot.loaded_generation == 2
@@ -52,3 +52,8 @@ def test_flexiblerollout_does_not_satisfy_constraints_returns_default_variant(st
     print(result)
     assert not result.enabled
     assert result.variant is None
+
+
+def test_strategy_variants_are_built_once(strategy):
+    assert strategy.parsed_variants is strategy.parsed_variants
+    assert strategy.parsed_variants.group_id == "AB12A"
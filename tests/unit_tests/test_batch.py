@@ -0,0 +1,82 @@
+import pytest
+
+from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING
+from UnleashClient.features import Feature, batch
+from UnleashClient.loader import load_features
+from UnleashClient.strategies import Default, FlexibleRollout, Strategy
+
+CONTEXTS = [
+    {
+        "userId": str(x),
+        "sessionId": str(x),
+        "remoteAddress": "69.208.0.1",
+        "environment": "prod" if x % 2 else "dev",
+        "properties": {"customField": str(x)},
+    }
+    for x in range(200)
+] + [{}, {"userId": None}, {"sessionId": "1"}]
+
+
+class BrokenStrategy(Strategy):
+    def apply(self, context: dict = None) -> bool:
+        if context.get("userId") == "1":
+            raise ValueError("Oh no!")
+        return False
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "no-numpy"])
+def numpy_toggle(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "np", None)
+
+
+def test_evaluate_batch_matches_is_enabled(cache_full, numpy_toggle):
+    features = {}
+    load_features(cache_full, features, DEFAULT_STRATEGY_MAPPING)
+
+    for name, feature in features.items():
+        if name == "GradualRolloutRandom":
+            continue
+
+        expected = [feature.is_enabled(x, skip_stats=True) for x in CONTEXTS]
+        assert feature.evaluate_batch(CONTEXTS, skip_stats=True) == expected, name
+
+
+def test_evaluate_batch_custom_stickiness(numpy_toggle):
+    feature = Feature(
+        "test",
+        True,
+        [
+            FlexibleRollout(
+                [{"contextName": "environment", "operator": "IN", "values": ["prod"]}],
+                {"rollout": 50, "stickiness": "customField", "groupId": "test"},
+            ),
+            Default(),
+        ],
+    )
+
+    contexts = CONTEXTS + [{"environment": "prod"}]
+
+    expected = [feature.is_enabled(x, skip_stats=True) for x in contexts]
+    assert feature.evaluate_batch(contexts, skip_stats=True) == expected
+    # Contexts without the stickiness field fail and are disabled, not passed on to the Default strategy.
+    assert not expected[-1]
+
+
+def test_evaluate_batch_exception():
+    feature = Feature("test", True, [BrokenStrategy(), Default()])
+
+    results = feature.evaluate_batch([{"userId": "1"}, {"userId": "2"}])
+
+    assert results == [False, True]
+    assert feature.yes_count == 1
+    assert feature.no_count == 1
+
+
+def test_evaluate_batch_disabled_feature():
+    feature = Feature("test", False, [Default()])
+
+    assert feature.evaluate_batch([{}, {}]) == [False, False]
+    assert feature.no_count == 2
@@ -0,0 +1,37 @@
+from tests.utilities.mocks import MOCK_ALL_FEATURES
+from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING
+from UnleashClient.cache import MemoryCache
+from UnleashClient.constants import ETAG
+from UnleashClient.loader import load_features
+
+
+def test_memory_cache():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_ALL_FEATURES)
+    cache.mset({ETAG: "etag"})
+
+    assert cache.bootstrapped
+    assert cache.exists(ETAG)
+    assert cache.get("missing", "default") == "default"
+
+    features = {}
+    load_features(cache, features, DEFAULT_STRATEGY_MAPPING)
+    assert "GradualRolloutUserID" in features
+
+    cache.destroy()
+    assert not cache.exists(ETAG)
+
+
+def test_memory_cache_write_behind(tmpdir):
+    cache = MemoryCache("MemoryCacheTest", directory=str(tmpdir), write_interval=3600)
+    cache.set(ETAG, "etag")
+
+    # Nothing is written until the cache is flushed.
+    assert not MemoryCache("MemoryCacheTest", directory=str(tmpdir)).exists(ETAG)
+
+    cache.flush()
+    restarted_cache = MemoryCache("MemoryCacheTest", directory=str(tmpdir))
+    assert restarted_cache.get(ETAG) == "etag"
+
+    restarted_cache.destroy()
+    assert not MemoryCache("MemoryCacheTest", directory=str(tmpdir)).exists(ETAG)
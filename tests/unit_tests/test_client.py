@@ -1,4 +1,5 @@
 import json
+import os
 import time
 import warnings
 from pathlib import Path
@@ -36,9 +37,16 @@ from tests.utilities.testing_constants import (
     URL,
 )
 from UnleashClient import INSTANCES, UnleashClient
-from UnleashClient.cache import FileCache
-from UnleashClient.constants import FEATURES_URL, METRICS_URL, REGISTER_URL
+from UnleashClient.cache import FileCache, MemoryCache
+from UnleashClient.constants import (
+    DISABLED_VARIATION,
+    FEATURES_URL,
+    METRICS_URL,
+    REGISTER_URL,
+)
+from UnleashClient.context import UnleashContext
 from UnleashClient.events import UnleashEvent, UnleashEventType
+from UnleashClient.features.store import FeatureSnapshot
 from UnleashClient.strategies import Strategy
 from UnleashClient.utils import InstanceAllowType
 
@@ -126,8 +134,8 @@ def unleash_client_toggle_only(cache):
 
 
 @pytest.fixture()
-def unleash_client_bootstrap_dependencies():
-    cache = FileCache("MOCK_CACHE")
+def unleash_client_bootstrap_dependencies(tmpdir):
+    cache = FileCache("MOCK_CACHE", directory=str(tmpdir))
     cache.bootstrap_from_dict(MOCK_FEATURE_WITH_DEPENDENCIES_RESPONSE)
     unleash_client = UnleashClient(
         url=URL,
@@ -139,6 +147,7 @@ def unleash_client_bootstrap_dependencies():
     )
     unleash_client.initialize_client(fetch_toggles=False)
     yield unleash_client
+    unleash_client.unleash_scheduler.shutdown()
 
 
 def test_UC_initialize_default():
@@ -239,6 +248,151 @@ def test_uc_is_enabled(unleash_client):
     assert unleash_client.is_enabled("testFlag")
 
 
+@responses.activate
+def test_uc_shared_snapshot(tmpdir):
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    shared_snapshot = str(tmpdir.join("features.snapshot"))
+    publisher = UnleashClient(
+        URL,
+        APP_NAME,
+        disable_registration=True,
+        disable_metrics=True,
+        cache=MemoryCache(),
+        shared_snapshot=shared_snapshot,
+    )
+    worker = UnleashClient(
+        URL,
+        APP_NAME,
+        disable_registration=True,
+        disable_metrics=True,
+        cache=MemoryCache(),
+        shared_snapshot=shared_snapshot,
+    )
+
+    publisher.initialize_client()
+    worker.initialize_client(fetch_toggles=False)
+
+    # The worker loads the features fetched by the publisher, without fetching them itself.
+    assert worker.is_enabled("testFlag")
+    assert len(responses.calls) == 1
+
+    publisher.destroy()
+    worker.destroy()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs os.fork")
+def test_uc_fork():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        disable_registration=True,
+        cache=cache,
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+    assert unleash_client.is_enabled("testFlag")
+    scheduler = unleash_client.unleash_scheduler
+    session = unleash_client.session
+
+    pid = os.fork()
+    if pid == 0:
+        # Exit code is the number of failed checks.
+        checks = [
+            unleash_client.features["testFlag"].yes_count == 0,
+            unleash_client.unleash_instance_id
+            == f"unleash-client-python-{os.getpid()}",
+            unleash_client.session is not session,
+            unleash_client.unleash_scheduler is not scheduler,
+            unleash_client.unleash_scheduler.running,
+            len(unleash_client.unleash_scheduler.get_jobs()) == 2,
+            unleash_client.is_enabled("testFlag"),
+        ]
+        os._exit(checks.count(False))
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert unleash_client.features["testFlag"].yes_count == 1
+    assert unleash_client.unleash_instance_id == "unleash-client-python"
+
+    unleash_client.destroy()
+
+
+def test_uc_builtin_scheduler():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        refresh_interval=1,
+        disable_registration=True,
+        disable_metrics=True,
+        cache=cache,
+        builtin_scheduler=True,
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+    assert unleash_client.is_enabled("testFlag")
+
+    # Features are reloaded from the cache by the scheduler.
+    cache.bootstrap_from_dict(MOCK_FEATURE_WITH_DEPENDENCIES_RESPONSE)
+    time.sleep(1.5)
+    assert "testFlag" not in unleash_client.features
+
+    unleash_client.destroy()
+    assert not unleash_client.unleash_scheduler.running
+
+
+def test_uc_builtin_scheduler_with_custom_scheduler():
+    with pytest.raises(ValueError):
+        UnleashClient(
+            URL,
+            APP_NAME,
+            scheduler=BackgroundScheduler(),
+            scheduler_executor="default",
+            builtin_scheduler=True,
+        )
+
+
+ENVIRONMENT_CONSTRAINT_PROVISIONING = {
+    "version": 1,
+    "features": [
+        {
+            "name": "prodOnly",
+            "enabled": True,
+            "strategies": [
+                {
+                    "name": "default",
+                    "parameters": {},
+                    "constraints": [
+                        {
+                            "contextName": "environment",
+                            "operator": "IN",
+                            "values": ["prod"],
+                        }
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+
+def test_uc_static_context_precedence():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(ENVIRONMENT_CONSTRAINT_PROVISIONING)
+    unleash_client = UnleashClient(URL, APP_NAME, environment="prod", cache=cache)
+
+    # The context wins in is_enabled, the client's static values win in get_variant.
+    for context in ({"environment": "dev"}, UnleashContext(environment="dev")):
+        assert not unleash_client.is_enabled("prodOnly", context)
+        assert unleash_client.get_variant("prodOnly", context)["feature_enabled"]
+        assert unleash_client.evaluate_all(context) == {
+            "prodOnly": unleash_client.get_variant("prodOnly", context)
+        }
+
+
 @responses.activate
 def test_consistent_results(unleash_client):
     responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
@@ -409,6 +563,28 @@ def test_uc_dependency(unleash_client_bootstrap_dependencies):
     assert not unleash_client.is_enabled("TransitiveDependency")
 
 
+def test_uc_dependency_single_snapshot(unleash_client_bootstrap_dependencies, mocker):
+    unleash_client = unleash_client_bootstrap_dependencies
+    features = unleash_client.features.snapshot.features
+    child, parent = features["Child"], features["Parent"]
+
+    def publish_empty(original):
+        def wrapper(*args, **kwargs):
+            unleash_client.features.publish(FeatureSnapshot({}, {}))
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    # A reload publishing mid-call doesn't affect dependencies of the feature being evaluated.
+    mocker.patch.object(child, "is_enabled", publish_empty(child.is_enabled))
+    assert unleash_client.is_enabled("Child")
+
+    unleash_client.features.publish(FeatureSnapshot(features, {}))
+    mocker.patch.object(parent, "get_variant", publish_empty(parent.get_variant))
+    results = unleash_client.evaluate_many(["Parent", "Child"])
+    assert results["Child"]["feature_enabled"]
+
+
 @responses.activate
 def test_uc_get_variant():
     # Set up API
@@ -439,8 +615,8 @@ def test_uc_get_variant():
 
 
 @responses.activate
-def test_uc_get_variant_feature_enabled_no_variants():
-    cache = FileCache("MOCK_CACHE")
+def test_uc_get_variant_feature_enabled_no_variants(tmpdir):
+    cache = FileCache("MOCK_CACHE", directory=str(tmpdir))
     cache.bootstrap_from_dict(MOCK_FEATURE_ENABLED_NO_VARIANTS_RESPONSE)
     unleash_client = UnleashClient(
         url=URL,
@@ -461,6 +637,104 @@ def test_uc_get_variant_feature_enabled_no_variants():
     unleash_client.destroy()
 
 
+def test_uc_static_context_overlay(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+    seen_contexts = []
+
+    def fallback(feature_name, context):
+        seen_contexts.append(context)
+        return True
+
+    context = {"userId": "2", "environment": "custom"}
+    assert unleash_client.is_enabled("ThisFlagDoesn'tExist", context, fallback)
+    assert seen_contexts[0]["appName"] == APP_NAME
+    assert seen_contexts[0]["environment"] == "custom"
+
+    unleash_client.get_variant("Child", context)
+    assert context == {"userId": "2", "environment": "custom"}
+
+
+def test_uc_unleash_context(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+    context = UnleashContext(user_id="2")
+
+    assert unleash_client.is_enabled("Child", context) == unleash_client.is_enabled(
+        "Child", {"userId": "2"}
+    )
+    assert unleash_client.get_variant("Child", context) == unleash_client.get_variant(
+        "Child", {"userId": "2"}
+    )
+    # The client overlays its static values without changing the context.
+    assert "environment" not in context
+
+
+def test_uc_evaluate_all(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+    context = {"userId": "2"}
+
+    results = unleash_client.evaluate_all(context)
+
+    assert results.keys() == unleash_client.features.keys()
+    for feature_name, result in results.items():
+        assert result == unleash_client.get_variant(feature_name, context)
+        assert result["feature_enabled"] == unleash_client.is_enabled(
+            feature_name, context
+        )
+
+    # One evaluation per feature is counted, like a get_variant call.
+    child = unleash_client.features["Child"]
+    assert child.yes_count == 3
+    assert sum(child.variant_counts.values()) == 2
+
+
+def test_uc_evaluate_many(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+
+    results = unleash_client.evaluate_many(
+        ["Child", "ThisFlagDoesn'tExist"], UnleashContext(user_id="2")
+    )
+
+    assert results["Child"]["feature_enabled"]
+    assert results["ThisFlagDoesn'tExist"] == DISABLED_VARIATION
+    assert "ThisFlagDoesn'tExist" not in unleash_client.features
+    assert unleash_client._unknown_features.get("ThisFlagDoesn'tExist").no_count == 1
+    assert "ThisFlagDoesn'tExist" not in unleash_client.evaluate_all()
+
+
+def test_uc_is_enabled_batch(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+    contexts = [{"userId": str(x)} for x in range(25)]
+
+    for feature_name in ("Child", "WithDisabledDependency", "UnlistedDependency"):
+        expected = [unleash_client.is_enabled(feature_name, x) for x in contexts]
+        results = unleash_client.is_enabled_batch(
+            feature_name, iter(contexts), chunk_size=10
+        )
+        assert list(results) == expected
+
+    assert unleash_client.features["Child"].yes_count == 50
+
+    results = unleash_client.is_enabled_batch(
+        "ThisFlagDoesn'tExist", contexts, fallback_function=lambda x, y: True
+    )
+    assert all(results)
+
+
+def test_uc_unknown_features_bounded(unleash_client_bootstrap_dependencies):
+    unleash_client = unleash_client_bootstrap_dependencies
+    known_features = set(unleash_client.features)
+    unleash_client._unknown_features.max_size = 10
+
+    for x in range(100):
+        assert not unleash_client.is_enabled(f"Unknown{x}")
+        assert not unleash_client.get_variant(f"Unknown{x}")["enabled"]
+
+    assert set(unleash_client.features) == known_features
+    unknown_features = unleash_client._unknown_features.values()
+    assert [x.name for x in unknown_features] == [f"Unknown{x}" for x in range(90, 100)]
+    assert unknown_features[-1].no_count == 2
+
+
 @responses.activate
 def test_uc_not_initialized_getvariant():
     unleash_client = UnleashClient(URL, APP_NAME)
@@ -470,6 +744,14 @@ def test_uc_not_initialized_getvariant():
     assert not variant["feature_enabled"]
 
 
+def test_uc_not_initialized_evaluate():
+    unleash_client = UnleashClient(URL, APP_NAME)
+    assert unleash_client.evaluate_all() == {}
+    assert unleash_client.evaluate_many(["ThisFlagDoesn'tExist"]) == {
+        "ThisFlagDoesn'tExist": DISABLED_VARIATION
+    }
+
+
 @responses.activate
 def test_uc_metrics(unleash_client):
     # Set up API
@@ -0,0 +1,110 @@
+import pytest
+
+from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING, IP_LIST
+from UnleashClient.features import Feature
+from UnleashClient.features.compiler import compile_strategies
+from UnleashClient.loader import load_features
+from UnleashClient.strategies import (
+    Default,
+    EvaluationResult,
+    FlexibleRollout,
+    RemoteAddress,
+    Strategy,
+)
+
+CONSTRAINTS = [
+    {"contextName": "appVersion", "operator": "SEMVER_GT", "value": "1.0.0"},
+    {"contextName": "userId", "operator": "STR_STARTS_WITH", "values": ["1"]},
+    {"contextName": "environment", "operator": "IN", "values": ["prod"]},
+]
+
+
+class OpaqueStrategy(Strategy):
+    def get_result(self, context) -> EvaluationResult:
+        return EvaluationResult(context.get("opaque", False), None)
+
+
+class BrokenStrategy(Strategy):
+    def apply(self, context: dict = None) -> bool:
+        raise ValueError("Oh no!")
+
+
+@pytest.fixture()
+def rollout_strategy():
+    yield FlexibleRollout(
+        CONSTRAINTS, {"rollout": 100, "stickiness": "userId", "groupId": "AB12A"}
+    )
+
+
+def test_compile_strategies_no_strategies():
+    plan = compile_strategies([])
+
+    assert plan({}).enabled
+
+
+def test_compile_strategies_orders_constraints_by_cost(rollout_strategy, mocker):
+    semver_check = mocker.spy(rollout_strategy._parsed_constraints[0], "apply")
+    plan = compile_strategies([rollout_strategy])
+
+    context = {"userId": "122", "environment": "dev", "appVersion": "2.0.0"}
+    assert not plan(context).enabled
+    assert semver_check.call_count == 0
+
+    context["environment"] = "prod"
+    assert plan(context).enabled
+    assert semver_check.call_count == 1
+
+
+def test_compile_strategies_first_enabled_strategy_wins(rollout_strategy):
+    plan = compile_strategies(
+        [RemoteAddress(parameters={"IPs": IP_LIST}), rollout_strategy, Default()]
+    )
+
+    result = plan({"userId": "2", "remoteAddress": "1.1.1.1"})
+    assert result.enabled
+    assert result.variant["name"] == "disabled"
+
+
+def test_compile_strategies_calls_custom_get_result():
+    plan = compile_strategies([OpaqueStrategy()])
+
+    assert plan({"opaque": True}).enabled
+    assert not plan({}).enabled
+
+
+def test_compiled_feature_matches_interpreted(cache_full):
+    features = {}
+    load_features(cache_full, features, DEFAULT_STRATEGY_MAPPING)
+    contexts = [
+        {"userId": str(x), "sessionId": str(x), "remoteAddress": "69.208.0.1"}
+        for x in range(100)
+    ]
+
+    for name, feature in features.items():
+        if name in ("GradualRolloutRandom", "Garbage"):
+            continue
+
+        assert feature.evaluation_plan is not None
+        interpreted = Feature(
+            feature.name, feature.enabled, feature.strategies, feature.variants
+        )
+        for context in contexts:
+            assert feature.is_enabled(context) == interpreted.is_enabled(context)
+            assert feature.get_variant(context) == interpreted.get_variant(context)
+
+
+def test_load_features_without_compilation(cache_full):
+    features = {}
+    load_features(
+        cache_full, features, DEFAULT_STRATEGY_MAPPING, compile_features=False
+    )
+
+    assert all(x.evaluation_plan is None for x in features.values())
+    assert features["Default"].is_enabled({})
+
+
+def test_compiled_feature_exception():
+    feature = Feature("My Feature", True, [BrokenStrategy(), Default()])
+    feature.compile()
+
+    assert not feature.is_enabled({})
@@ -2,9 +2,11 @@ from datetime import datetime
 
 import pytest
 import pytz
+from dateutil.parser import parse
 
 from tests.utilities.mocks import mock_constraints
 from UnleashClient.constraints import Constraint
+from UnleashClient.constraints.Constraint import parse_date, parse_semver
 
 
 @pytest.fixture()
@@ -222,3 +224,103 @@ def test_constraints_semverexception():
     constraint = Constraint(constraint_dict=mock_constraints.CONSTRAINT_SEMVER_EQ)
 
     assert not constraint.apply({"customField": "hamstershamsterhamsters"})
+
+
+def test_constraint_IN_uses_set(constraint_IN):
+    assert constraint_IN.values_set == frozenset(["test", "test2"])
+
+
+def test_constraint_IN_case_sensitive():
+    constraint = Constraint(
+        {**mock_constraints.CONSTRAINT_DICT_IN, "caseInsensitive": True}
+    )
+
+    assert constraint.apply({"appName": "test"})
+    assert not constraint.apply({"appName": "TEST"})
+
+
+def test_constraint_IN_unhashable_context(constraint_IN, constraint_NOTIN):
+    assert not constraint_IN.apply({"appName": ["test"]})
+    assert constraint_NOTIN.apply({"appName": ["test"]})
+
+
+def test_constraint_STR_many_values():
+    values = [f"agent-{x}" for x in range(5000)] + ["chrome"]
+
+    for operator, context_value in (
+        ("STR_CONTAINS", "Mozilla CHROME 120"),
+        ("STR_STARTS_WITH", "Chrome 120"),
+        ("STR_ENDS_WITH", "Mozilla/Chrome"),
+    ):
+        constraint = Constraint(
+            {
+                "contextName": "userAgent",
+                "operator": operator,
+                "values": values,
+                "caseInsensitive": True,
+            }
+        )
+        assert constraint.apply({"userAgent": context_value})
+        assert not constraint.apply({"userAgent": "Mozilla Firefox"})
+
+
+def test_constraint_STR_regex_characters():
+    constraint = Constraint(
+        {
+            "contextName": "customField",
+            "operator": "STR_CONTAINS",
+            "values": [".*", "a|b"],
+        }
+    )
+
+    assert constraint.apply({"customField": "xa|bx"})
+    assert not constraint.apply({"customField": "ab"})
+
+
+def test_constraint_STR_non_string_values():
+    constraint = Constraint(
+        {"contextName": "customField", "operator": "STR_CONTAINS", "values": ["a", 1]}
+    )
+
+    assert not constraint.apply({"customField": "abc"})
+
+
+def test_constraints_DATE_context_string():
+    constraint = Constraint(constraint_dict=mock_constraints.CONSTRAINT_DATE_AFTER)
+
+    assert constraint.apply({"currentTime": "2022-01-23T00:00:00.000Z"})
+    assert constraint.apply({"currentTime": "2022-01-23T01:00:00+01:00"})
+    assert not constraint.apply({"currentTime": "2022-01-21T00:00:00Z"})
+    assert not constraint.apply({"currentTime": "not a date"})
+
+
+def test_constraints_DATE_parsed_once(mocker):
+    parse_spy = mocker.patch(
+        "UnleashClient.constraints.Constraint.parse", side_effect=parse
+    )
+    parse_date.cache_clear()
+    constraint = Constraint(constraint_dict=mock_constraints.CONSTRAINT_DATE_AFTER)
+
+    for _ in range(3):
+        assert constraint.apply({"currentTime": "2022-01-23T00:00:00.000Z"})
+        assert constraint.apply({"currentTime": "Jan 24 2022 10:00:00 +0000"})
+
+    # ISO dates skip dateutil, everything else is only parsed once.
+    assert parse_spy.call_count == 1
+
+
+def test_constraints_SEMVER_parsed_once():
+    parse_semver.cache_clear()
+    constraints = [
+        Constraint(constraint_dict=mock_constraints.CONSTRAINT_SEMVER_EQ),
+        Constraint(constraint_dict=mock_constraints.CONSTRAINT_SEMVER_GT),
+        Constraint(constraint_dict=mock_constraints.CONSTRAINT_SEMVER_LT),
+    ]
+
+    for _ in range(3):
+        for constraint in constraints:
+            constraint.apply({"customField": "1.2.3"})
+
+    # The shared target version plus a single context version.
+    assert parse_semver.cache_info().currsize == 2
+    assert parse_semver.cache_info().misses == 2
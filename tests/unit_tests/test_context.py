@@ -0,0 +1,115 @@
+from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING
+from UnleashClient.context import UnleashContext, context_hash, context_identifier
+from UnleashClient.loader import load_features
+from UnleashClient.utils import get_identifier, normalized_hash
+
+
+def test_context_mapping():
+    context = UnleashContext(user_id="1", properties={"customField": "a"})
+
+    assert context["userId"] == "1"
+    assert context["properties"]["customField"] == "a"
+    assert "sessionId" not in context
+    assert context.get("sessionId") is None
+    assert dict(context) == {"userId": "1", "properties": {"customField": "a"}}
+
+
+def test_context_static_values():
+    context = UnleashContext(user_id="1", environment="staging")
+    bound = context.bind_static_context({"appName": "my-app", "environment": "prod"})
+
+    assert bound["appName"] == "my-app"
+    assert bound["environment"] == "staging"
+    assert len(bound) == 3
+    assert "appName" not in context
+
+
+def test_context_hash_memoized(mocker):
+    hash_spy = mocker.patch(
+        "UnleashClient.context.normalized_hash", side_effect=normalized_hash
+    )
+    context = UnleashContext(user_id="122")
+
+    for _ in range(3):
+        assert context_hash(context, "122", "AB12A") == normalized_hash("122", "AB12A")
+    assert context_hash(context, "122", "AB12B") == normalized_hash("122", "AB12B")
+    assert hash_spy.call_count == 2
+
+    assert context_hash({}, "122", "AB12A") == normalized_hash("122", "AB12A")
+    assert hash_spy.call_count == 3
+
+
+def test_context_matches_dict(cache_full):
+    features = {}
+    load_features(cache_full, features, DEFAULT_STRATEGY_MAPPING)
+
+    for x in range(50):
+        context = {
+            "userId": str(x),
+            "sessionId": str(x),
+            "remoteAddress": "69.208.0.1",
+            "properties": {"customField": str(x)},
+        }
+        unleash_context = UnleashContext.from_dict(context)
+        none_context = {**context, "userId": None}
+        unleash_none_context = UnleashContext.from_dict(none_context)
+
+        for name, feature in features.items():
+            if name in ("GradualRolloutRandom", "Garbage"):
+                continue
+
+            assert feature.is_enabled(unleash_context) == feature.is_enabled(context)
+            assert feature.get_variant(unleash_context) == feature.get_variant(context)
+            assert feature.is_enabled(unleash_none_context) == feature.is_enabled(
+                none_context
+            )
+
+
+def test_context_static_values_first():
+    context = UnleashContext(user_id="1", environment="staging")
+    static_context = {"appName": "my-app", "environment": "prod"}
+    static_first = context.bind_static_context(static_context, static_first=True)
+    context_first = context.bind_static_context(static_context)
+
+    # Views bound with different precedence don't affect each other.
+    assert static_first["environment"] == "prod"
+    assert context_first["environment"] == "staging"
+    assert static_first["userId"] == "1"
+    assert len(static_first) == 3
+    assert context["environment"] == "staging"
+
+
+def test_context_bound_writes():
+    context = UnleashContext(user_id="1")
+    bound = context.bind_static_context({"appName": "my-app"})
+
+    bound["seen"] = True
+    bound["userId"] = "2"
+
+    assert bound["seen"]
+    assert bound["userId"] == "2"
+    assert bound.identifier("userId") == "2"
+    assert dict(bound) == {"userId": "2", "appName": "my-app", "seen": True}
+    assert dict(context) == {"userId": "1"}
+    assert "seen" not in context.bind_static_context({"appName": "my-app"})
+
+
+def test_context_identifier_memoized(mocker):
+    identifier_spy = mocker.patch(
+        "UnleashClient.context.get_identifier", side_effect=get_identifier
+    )
+    context = UnleashContext(user_id="1", properties={"plan": "pro"})
+
+    for _ in range(3):
+        bound = context.bind_static_context({"environment": "prod"})
+        assert context_identifier("plan", bound) == "pro"
+        assert context_identifier("userId", bound) == "1"
+        assert context_identifier("environment", bound) == "prod"
+    assert identifier_spy.call_count == 2 + 3
+
+
+def test_context_from_dict_keeps_none():
+    context = UnleashContext.from_dict({"userId": None})
+
+    assert "userId" in context
+    assert context["userId"] is None
@@ -4,7 +4,9 @@ from tests.utilities.mocks import MOCK_CUSTOM_STRATEGY
 from tests.utilities.old_code.StrategyV2 import StrategyOldV2
 from tests.utilities.testing_constants import APP_NAME, URL
 from UnleashClient import UnleashClient
+from UnleashClient.cache import FileCache
 from UnleashClient.constants import FEATURES_URL, METRICS_URL, REGISTER_URL
+from UnleashClient.context import UnleashContext
 from UnleashClient.strategies import Strategy
 
 
@@ -107,3 +109,83 @@ def test_uc_customstrategy_safemulti():
 
     # Check a toggle that contains an outdated custom strategy and a default strategy.
     assert unleash_client.is_enabled("CustomToggleWarningMultiStrat", {"sound": "meow"})
+
+
+class ContextWriter(Strategy):
+    def apply(self, context: dict = None) -> bool:
+        """
+        Turn on unless an earlier check leaked into this context.
+
+        :return:
+        """
+        leaked = "seen" in context
+        context["seen"] = context.get("userId")
+        return not leaked
+
+
+def test_uc_customstrategy_context_writes(tmpdir):
+    cache = FileCache("MOCK_CACHE", directory=str(tmpdir))
+    cache.bootstrap_from_dict(
+        {
+            "version": 1,
+            "features": [
+                {
+                    "name": "writesContext",
+                    "enabled": True,
+                    "strategies": [{"name": "contextWriter", "parameters": {}}],
+                }
+            ],
+        }
+    )
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        cache=cache,
+        custom_strategies={"contextWriter": ContextWriter},
+    )
+
+    context = {"userId": "1"}
+    assert unleash_client.is_enabled("writesContext", context)
+    assert context == {"userId": "1"}
+
+    assert unleash_client.get_variant("writesContext", context)["feature_enabled"]
+    assert context == {"userId": "1"}
+    assert "seen" not in unleash_client.unleash_static_context
+
+    assert unleash_client.is_enabled("writesContext", {"userId": "2"})
+    assert unleash_client.get_variant("writesContext", {"userId": "2"})[
+        "feature_enabled"
+    ]
+
+
+def test_uc_customstrategy_context_writes_evaluate_all(tmpdir):
+    cache = FileCache("MOCK_CACHE", directory=str(tmpdir))
+    cache.bootstrap_from_dict(
+        {
+            "version": 1,
+            "features": [
+                {
+                    "name": name,
+                    "enabled": True,
+                    "strategies": [{"name": "contextWriter", "parameters": {}}],
+                }
+                for name in ("writesContext", "alsoWritesContext")
+            ],
+        }
+    )
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        cache=cache,
+        custom_strategies={"contextWriter": ContextWriter},
+    )
+
+    for context in ({"userId": "1"}, UnleashContext(user_id="1")):
+        results = unleash_client.evaluate_all(context)
+
+        assert results["writesContext"]["feature_enabled"]
+        assert results["alsoWritesContext"]["feature_enabled"]
+        assert results["writesContext"] == unleash_client.get_variant(
+            "writesContext", context
+        )
+        assert "seen" not in context
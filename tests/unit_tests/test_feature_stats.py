@@ -0,0 +1,98 @@
+import threading
+
+from tests.utilities.mocks.mock_variants import VARIANTS
+from UnleashClient.features import Feature
+from UnleashClient.strategies import Default
+from UnleashClient.variants import Variants
+
+THREAD_COUNT = 16
+ITERATIONS = 2000
+
+
+def test_feature_stats_collect():
+    feature = Feature("test", True, [Default()])
+
+    feature.is_enabled({})
+    feature.get_variant({})
+
+    assert feature.collect_stats() == (2, 0, {"disabled": 1})
+    assert feature.collect_stats() == (0, 0, {})
+
+    feature.yes_count = 5
+    feature.is_enabled({})
+    assert feature.yes_count == 6
+
+
+def test_feature_stats_finished_threads():
+    feature = Feature("test", False, [])
+
+    for _ in range(10):
+        thread = threading.Thread(target=feature.is_enabled, args=({},))
+        thread.start()
+        thread.join()
+
+    assert feature.no_count == 10
+    assert feature.collect_stats() == (0, 10, {})
+    assert not feature.stats._shards
+
+
+def test_feature_stats_short_lived_threads():
+    feature = Feature("test", False, [])
+    stats = feature.stats
+    shard_counts = []
+
+    for _ in range(200):
+        thread = threading.Thread(target=feature.is_enabled, args=({},))
+        thread.start()
+        thread.join()
+        shard_counts.append(
+            len(stats._shards) + len(stats._new_shards) + len(stats._finished_shards)
+        )
+
+    # Shards of finished threads are folded by the next thread, not kept until collected.
+    assert max(shard_counts) <= 2
+    assert feature.collect_stats() == (0, 200, {})
+
+
+def test_feature_stats_new_thread_lock_free():
+    feature = Feature("test", False, [])
+
+    with feature.stats._lock:
+        thread = threading.Thread(target=feature.is_enabled, args=({},))
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    assert feature.no_count == 1
+
+
+def test_feature_stats_threaded():
+    feature = Feature("test", True, [Default()], variants=Variants(VARIANTS, "test"))
+    done = threading.Event()
+    collected = []
+
+    def evaluate():
+        for x in range(ITERATIONS):
+            feature.is_enabled({"userId": str(x)})
+            feature.get_variant({"userId": str(x)})
+            feature.evaluate_batch([{}, {}])
+
+    def collect():
+        while not done.is_set():
+            collected.append(feature.collect_stats())
+
+    collector = threading.Thread(target=collect)
+    collector.start()
+    threads = [threading.Thread(target=evaluate) for _ in range(THREAD_COUNT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    collector.join()
+    collected.append(feature.collect_stats())
+
+    evaluations = THREAD_COUNT * ITERATIONS
+    assert sum(x[0] for x in collected) == 4 * evaluations
+    assert sum(x[1] for x in collected) == 0
+    assert sum(sum(x[2].values()) for x in collected) == evaluations
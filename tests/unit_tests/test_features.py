@@ -1,8 +1,11 @@
+import logging
+
 import pytest
 
 from tests.utilities import generate_email_list
 from tests.utilities.mocks.mock_variants import VARIANTS, VARIANTS_WITH_STICKINESS
 from tests.utilities.testing_constants import IP_LIST
+from UnleashClient import utils
 from UnleashClient.features import Feature
 from UnleashClient.strategies import Default, FlexibleRollout, RemoteAddress, UserWithId
 from UnleashClient.variants import Variants
@@ -192,3 +195,14 @@ def test_dependencies(test_feature_dependencies):
     assert all("enabled" in item for item in test_feature_dependencies.dependencies)
     # if no enabled key is provided, it should default to True
     assert test_feature_dependencies.dependencies[0]["enabled"]
+
+
+def test_trace_evaluations(caplog, monkeypatch):
+    caplog.set_level(logging.DEBUG, logger="UnleashClient")
+
+    Feature("Untraced", True, [Default()]).is_enabled({})
+    assert "Untraced evaluation result" not in caplog.text
+
+    monkeypatch.setattr(utils, "TRACE_EVALUATIONS", True)
+    Feature("Traced", True, [Default()]).is_enabled({})
+    assert "Traced evaluation result" in caplog.text
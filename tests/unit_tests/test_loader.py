@@ -1,10 +1,15 @@
 import copy
 
 from tests.utilities.mocks import MOCK_ALL_FEATURES
+from tests.utilities.mocks.mock_features import MOCK_FEATURES_WITH_SEGMENTS_RESPONSE
 from tests.utilities.testing_constants import DEFAULT_STRATEGY_MAPPING
+from UnleashClient import utils
+from UnleashClient.cache import FileCache
 from UnleashClient.constants import FAILED_STRATEGIES, FEATURES_URL
 from UnleashClient.features import Feature
+from UnleashClient.features.store import FeatureStore
 from UnleashClient.loader import load_features
+from UnleashClient.snapshot import write_snapshot
 from UnleashClient.strategies import FlexibleRollout, GradualRolloutUserId, UserWithId
 from UnleashClient.variants import Variants
 
@@ -101,3 +106,125 @@ def test_loader_segments(cache_segments):
     feature = in_memory_features["Test"]
     loaded_constraints = list(feature.strategies[0].parsed_constraints)
     assert len(loaded_constraints) == 2
+
+
+def test_loader_segments_constraints_are_precompiled(cache_segments):
+    in_memory_features = {}
+    load_features(cache_segments, in_memory_features, DEFAULT_STRATEGY_MAPPING)
+    strategy = in_memory_features["Test"].strategies[0]
+
+    first_pass = list(strategy.parsed_constraints)
+    strategy.execute({"userId": "1"})
+    second_pass = list(strategy.parsed_constraints)
+
+    assert all(x is y for x, y in zip(first_pass, second_pass))
+
+
+def test_loader_missing_segment(cache_segments):
+    mock_updated = copy.deepcopy(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE)
+    mock_updated["features"][0]["strategies"][0]["segments"] = [1, 404]
+    cache_segments.set(FEATURES_URL, mock_updated)
+
+    in_memory_features = {}
+    load_features(cache_segments, in_memory_features, DEFAULT_STRATEGY_MAPPING)
+    strategy = in_memory_features["Test"].strategies[0]
+
+    assert len(list(strategy.parsed_constraints)) == 2
+    assert not in_memory_features["Test"].is_enabled({"userId": "1"})
+
+
+def test_loader_feature_store(cache_full):
+    features = FeatureStore()
+    load_features(cache_full, features, DEFAULT_STRATEGY_MAPPING)
+    previous_snapshot = features.snapshot
+    previous_feature = features["GradualRolloutUserID"]
+    previous_feature.is_enabled({"userId": "1"})
+
+    mock_updated = copy.deepcopy(MOCK_ALL_FEATURES)
+    mock_updated["features"][4]["strategies"][0]["parameters"]["percentage"] = 60
+    del mock_updated["features"][0]
+    cache_full.set(FEATURES_URL, mock_updated)
+    load_features(cache_full, features, DEFAULT_STRATEGY_MAPPING)
+
+    # The previous snapshot is left as it was, for readers that are still using it.
+    assert features.snapshot is not previous_snapshot
+    assert len(features) == len(previous_snapshot.features) - 1
+    assert previous_feature.strategies[0].parameters["percentage"] == 50
+
+    feature = features["GradualRolloutUserID"]
+    assert feature.strategies[0].parameters["percentage"] == 60
+    assert feature.yes_count + feature.no_count == 1
+
+
+def test_loader_feature_store_incremental(cache_segments):
+    features = FeatureStore()
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+    previous_snapshot = features.snapshot
+
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+    assert features.snapshot is previous_snapshot
+
+    mock_updated = copy.deepcopy(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE)
+    mock_updated["features"].append({"name": "New", "enabled": True, "strategies": []})
+    cache_segments.set(FEATURES_URL, mock_updated)
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+
+    assert features.snapshot is not previous_snapshot
+    assert features["Test"] is previous_snapshot.features["Test"]
+    assert features["New"].is_enabled({})
+
+    # Features are rebuilt when a segment they use changes.
+    mock_updated["segments"][0]["constraints"][0]["values"] = ["other"]
+    cache_segments.set(FEATURES_URL, mock_updated)
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+
+    assert features["Test"] is not previous_snapshot.features["Test"]
+
+
+def test_loader_feature_store_settings_changed(cache_segments, monkeypatch):
+    features = FeatureStore()
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+    previous_snapshot = features.snapshot
+    assert features["Test"].evaluation_plan is not None
+
+    # Unchanged features are rebuilt when they'd be built differently.
+    load_features(
+        cache_segments, features, DEFAULT_STRATEGY_MAPPING, compile_features=False
+    )
+    assert features["Test"] is not previous_snapshot.features["Test"]
+    assert features["Test"].evaluation_plan is None
+
+    monkeypatch.setattr(utils, "TRACE_EVALUATIONS", True)
+    mock_updated = copy.deepcopy(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE)
+    mock_updated["features"].append({"name": "New", "enabled": True, "strategies": []})
+    cache_segments.set(FEATURES_URL, mock_updated)
+    load_features(cache_segments, features, DEFAULT_STRATEGY_MAPPING)
+
+    assert features["Test"].evaluation_plan is not None
+    assert features["Test"].trace_evaluations
+
+
+def test_loader_snapshot_file(tmpdir):
+    write_snapshot(
+        MOCK_FEATURES_WITH_SEGMENTS_RESPONSE, tmpdir.join("features.snapshot")
+    )
+    cache = FileCache("MOCK_CACHE", directory=str(tmpdir))
+    cache.bootstrap_from_snapshot(tmpdir.join("features.snapshot"))
+
+    features = FeatureStore()
+    load_features(cache, features, DEFAULT_STRATEGY_MAPPING)
+    previous_snapshot = features.snapshot
+
+    # Features are only built when they're looked up.
+    assert "Test" in features
+    assert not features.loaded_values()
+    assert not features["Test"].is_enabled({"userId": "1"})
+    assert features.loaded_values() == [features["Test"]]
+
+    load_features(cache, features, DEFAULT_STRATEGY_MAPPING)
+    assert features.snapshot is previous_snapshot
+
+    # Metrics of built features are carried over when the provisioning is fetched.
+    cache.set(FEATURES_URL, MOCK_FEATURES_WITH_SEGMENTS_RESPONSE)
+    load_features(cache, features, DEFAULT_STRATEGY_MAPPING)
+    assert features["Test"].no_count == 1
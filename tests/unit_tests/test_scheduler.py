@@ -0,0 +1,60 @@
+import threading
+import time
+
+from UnleashClient.scheduler import IntervalScheduler
+
+
+def test_interval_scheduler():
+    scheduler = IntervalScheduler()
+    runs = {"fast": 0, "slow": 0}
+
+    def count(name):
+        runs[name] += 1
+
+    scheduler.start()
+    fast_job = scheduler.add_job(count, 0.02, kwargs={"name": "fast"})
+    scheduler.add_job(count, 10, kwargs={"name": "slow"})
+    time.sleep(0.2)
+
+    assert runs["fast"] >= 3
+    assert runs["slow"] == 0
+    assert len(scheduler.get_jobs()) == 2
+
+    fast_job.remove()
+    # A run already in progress when the job was removed still finishes.
+    time.sleep(0.05)
+    fast_runs = runs["fast"]
+    time.sleep(0.1)
+    assert runs["fast"] == fast_runs
+    assert len(scheduler.get_jobs()) == 1
+
+    scheduler.shutdown()
+    assert not scheduler.running
+    assert not any(
+        thread.name == "UnleashScheduler" for thread in threading.enumerate()
+    )
+
+
+def test_interval_scheduler_failing_job():
+    scheduler = IntervalScheduler()
+    runs = []
+
+    def fail():
+        runs.append(None)
+        raise ValueError("Job failed")
+
+    scheduler.start()
+    scheduler.add_job(fail, 0.02)
+    time.sleep(0.15)
+    scheduler.shutdown()
+
+    # A failing job keeps being run.
+    assert len(runs) >= 2
+
+
+def test_interval_scheduler_jitter():
+    scheduler = IntervalScheduler()
+    job = scheduler.add_job(print, 10, jitter=5)
+
+    for _ in range(100):
+        assert 10 <= job.next_run(0) <= 15
@@ -0,0 +1,90 @@
+import pickle
+
+import pytest
+
+from tests.utilities.mocks import MOCK_ALL_FEATURES
+from tests.utilities.mocks.mock_features import MOCK_FEATURES_WITH_SEGMENTS_RESPONSE
+from UnleashClient.snapshot import ProvisioningSnapshot, SharedSnapshot, write_snapshot
+
+
+def test_snapshot(tmpdir):
+    path = tmpdir.join("features.snapshot")
+    write_snapshot(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE, path)
+    snapshot = ProvisioningSnapshot(path)
+
+    assert list(snapshot) == [
+        feature["name"] for feature in MOCK_FEATURES_WITH_SEGMENTS_RESPONSE["features"]
+    ]
+    assert "Test" in snapshot
+    assert (
+        snapshot.feature("Test") == MOCK_FEATURES_WITH_SEGMENTS_RESPONSE["features"][0]
+    )
+    assert (
+        snapshot.metadata["segments"]
+        == MOCK_FEATURES_WITH_SEGMENTS_RESPONSE["segments"]
+    )
+    assert snapshot.to_dict() == MOCK_FEATURES_WITH_SEGMENTS_RESPONSE
+    with pytest.raises(KeyError):
+        snapshot.feature("Missing")
+
+    snapshot.close()
+
+
+def test_snapshot_fingerprint(tmpdir):
+    write_snapshot(MOCK_ALL_FEATURES, tmpdir.join("first.snapshot"))
+    write_snapshot(MOCK_ALL_FEATURES, tmpdir.join("second.snapshot"))
+    write_snapshot(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE, tmpdir.join("other.snapshot"))
+
+    fingerprint = ProvisioningSnapshot(tmpdir.join("first.snapshot")).fingerprint
+    assert (
+        ProvisioningSnapshot(tmpdir.join("second.snapshot")).fingerprint == fingerprint
+    )
+    assert (
+        ProvisioningSnapshot(tmpdir.join("other.snapshot")).fingerprint != fingerprint
+    )
+
+
+def test_snapshot_invalid(tmpdir):
+    path = tmpdir.join("features.json")
+
+    path.write("")
+    with pytest.raises(ValueError):
+        ProvisioningSnapshot(path)
+
+    path.write('{"version": 1, "features": []}')
+    with pytest.raises(ValueError):
+        ProvisioningSnapshot(path)
+
+
+def test_snapshot_pickle(tmpdir):
+    path = tmpdir.join("features.snapshot")
+    write_snapshot(MOCK_ALL_FEATURES, path)
+    pickled = pickle.dumps(ProvisioningSnapshot(path))
+
+    assert pickle.loads(pickled).to_dict() == MOCK_ALL_FEATURES
+
+    # A snapshot file that's gone is loaded as a missing value.
+    path.remove()
+    assert pickle.loads(pickled) is None
+
+
+def test_shared_snapshot(tmpdir):
+    path = tmpdir.join("features.snapshot")
+    publisher = SharedSnapshot(path)
+    subscriber = SharedSnapshot(path)
+
+    assert subscriber.generation is None
+    assert subscriber.open() is None
+
+    assert publisher.publish(MOCK_ALL_FEATURES) == 1
+    assert subscriber.generation == 1
+    assert subscriber.open().to_dict() == MOCK_ALL_FEATURES
+
+    assert publisher.publish(MOCK_FEATURES_WITH_SEGMENTS_RESPONSE) == 2
+    assert subscriber.generation == 2
+    assert subscriber.open().to_dict() == MOCK_FEATURES_WITH_SEGMENTS_RESPONSE
+
+    # A restarted publisher carries on from the last generation.
+    publisher.close()
+    assert SharedSnapshot(path).publish(MOCK_ALL_FEATURES) == 3
+    assert subscriber.generation == 3
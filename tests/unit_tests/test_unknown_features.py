@@ -0,0 +1,41 @@
+from UnleashClient.features import unknown
+from UnleashClient.features.unknown import UnknownFeatures
+
+
+def test_unknown_features_placeholder():
+    unknown_features = UnknownFeatures()
+
+    feature = unknown_features.get("Unknown")
+
+    assert feature.only_for_metrics
+    assert not feature.is_enabled({})
+    assert unknown_features.get("Unknown") is feature
+    assert feature.no_count == 1
+
+
+def test_unknown_features_lru_eviction():
+    unknown_features = UnknownFeatures(max_size=2)
+
+    unknown_features.get("First")
+    unknown_features.get("Second")
+    unknown_features.get("First")
+    unknown_features.get("Third")
+
+    assert len(unknown_features) == 2
+    assert "First" in unknown_features
+    assert "Second" not in unknown_features
+    assert [x.name for x in unknown_features.values()] == ["First", "Third"]
+
+
+def test_unknown_features_ttl_eviction(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(unknown.time, "monotonic", lambda: now)
+    unknown_features = UnknownFeatures(ttl=60)
+
+    unknown_features.get("First")
+    now += 30
+    unknown_features.get("Second")
+    now += 31
+
+    assert [x.name for x in unknown_features.values()] == ["Second"]
+    assert "First" not in unknown_features
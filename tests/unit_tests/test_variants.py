@@ -92,3 +92,35 @@ def test_variation_novariants():
     variant = variations.get_variant({})
     assert variant
     assert variant["name"] == "disabled"
+
+
+def test_variation_precomputed_selection(variations):
+    assert variations.total_weight == 100
+    assert variations.cumulative_weights == [34, 67, 100]
+    assert variations.stickiness_selector == "default"
+
+
+def test_variation_last_override_wins():
+    variants = [
+        {
+            "name": "VarA",
+            "weight": 50,
+            "overrides": [{"contextName": "userId", "values": ["1"]}],
+        },
+        {
+            "name": "VarB",
+            "weight": 50,
+            "overrides": [{"contextName": "userId", "values": ["1", "2"]}],
+        },
+    ]
+    variations = Variants(variants, "TestFeature")
+
+    assert variations.get_variant({"userId": "1"})["name"] == "VarB"
+    assert variations.get_variant({"userId": "2"})["name"] == "VarB"
+
+
+def test_variation_result_is_a_copy(variations):
+    variant = variations.get_variant({"userId": "2"})
+    variant["payload"]["value"] = "mutated"
+
+    assert variations.get_variant({"userId": "2"})["payload"]["value"] != "mutated"